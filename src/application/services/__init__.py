@@ -1,2 +1,5 @@
 """Application services package."""
 from .matching_service import MatchingService
+from .batch_runner import AdaptiveConcurrencyController, BatchRunner
+from .stage_pipeline import StagePipeline
+from .strategy_advisor import StrategyAdvisor
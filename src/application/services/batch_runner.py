@@ -0,0 +1,275 @@
+# src/application/services/batch_runner.py
+"""Batch execution of study matching: adaptive concurrency and deferred retries."""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from loguru import logger
+
+from src.domain.enums.search_status import SearchStatus
+from src.domain.models.search_result import SearchResult
+from src.domain.models.study import Study
+from src.utils.deadline import Deadline
+from src.utils.metrics import RunMetrics, percentile
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD limit on concurrently running studies.
+
+    Each study issues its searches one after another, so the limit bounds the
+    number of in-flight OpenAlex requests. The limit grows by one after each
+    ``limit`` healthy responses (one "round trip" of the whole window) and is
+    multiplied by ``decrease_factor`` on a 429, 5xx or connection error, or
+    when the windowed p95 latency rises above ``latency_tolerance`` times the
+    best p95 seen so far. At most one decrease happens per window, so a burst
+    of errors from requests sent at the old limit only counts once.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: int = 50,
+        metrics: Optional[RunMetrics] = None,
+    ):
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self._limit = min(max(initial, self.min_limit), self.max_limit)
+        self._successes = 0
+        self._since_decrease = self._limit  # Allow an immediate first decrease
+        self._latencies: List[float] = []
+        self._baseline_p95: Optional[float] = None
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def on_request(self, status: int, latency: Optional[float]) -> None:
+        """Feed one HTTP attempt (see ``RunMetrics.record_request``)."""
+        with self._lock:
+            self._since_decrease += 1
+            if status == 0 or status == 429 or status >= 500:
+                self._decrease(f"HTTP {status or 'connection error'}")
+                return
+            if latency is not None and self._latency_degraded(latency):
+                self._decrease("rising p95 latency")
+                return
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < self.max_limit:
+                self._successes = 0
+                self._limit += 1
+                self._publish()
+
+    def _latency_degraded(self, latency: float) -> bool:
+        self._latencies.append(latency)
+        if len(self._latencies) < self.window:
+            return False
+        p95 = percentile(self._latencies, 0.95)
+        self._latencies = []
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+            return False
+        return p95 > self._baseline_p95 * self.latency_tolerance
+
+    def _decrease(self, reason: str) -> None:
+        if self._since_decrease < self._limit:
+            return
+        new_limit = max(int(self._limit * self.decrease_factor), self.min_limit)
+        self._since_decrease = 0
+        self._successes = 0
+        if new_limit != self._limit:
+            logger.info(f"Concurrency {self._limit} -> {new_limit} ({reason})")
+            self._limit = new_limit
+            self._publish()
+
+    def _publish(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set_concurrency(self._limit)
+
+
+class BatchRunner:
+    """
+    Runs ``match_fn`` over studies, preserving input order.
+
+    With a controller, studies run on a thread pool with at most
+    ``controller.limit`` in flight; without one they run one by one in the
+    calling thread. Studies that come back DEFERRED (a transient API failure)
+    go into a delayed retry queue with exponential backoff. The queue is
+    drained at the tail of the run, after the fresh studies, so healthy work
+    keeps flowing during an outage. A study still deferred after
+    ``max_attempts`` tries is finalised as FAILED. Studies rejected by an open
+    circuit breaker wait at least until it may close, so a long outage costs
+    roughly ``max_attempts`` reset periods rather than a call per study.
+    A study whose retry would fall after the run ``deadline`` ends as TIMEOUT
+    instead of being queued.
+
+    With a ``cost`` estimate, fresh studies start cheapest first (shortest job
+    first), so quick results arrive early while the costly studies fill the
+    remaining slots at the tail. ``on_result`` is called with each final
+    result as soon as it is known, in completion order.
+    """
+
+    def __init__(
+        self,
+        match_fn: Callable[[Study], SearchResult],
+        controller: Optional[AdaptiveConcurrencyController] = None,
+        metrics: Optional[RunMetrics] = None,
+        max_attempts: int = 3,
+        retry_backoff: float = 5.0,
+        deadline: Optional[Deadline] = None,
+        cost: Optional[Callable[[Study], float]] = None,
+        on_result: Optional[Callable[[SearchResult], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.match_fn = match_fn
+        self.controller = controller
+        self.metrics = metrics
+        self.max_attempts = max(max_attempts, 1)
+        self.retry_backoff = retry_backoff
+        self.deadline = deadline
+        self.cost = cost
+        self.on_result = on_result
+        self.clock = clock
+        self._slots = threading.Condition()
+        self._in_flight = 0
+        # Heap of (ready_at, sequence, index, attempt)
+        self._deferred: List[Tuple[float, int, int, int]] = []
+        self._sequence = itertools.count()
+        self._results: List[Optional[SearchResult]] = []
+
+    def run(
+        self, studies: List[Study], first_results: Optional[List[SearchResult]] = None
+    ) -> List[SearchResult]:
+        """
+        Match ``studies``. ``first_results`` are first-attempt results produced
+        elsewhere (e.g. by StagePipeline); only their deferred studies are run again.
+        """
+        self._results = [None] * len(studies)
+        self._deferred = []
+        order = range(len(studies))
+        if self.cost is not None:
+            order = sorted(order, key=lambda i: self.cost(studies[i]))
+        fresh = deque(order)
+        if first_results is not None:
+            fresh.clear()
+            for index, result in enumerate(first_results):
+                if self._complete(index, 1, result):
+                    self._emit(result)
+        if self.controller is None:
+            self._run_sequential(studies, fresh)
+        else:
+            self._run_concurrent(studies, fresh)
+        return self._results
+
+    def _run_sequential(self, studies: List[Study], fresh: deque) -> None:
+        for index in fresh:
+            result = self.match_fn(studies[index])
+            if self._complete(index, 1, result):
+                self._emit(result)
+        while self._deferred:
+            ready_at, _, index, attempt = heapq.heappop(self._deferred)
+            delay = ready_at - self.clock()
+            if delay > 0:
+                time.sleep(delay)
+            result = self.match_fn(studies[index])
+            if self._complete(index, attempt, result):
+                self._emit(result)
+
+    def _run_concurrent(self, studies: List[Study], fresh: deque) -> None:
+        futures: List[Future] = []
+        with ThreadPoolExecutor(
+            max_workers=self.controller.max_limit, thread_name_prefix="match"
+        ) as pool:
+            with self._slots:
+                while fresh or self._deferred or self._in_flight:
+                    job = self._next_job(fresh)
+                    if job is None:
+                        # Re-check periodically: the limit can grow without a slot freeing up
+                        self._slots.wait(timeout=self._wait_timeout(fresh))
+                        continue
+                    index, attempt = job
+                    self._in_flight += 1
+                    futures.append(pool.submit(self._run_one, studies[index], index, attempt))
+        for future in futures:
+            future.result()  # Re-raise anything match_fn raised
+
+    def _next_job(self, fresh: deque) -> Optional[Tuple[int, int]]:
+        if self._in_flight >= self.controller.limit:
+            return None
+        if fresh:
+            return fresh.popleft(), 1
+        if self._deferred and self._deferred[0][0] <= self.clock():
+            _, _, index, attempt = heapq.heappop(self._deferred)
+            return index, attempt
+        return None
+
+    def _wait_timeout(self, fresh: deque) -> float:
+        if fresh or not self._deferred or self._in_flight >= self.controller.limit:
+            return 0.05
+        return min(max(self._deferred[0][0] - self.clock(), 0.0), 0.05)
+
+    def _run_one(self, study: Study, index: int, attempt: int) -> None:
+        result = None
+        final = False
+        try:
+            result = self.match_fn(study)
+        finally:
+            with self._slots:
+                if result is not None:
+                    final = self._complete(index, attempt, result)
+                self._in_flight -= 1
+                self._slots.notify()
+        if final:
+            self._emit(result)
+
+    def _emit(self, result: SearchResult) -> None:
+        if self.on_result is not None:
+            self.on_result(result)
+
+    @staticmethod
+    def _parked_for(result: SearchResult) -> Optional[float]:
+        attempts = result.search_attempts or []
+        return attempts[-1].get("retry_after") if attempts else None
+
+    def _complete(self, index: int, attempt: int, result: SearchResult) -> bool:
+        """Store a result, or queue the study again if it was deferred. True if final."""
+        self._results[index] = result
+        if result.status == SearchStatus.DEFERRED:
+            if attempt < self.max_attempts:
+                delay = self.retry_backoff * (2 ** (attempt - 1))
+                # Rejected by an open circuit breaker: park until it may close
+                delay = max(delay, self._parked_for(result) or 0.0)
+                ready_at = self.clock() + delay
+                if self.deadline is not None and ready_at >= self.deadline.expires_at:
+                    logger.warning(f"Study {result.study_id}: retry would miss the run deadline")
+                    result.status = SearchStatus.TIMEOUT
+                    self._finish(result)
+                    return True
+                heapq.heappush(self._deferred, (ready_at, next(self._sequence), index, attempt + 1))
+                logger.info(f"Study {result.study_id}: deferred (attempt {attempt}/{self.max_attempts})")
+                if self.metrics is not None:
+                    self.metrics.record_deferral()
+                return False
+            logger.warning(f"Study {result.study_id}: still failing after {attempt} attempts")
+            result.status = SearchStatus.FAILED
+        self._finish(result)
+        return True
+
+    def _finish(self, result: SearchResult) -> None:
+        if self.metrics is not None:
+            self.metrics.record_study(result.status)
@@ -1,19 +1,37 @@
 # src/application/services/matching_service.py
 """Matching service for coordinating the study-to-publication matching process."""
 
+import functools
+import hashlib
 import importlib
-from typing import Any, Dict, List, Tuple, Type
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
 
+import orjson
 from loguru import logger
 
 from src.domain.enums.search_status import SearchStatus
 from src.domain.enums.search_strategy_type import SearchStrategyType
+from src.domain.exceptions import DeadlineExceededError, TransientRepositoryError
 from src.domain.interfaces.publication_repository import PublicationRepository
 from src.domain.interfaces.search_strategy import SearchStrategy
 from src.domain.models.config import Config
+from src.domain.models.reference import Reference
 from src.domain.models.search_result import SearchResult
 from src.domain.models.study import Study
 from src.infrastructure.repositories.openalex_repository import OpenAlexRepository
+from src.infrastructure.repositories.result_store import ResultStore
+from src.utils.deadline import Deadline, current_deadline, deadline_scope
+from src.utils.metrics import RequestListener, RunMetrics
+from src.utils.profiler import RunProfiler
+from src.utils.report_formatter import ReportFormatter
+from src.utils.text_normalizer import TextNormalizer
+from .batch_runner import AdaptiveConcurrencyController, BatchRunner
+from .stage_pipeline import StagePipeline
+from .strategy_advisor import StrategyAdvisor
 # Import new/updated strategies
 from src.domain.strategies.identifier_strategy import IdentifierStrategy
 from src.domain.strategies.title_authors_year_strategy import TitleAuthorsYearStrategy
@@ -22,17 +40,55 @@ from src.domain.strategies.title_year_strategy import TitleYearStrategy
 from src.domain.strategies.title_only_strategy import TitleOnlyStrategy
 
 
+class _RunState:
+    """
+    State belonging to one ``match_studies`` call.
+
+    Kept off the service and passed down explicitly, so concurrent runs on
+    one service (e.g. batches of the match server) do not share deadlines,
+    strategy win rates, study time or request feedback.
+    """
+
+    def __init__(
+        self,
+        deadline: Optional[Deadline],
+        advisor: Optional[StrategyAdvisor],
+        on_request: Optional[RequestListener] = None,
+    ):
+        self.deadline = deadline
+        # Per-run strategy win rates (adaptive_strategies)
+        self.advisor = advisor
+        # Fed this run's HTTP attempts only (the adaptive controller)
+        self.on_request = on_request
+        # Breadth-first runs: seconds each study has spent in its strategies so far
+        self.study_time: Dict[str, float] = {}
+        self.study_time_lock = threading.Lock()
+
+
 class MatchingService:
     """
     Service that coordinates the matching of studies to publications.
     Initializes strategies and repository, and handles the matching process.
+    Several ``match_studies`` calls may run on one service at once.
     """
 
-    def __init__(self, config: Config):
-        """Initialize the matching service with configuration."""
-        self.repository: PublicationRepository = OpenAlexRepository(config)
+    def __init__(self, config: Config, concurrent_runs: int = 1):
+        """
+        Initialize the matching service with configuration.
+
+        ``concurrent_runs`` is how many ``match_studies`` calls are expected
+        to run at once; the repository's connection pool is sized for it.
+        """
+        self.metrics = RunMetrics()
+        self.repository: PublicationRepository = OpenAlexRepository(
+            config, metrics=self.metrics, concurrent_runs=concurrent_runs
+        )
         self.strategies: List[SearchStrategy] = self._initialize_strategies(config)
         self.config = config
+        self.profiler = RunProfiler(config)
+        self.result_store: Optional[ResultStore] = (
+            ResultStore(Path(config.results_db)) if config.results_db else None
+        )
 
     def _initialize_strategies(self, config: Config) -> List[SearchStrategy]:
         """Initialize all search strategies based on configuration."""
@@ -77,14 +133,278 @@ class MatchingService:
         return strategies
 
 
+    def match_studies(
+        self,
+        studies: List[Study],
+        on_result: Optional[Callable[[SearchResult], None]] = None,
+        previous: Optional[Iterable[SearchResult]] = None,
+        review_id: Optional[str] = None,
+    ) -> List[SearchResult]:
+        """
+        Match a batch of studies, preserving input order.
+
+        With ``previous`` results (e.g. from the last run of the same review),
+        a study whose ``reference_hash`` is unchanged keeps its previous result
+        and is not searched again. NOT_FOUND and REJECTED results are searched
+        again once older than ``rematch_not_found_after``; DEFERRED, FAILED and
+        TIMEOUT results always are. Reused results are passed to ``on_result``
+        before matching starts.
+
+        With ``results_db`` configured and a ``review_id``, every final result
+        is also written to the ResultStore, in batches, as it arrives.
+
+        With ``schedule`` set to shortest_first, studies start in order of
+        ``estimate_cost`` so cheap ones finish early; ``on_result`` receives
+        each final result as soon as it is known.
+
+        ``concurrency_mode`` sets how many studies run at once: one at a time
+        (sequential), a fixed pool of ``concurrency`` threads (threads), or a
+        pool tuned from API feedback (adaptive). Log records emitted while a
+        study runs carry its id as ``extra["study_id"]``.
+
+        Deferred studies are retried at the end of the run (see BatchRunner).
+        With ``run_timeout`` set, studies still unfinished when it expires end
+        as TIMEOUT. ``execution_mode`` picks depth-first (each study runs the
+        whole cascade) or breadth-first (each strategy runs as a stage over
+        all unmatched studies, see StagePipeline); deferred retries are
+        depth-first either way. With ``adaptive_strategies``, strategies that
+        rarely win in this run are skipped (see StrategyAdvisor).
+        """
+        if self.result_store is not None and review_id is not None:
+            on_result = self._storing(review_id, on_result)
+        with self.profiler.profile("run", scope="run"):
+            results: List[Optional[SearchResult]] = [None] * len(studies)
+            todo = list(range(len(studies)))
+            if previous is not None:
+                todo = self._reuse_previous(studies, previous, results)
+                if on_result is not None:
+                    for result in results:
+                        if result is not None:
+                            on_result(result)
+            matched = self._run_batch([studies[i] for i in todo], on_result)
+            for index, result in zip(todo, matched):
+                results[index] = result
+            if self.result_store is not None:
+                self.result_store.flush()
+            return results
+
+    def report(self, results: List[SearchResult]) -> ReportFormatter:
+        """
+        Terminal report for ``results``, with this service's run metrics.
+
+        Processing time is counted from the start of the latest run; call
+        ``render()`` on the returned formatter to print it.
+        """
+        formatter = ReportFormatter(self.config)
+        formatter.add_results(results)
+        formatter.add_metrics(self.metrics.snapshot())
+        formatter.set_start_time(self.metrics.started_at)
+        return formatter
+
+    def close(self) -> None:
+        """Flush and close the result store and release the repository's connections."""
+        if self.result_store is not None:
+            self.result_store.close()
+        self.repository.close()
+
+    def _storing(
+        self, review_id: str, on_result: Optional[Callable[[SearchResult], None]]
+    ) -> Callable[[SearchResult], None]:
+        store = self.result_store.writer(review_id)
+
+        def callback(result: SearchResult) -> None:
+            store(result)
+            if on_result is not None:
+                on_result(result)
+
+        return callback
+
+    def _run_batch(
+        self, studies: List[Study], on_result: Optional[Callable[[SearchResult], None]]
+    ) -> List[SearchResult]:
+        advisor = None
+        if self.config.adaptive_strategies:
+            advisor = StrategyAdvisor(
+                floor=self.config.strategy_skip_floor,
+                min_samples=self.config.strategy_min_samples,
+            )
+        controller = None
+        on_request = None
+        if self.config.concurrency_mode == "adaptive":
+            controller = AdaptiveConcurrencyController(
+                initial=self.config.concurrency,
+                max_limit=self.config.max_concurrency,
+                metrics=self.metrics,
+            )
+            on_request = controller.on_request
+        elif self.config.concurrency_mode == "threads":
+            # Fixed pool: a controller that is never fed cannot move its limit
+            workers = max(self.config.concurrency, 1)
+            controller = AdaptiveConcurrencyController(
+                initial=workers, min_limit=workers, max_limit=workers, metrics=self.metrics
+            )
+        else:
+            self.metrics.set_concurrency(1)
+        run = _RunState(Deadline.after(self.config.run_timeout), advisor, on_request)
+        runner = BatchRunner(
+            functools.partial(self._match_in_run, run),
+            controller,
+            self.metrics,
+            max_attempts=self.config.deferred_max_attempts,
+            retry_backoff=self.config.deferred_retry_backoff,
+            deadline=run.deadline,
+            cost=self.estimate_cost if self.config.schedule == "shortest_first" else None,
+            on_result=on_result,
+        )
+        self.metrics.begin_run()
+        try:
+            if self.config.execution_mode == "breadth_first":
+                return runner.run(studies, first_results=self._run_stages(run, studies, controller))
+            return runner.run(studies)
+        finally:
+            self.metrics.end_run()
+
+    def reference_hash(self, reference: Reference) -> str:
+        """
+        Stable hash of a reference's normalized fields and the match settings.
+
+        Formatting-only edits (case, punctuation, spacing) keep the hash;
+        changing the thresholds, the missing-year allowance or the enabled
+        strategies changes it for every reference.
+        """
+        normalize = TextNormalizer.normalize_text
+        payload = {
+            "title": normalize(reference.title),
+            "authors": [normalize(author) for author in reference.authors or []],
+            "year": reference.year,
+            "journal": normalize(reference.journal),
+            "doi": (reference.doi or "").strip().lower(),
+            "pmid": (reference.pmid or "").strip(),
+            "settings": [
+                self.config.title_similarity_threshold,
+                self.config.author_similarity_threshold,
+                self.config.allow_missing_year,
+                [strategy.name for strategy in self.strategies],
+            ],
+        }
+        return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def _reuse_previous(
+        self,
+        studies: List[Study],
+        previous: Iterable[SearchResult],
+        results: List[Optional[SearchResult]],
+    ) -> List[int]:
+        """Fill ``results`` with reusable previous results; return the indexes left to match."""
+        by_id = {result.study_id: result for result in previous}
+        now = datetime.now(timezone.utc)
+        todo = []
+        for index, study in enumerate(studies):
+            old = by_id.get(study.id)
+            if old is not None and self._reusable(old, self.reference_hash(study.reference), now):
+                results[index] = old
+            else:
+                todo.append(index)
+        logger.info(f"Incremental run: reusing {len(studies) - len(todo)} results, matching {len(todo)}")
+        return todo
+
+    def _reusable(self, old: SearchResult, reference_hash: str, now: datetime) -> bool:
+        if old.reference_hash != reference_hash:
+            return False
+        if old.status in (SearchStatus.FOUND, SearchStatus.SKIPPED):
+            return True
+        if old.status in (SearchStatus.NOT_FOUND, SearchStatus.REJECTED):
+            max_age = self.config.rematch_not_found_after
+            return not max_age or (
+                old.matched_at is not None and (now - old.matched_at).total_seconds() < max_age
+            )
+        return False
+
+    def estimate_cost(self, study: Study) -> int:
+        """
+        Rough number of searches a study needs before it can settle.
+
+        Studies without minimal data are skipped without a search (0); a DOI or
+        PMID lookup usually settles a study with one search; otherwise each
+        supported title strategy may run.
+        """
+        reference = study.reference
+        if not reference.has_minimal_data(allow_missing_year=self.config.allow_missing_year):
+            return 0
+        cost = 0
+        for strategy in self.strategies:
+            if strategy.supported(reference):
+                cost += 1
+                if strategy.name == SearchStrategyType.IDENTIFIER.value:
+                    break
+        return cost
+
+    def _run_stages(
+        self,
+        run: _RunState,
+        studies: List[Study],
+        controller: Optional[AdaptiveConcurrencyController],
+    ) -> List[SearchResult]:
+        pipeline = StagePipeline(
+            self.strategies,
+            self._new_result,
+            functools.partial(self._stage_attempt, run),
+            self._conclude,
+            controller,
+        )
+        return pipeline.run(studies)
+
+    def _stage_attempt(
+        self, run: _RunState, study: Study, result: SearchResult, strategy: SearchStrategy
+    ) -> bool:
+        """One breadth-first step; the study budget counts only time spent on this study."""
+        study_deadline = None
+        if self.config.study_timeout:
+            spent = run.study_time.get(study.id, 0.0)
+            study_deadline = Deadline(time.monotonic() + self.config.study_timeout - spent)
+        start = time.monotonic()
+        try:
+            with logger.contextualize(study_id=study.id), deadline_scope(study_deadline, run.deadline):
+                with self.metrics.listening(run.on_request):
+                    return self._try_strategy(run, study, result, strategy)
+        finally:
+            with run.study_time_lock:
+                run.study_time[study.id] = run.study_time.get(study.id, 0.0) + time.monotonic() - start
+
     def match_study(self, study: Study) -> SearchResult:
         """Match a study to a publication using available strategies."""
+        return self._match_in_run(_RunState(None, None), study)
+
+    def _match_in_run(self, run: _RunState, study: Study) -> SearchResult:
+        # Entered here rather than in match_studies: context variables do not
+        # follow studies into BatchRunner's worker threads
+        study_deadline = Deadline.after(self.config.study_timeout)
+        with logger.contextualize(study_id=study.id):
+            with self.profiler.profile(f"study-{study.id}", scope="study"):
+                with deadline_scope(study_deadline, run.deadline), self.metrics.listening(run.on_request):
+                    return self._match_study(run, study)
+
+    def _match_study(self, run: _RunState, study: Study) -> SearchResult:
+        """Run the strategy cascade for a single study."""
+        result = self._new_result(study)
+        if result.status == SearchStatus.SKIPPED:
+            return result
+        for strategy in self.strategies:
+            if self._try_strategy(run, study, result, strategy):
+                return result
+        self._conclude(study, result)
+        return result
+
+    def _new_result(self, study: Study) -> SearchResult:
+        """Create the result for a study; SKIPPED if it lacks the data to search."""
         result = SearchResult(
             study_id=study.id,
             study_type=study.type,
             status=SearchStatus.NOT_FOUND, # Default
             search_attempts=[],
             original_reference=study.reference.to_dict(), # Zapisz oryginał w razie potrzeby
+            reference_hash=self.reference_hash(study.reference),
+            matched_at=datetime.now(timezone.utc),
         )
         reference = study.reference
 
@@ -98,75 +418,129 @@ class MatchingService:
         if not reference.has_minimal_data(allow_missing_year=self.config.allow_missing_year):
             logger.warning(f"Study {study.id}: Insufficient data. Skipping search.")
             result.status = SearchStatus.SKIPPED
-            # Zapisz oryginalną referencję, nawet jeśli pominięto
-            result.original_reference = reference.to_dict()
-            return result
-
-        found_match = False
-        final_rejection_reason = None # Track if any attempt was rejected
-
-        for strategy in self.strategies:
-            if found_match: # Skip remaining strategies if match found
-                break
-
-            if strategy.supported(reference):
-                logger.info(f"Study {study.id}: Trying strategy '{strategy.name}'")
-                publications: List[Dict[str, Any]] = []
-                metadata: Dict[str, Any] = {}
-                search_attempt: Dict[str, Any] = {"strategy": strategy.name} # Init attempt dict
-
-                try:
-                    # Execute strategy
-                    publications, metadata = strategy.execute(reference)
-
-                    # Update search_attempt with details from metadata
-                    search_attempt["query_type"] = metadata.get("query_type", "unknown")
-                    search_attempt["search_term"] = metadata.get("search_term", "")
-                    if "error" in metadata:
-                        search_attempt["error"] = metadata["error"]
-                        # Check if the error indicates a rejection due to similarity
-                        if "similarity below threshold" in metadata["error"]:
-                            final_rejection_reason = metadata["error"] # Store rejection reason
-
-                    result.search_attempts.append(search_attempt)
-
-                    if publications:
-                        # We found a match via this strategy
-                        best_match = publications[0] # Strategies should return ranked results
-                        logger.info(f"Study {study.id}: Match FOUND via strategy '{strategy.name}'")
-                        result.status = SearchStatus.FOUND
-                        result.strategy = strategy.name
-                        self._extract_publication_data(result, best_match)
-                        # Clear debug info if present
-                        if result.search_details and "_debug" in result.search_details:
-                             del result.search_details["_debug"]
-                        if best_match and "_debug" in best_match: # Also clear from the source dict if needed elsewhere
-                            del best_match["_debug"]
-
-                        found_match = True # Set flag to stop trying more strategies
-
-                except Exception as e:
-                    # Catch unexpected errors during strategy execution
-                    error_msg = f"Strategy execution error: {str(e)}"
-                    logger.error(f"Study {study.id}: Error during strategy '{strategy.name}': {e}", exc_info=True)
-                    search_attempt["query_type"] = search_attempt.get("query_type", "execution_error")
-                    search_attempt["search_term"] = search_attempt.get("search_term", reference.title or "N/A")
-                    search_attempt["error"] = error_msg
-                    result.search_attempts.append(search_attempt)
-                    # Continue to next strategy
-            else:
-                logger.debug(f"Study {study.id}: Strategy '{strategy.name}' not supported for this reference.")
+        return result
 
-        # Determine final status if no match was found
-        if not found_match:
-            if final_rejection_reason:
-                result.status = SearchStatus.REJECTED
-                logger.info(f"Study {study.id}: Final status REJECTED (Reason: {final_rejection_reason})")
-            else:
-                result.status = SearchStatus.NOT_FOUND
-                logger.info(f"Study {study.id}: Final status NOT_FOUND after trying all supported strategies.")
+    def _try_strategy(
+        self, run: _RunState, study: Study, result: SearchResult, strategy: SearchStrategy
+    ) -> bool:
+        """
+        Run one strategy for a study and record the attempt.
 
-        return result
+        Returns True once the study is settled (FOUND, DEFERRED or TIMEOUT) and
+        no further strategies should run.
+        """
+        reference = study.reference
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            logger.warning(f"Study {study.id}: Time budget exhausted before strategy '{strategy.name}'")
+            result.status = SearchStatus.TIMEOUT
+            return True
+
+        if not strategy.supported(reference):
+            logger.debug(f"Study {study.id}: Strategy '{strategy.name}' not supported for this reference.")
+            return False
+
+        decision, reason = "run", None
+        if run.advisor is not None:
+            decision, reason = run.advisor.decide(strategy.name)
+        if decision == "skip":
+            logger.info(f"Study {study.id}: Skipping strategy '{strategy.name}': {reason}")
+            result.search_attempts.append({
+                "strategy": strategy.name,
+                "query_type": "skipped",
+                "search_term": "",
+                "decision": "skipped",
+                "reason": reason,
+            })
+            return False
+
+        logger.info(f"Study {study.id}: Trying strategy '{strategy.name}'")
+        search_attempt: Dict[str, Any] = {"strategy": strategy.name} # Init attempt dict
+        if decision == "explore":
+            # Run despite a low win rate, to notice if it starts winning again
+            search_attempt.update(decision="explore", reason=reason)
+
+        start = time.monotonic()
+        try:
+            # Execute strategy
+            publications, metadata = strategy.execute(reference)
+            self._record_outcome(run, strategy, bool(publications), start)
+
+            # Update search_attempt with details from metadata
+            search_attempt["query_type"] = metadata.get("query_type", "unknown")
+            search_attempt["search_term"] = metadata.get("search_term", "")
+            if "error" in metadata:
+                search_attempt["error"] = metadata["error"]
+
+            result.search_attempts.append(search_attempt)
+
+            if publications:
+                # We found a match via this strategy
+                best_match = publications[0] # Strategies should return ranked results
+                logger.info(f"Study {study.id}: Match FOUND via strategy '{strategy.name}'")
+                result.status = SearchStatus.FOUND
+                result.strategy = strategy.name
+                self._extract_publication_data(result, best_match)
+                # Clear debug info if present
+                if result.search_details and "_debug" in result.search_details:
+                     del result.search_details["_debug"]
+                if best_match and "_debug" in best_match: # Also clear from the source dict if needed elsewhere
+                    del best_match["_debug"]
+                return True
+
+        except DeadlineExceededError as e:
+            logger.warning(f"Study {study.id}: Time budget exhausted in strategy '{strategy.name}': {e}")
+            search_attempt["query_type"] = search_attempt.get("query_type", "timeout")
+            search_attempt["search_term"] = search_attempt.get("search_term", reference.title or "N/A")
+            search_attempt["error"] = str(e)
+            result.search_attempts.append(search_attempt)
+            result.status = SearchStatus.TIMEOUT
+            return True
+
+        except TransientRepositoryError as e:
+            # The API is failing, not the reference: later strategies would hit
+            # the same outage and a NOT_FOUND would be false, so stop here
+            logger.warning(f"Study {study.id}: Transient API error in strategy '{strategy.name}', deferring: {e}")
+            search_attempt["query_type"] = search_attempt.get("query_type", "transient_error")
+            search_attempt["search_term"] = search_attempt.get("search_term", reference.title or "N/A")
+            search_attempt["error"] = f"Transient API error: {e}"
+            if getattr(e, "retry_after", None) is not None:
+                search_attempt["retry_after"] = e.retry_after # Circuit open: park until it may close
+            result.search_attempts.append(search_attempt)
+            result.status = SearchStatus.DEFERRED
+            return True
+
+        except Exception as e:
+            # Catch unexpected errors during strategy execution
+            self._record_outcome(run, strategy, False, start)
+            error_msg = f"Strategy execution error: {str(e)}"
+            logger.error(f"Study {study.id}: Error during strategy '{strategy.name}': {e}", exc_info=True)
+            search_attempt["query_type"] = search_attempt.get("query_type", "execution_error")
+            search_attempt["search_term"] = search_attempt.get("search_term", reference.title or "N/A")
+            search_attempt["error"] = error_msg
+            result.search_attempts.append(search_attempt)
+            # Continue to next strategy
+        return False
+
+    def _record_outcome(
+        self, run: _RunState, strategy: SearchStrategy, won: bool, start: float
+    ) -> None:
+        if run.advisor is not None:
+            run.advisor.record(strategy.name, won, time.monotonic() - start)
+
+    def _conclude(self, study: Study, result: SearchResult) -> None:
+        """Set the final status of a study no strategy matched: REJECTED or NOT_FOUND."""
+        # The last attempt rejected for low similarity, if any
+        final_rejection_reason = None
+        for attempt in result.search_attempts:
+            if "similarity below threshold" in attempt.get("error", ""):
+                final_rejection_reason = attempt["error"]
+        if final_rejection_reason:
+            result.status = SearchStatus.REJECTED
+            logger.info(f"Study {study.id}: Final status REJECTED (Reason: {final_rejection_reason})")
+        else:
+            result.status = SearchStatus.NOT_FOUND
+            logger.info(f"Study {study.id}: Final status NOT_FOUND after trying all supported strategies.")
 
     def _extract_publication_data(
         self, result: SearchResult, publication: Dict[str, Any]
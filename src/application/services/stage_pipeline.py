@@ -0,0 +1,73 @@
+# src/application/services/stage_pipeline.py
+"""Breadth-first matching: one strategy at a time across every pending study."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from loguru import logger
+
+from src.domain.enums.search_status import SearchStatus
+from src.domain.interfaces.search_strategy import SearchStrategy
+from src.domain.models.search_result import SearchResult
+from src.domain.models.study import Study
+from .batch_runner import AdaptiveConcurrencyController
+
+# (study, result so far, strategy) -> True once the study is settled
+AttemptFn = Callable[[Study, SearchResult, SearchStrategy], bool]
+
+
+class StagePipeline:
+    """
+    Runs the strategy cascade stage by stage instead of study by study.
+
+    Stage one runs the first strategy over every study, stage two runs the
+    second strategy over the studies still unmatched, and so on. Each study
+    still sees the strategies in cascade order, so its ``search_attempts`` are
+    the same as in a depth-first run. With a controller, a stage runs its
+    studies on a thread pool sized to ``controller.limit`` at stage start.
+    """
+
+    def __init__(
+        self,
+        strategies: List[SearchStrategy],
+        start: Callable[[Study], SearchResult],
+        attempt: AttemptFn,
+        conclude: Callable[[Study, SearchResult], None],
+        controller: Optional[AdaptiveConcurrencyController] = None,
+    ):
+        self.strategies = strategies
+        self.start = start
+        self.attempt = attempt
+        self.conclude = conclude
+        self.controller = controller
+
+    def run(self, studies: List[Study]) -> List[SearchResult]:
+        results = [self.start(study) for study in studies]
+        pending = [i for i, result in enumerate(results) if result.status != SearchStatus.SKIPPED]
+        for strategy in self.strategies:
+            if not pending:
+                break
+            settled = self._run_stage(strategy, studies, results, pending)
+            pending = [i for i, done in zip(pending, settled) if not done]
+        for index in pending:
+            self.conclude(studies[index], results[index])
+        return results
+
+    def _run_stage(
+        self,
+        strategy: SearchStrategy,
+        studies: List[Study],
+        results: List[SearchResult],
+        pending: List[int],
+    ) -> List[bool]:
+        logger.info(f"Stage '{strategy.name}': {len(pending)} pending studies")
+
+        def step(index: int) -> bool:
+            return self.attempt(studies[index], results[index], strategy)
+
+        if self.controller is None:
+            return [step(index) for index in pending]
+        with ThreadPoolExecutor(
+            max_workers=self.controller.limit, thread_name_prefix=f"stage-{strategy.name}"
+        ) as pool:
+            return list(pool.map(step, pending))
@@ -0,0 +1,91 @@
+# src/application/services/strategy_advisor.py
+"""Skips strategies that rarely win, based on what a run has seen so far."""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass
+class StrategyStats:
+    tried: int = 0
+    won: int = 0
+    seconds: float = 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.won / self.tried if self.tried else 0.0
+
+    @property
+    def mean_cost(self) -> float:
+        return self.seconds / self.tried if self.tried else 0.0
+
+
+class StrategyAdvisor:
+    """
+    Tracks each strategy's conditional win rate and cost within one run.
+
+    A strategy only runs when the earlier ones failed, so its win rate is
+    already conditional on its place in the cascade. Its expected value is
+    the win rate, scaled down when its attempts take longer than the average
+    attempt in the run. Once ``min_samples`` attempts are known, a strategy
+    whose value falls below ``floor`` is skipped, except for every
+    ``explore_every``-th decision, which still runs it so a strategy that
+    starts winning again is noticed.
+    """
+
+    def __init__(self, floor: float = 0.02, min_samples: int = 30, explore_every: int = 20):
+        self.floor = floor
+        self.min_samples = min_samples
+        self.explore_every = explore_every
+        self._lock = threading.Lock()
+        self._stats: Dict[str, StrategyStats] = {}
+        self._skips: Dict[str, int] = {}
+
+    def value(self, name: str) -> Optional[float]:
+        """Expected value of running a strategy, or None while still learning."""
+        with self._lock:
+            return self._value(name)
+
+    def decide(self, name: str) -> Tuple[str, Optional[str]]:
+        """
+        Whether to run a strategy: ("run" | "explore" | "skip", reason).
+
+        The reason is None for an ordinary run.
+        """
+        with self._lock:
+            value = self._value(name)
+            if value is None or value >= self.floor:
+                return "run", None
+            stats = self._stats[name]
+            reason = (
+                f"expected value {value:.3f} below floor {self.floor:.3f} "
+                f"(won {stats.won}/{stats.tried}, {stats.mean_cost:.2f}s per attempt)"
+            )
+            self._skips[name] = self._skips.get(name, 0) + 1
+            if self._skips[name] % self.explore_every == 0:
+                return "explore", reason
+            return "skip", reason
+
+    def record(self, name: str, won: bool, seconds: float) -> None:
+        """Record a completed attempt of a strategy."""
+        with self._lock:
+            stats = self._stats.setdefault(name, StrategyStats())
+            stats.tried += 1
+            stats.seconds += seconds
+            if won:
+                stats.won += 1
+
+    def stats(self) -> Dict[str, StrategyStats]:
+        with self._lock:
+            return {name: StrategyStats(s.tried, s.won, s.seconds) for name, s in self._stats.items()}
+
+    def _value(self, name: str) -> Optional[float]:
+        stats = self._stats.get(name)
+        if stats is None or stats.tried < self.min_samples:
+            return None
+        total_tried = sum(s.tried for s in self._stats.values())
+        mean_cost = sum(s.seconds for s in self._stats.values()) / total_tried
+        if stats.mean_cost <= mean_cost or stats.mean_cost == 0:
+            return stats.win_rate
+        return stats.win_rate * mean_cost / stats.mean_cost
@@ -11,6 +11,9 @@ class SearchStatus(str, Enum):
     NOT_FOUND = "not_found"
     REJECTED = "rejected"
     SKIPPED = "skipped"
+    DEFERRED = "deferred"  # Stopped by a transient API failure; safe to retry
+    FAILED = "failed"  # Still DEFERRED after the retry queue's last attempt
+    TIMEOUT = "timeout"  # Study or run deadline ran out; attempts so far are kept
 
     @classmethod
     def from_string(cls, value: str) -> "SearchStatus":
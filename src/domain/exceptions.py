@@ -0,0 +1,59 @@
+# src/domain/exceptions.py
+"""Exceptions raised by publication repositories."""
+
+from typing import Optional
+
+
+class RepositoryError(Exception):
+    """A publication repository call failed (as opposed to finding nothing)."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TransientRepositoryError(RepositoryError):
+    """
+    The call may succeed if repeated later: timeouts, connection errors,
+    rate limiting (429) and server errors (5xx) after retries ran out.
+    Strategies re-raise it so the cascade stops instead of querying an outage.
+    ``retry_after`` is the server's Retry-After (seconds), when it sent one.
+    """
+
+    def __init__(
+        self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None
+    ):
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(TransientRepositoryError):
+    """
+    The repository's circuit breaker is open and the call was not attempted.
+    ``retry_after`` is the time (seconds) until the breaker lets a probe through.
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(TransientRepositoryError):
+    """
+    The study or run time budget ran out before or during the call.
+    It is transient so strategies stop the cascade, but it says nothing about
+    the API's health and the circuit breaker ignores it.
+    """
+
+
+class PermanentRepositoryError(RepositoryError):
+    """The call will fail the same way again, e.g. a rejected query (4xx)."""
+
+
+def error_for_status(
+    status_code: int, message: str, retry_after: Optional[float] = None
+) -> RepositoryError:
+    """Classify an HTTP error status as transient or permanent."""
+    if status_code == 429 or status_code >= 500:
+        return TransientRepositoryError(message, status_code, retry_after)
+    return PermanentRepositoryError(message, status_code)
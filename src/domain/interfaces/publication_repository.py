@@ -1,10 +1,17 @@
 # src/domain/interfaces/publication_repository.py
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 class PublicationRepository(ABC):
-    """Interface for publication repositories."""
+    """
+    Interface for publication repositories.
+
+    Methods return ``None`` / ``[]`` only when nothing matched. Failed calls
+    raise ``TransientRepositoryError`` (worth retrying later; strategies
+    re-raise it so the cascade stops) or ``PermanentRepositoryError``.
+    Search methods return the first page of results unless ``page`` is given.
+    """
 
     @abstractmethod
     def get_by_doi(self, doi: str) -> Optional[Dict[str, Any]]:
@@ -18,26 +25,54 @@ class PublicationRepository(ABC):
 
     @abstractmethod
     def search_by_title_authors_year(
-        self, title: str, authors: List[str], year: int
+        self, title: str, authors: List[str], year: int, page: int = 1
     ) -> List[Dict[str, Any]]:
         """Search for publications by title, authors and year."""
         pass
 
     @abstractmethod
     def search_by_title_authors(
-        self, title: str, authors: List[str]
+        self, title: str, authors: List[str], page: int = 1
     ) -> List[Dict[str, Any]]:
         """Search for publications by title and authors."""
         pass
 
     @abstractmethod
-    def search_by_title_year(self, title: str, year: int) -> List[Dict[str, Any]]:
+    def search_by_title_year(
+        self, title: str, year: int, page: int = 1
+    ) -> List[Dict[str, Any]]:
         """Search for publications by title and year."""
         pass
 
     # Removed search_by_title_journal method
 
     @abstractmethod
-    def search_by_title(self, title: str) -> List[Dict[str, Any]]:
+    def search_by_title(self, title: str, page: int = 1) -> List[Dict[str, Any]]:
         """Search for publications by title only."""
         pass
+
+    def more_pages(
+        self, search: str, *args: Any, seen: int, max_pages: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lazily yield pages 2..``max_pages`` of the ``search`` method's results.
+
+        ``seen`` is the number of results already returned by page 1. Stops at
+        the first short page. Repositories that cannot page yield nothing.
+        """
+        return iter(())
+
+    def record_match_rank(self, search: str, rank: int) -> None:
+        """
+        Note that a match was accepted at 0-based ``rank`` of ``search``'s results.
+        Repositories may use it to size result pages; the default ignores it.
+        """
+
+    def record_match_miss(self, search: str, seen: int) -> None:
+        """
+        Note that none of the ``seen`` results of ``search`` was accepted.
+        Counterpart of ``record_match_rank``; the default ignores it.
+        """
+
+    def close(self) -> None:
+        """Release connections and caches held by the repository; the default holds none."""
@@ -14,6 +14,10 @@ class Config(BaseModel):
     """
 
     openalex_email: Optional[str] = Field(default=None, env="OPENALEX_EMAIL")
+    openalex_api_key: Optional[str] = Field(default=None, env="OPENALEX_API_KEY")
+    # User-Agent sent to OpenAlex; None sends pyalex's default
+    user_agent: Optional[str] = Field(default=None, env="USER_AGENT")
+    openalex_url: str = Field(default="https://api.openalex.org", env="OPENALEX_URL")
     title_similarity_threshold: float = Field(default=0.85, env="TITLE_SIMILARITY_THRESHOLD")
     author_similarity_threshold: float = Field(default=0.90, env="AUTHOR_SIMILARITY_THRESHOLD")
     disable_strategies: List[str] = Field(default_factory=list, env="DISABLE_STRATEGIES")
@@ -21,7 +25,68 @@ class Config(BaseModel):
     retry_backoff_factor: float = Field(default=0.5, env="RETRY_BACKOFF_FACTOR")
     retry_http_codes: List[int] = Field(default_factory=lambda: [429, 500, 503], env="RETRY_HTTP_CODES")
     concurrency: int = Field(default=20, env="CONCURRENCY")
+    # Batch execution (sequential | threads | adaptive); threads runs `concurrency` workers,
+    # adaptive tunes concurrency between 1 and max_concurrency
+    concurrency_mode: str = Field(default="sequential", env="CONCURRENCY_MODE")
+    max_concurrency: int = Field(default=64, env="MAX_CONCURRENCY")
+    # Cascade order (depth_first | breadth_first); breadth-first runs each strategy over all pending studies
+    execution_mode: str = Field(default="depth_first", env="EXECUTION_MODE")
+    # Study order (input | shortest_first); shortest-first starts studies needing fewer searches
+    # first, so results stream out of input order
+    schedule: str = Field(default="input", env="SCHEDULE")
+    # Skip strategies whose win rate in this run (scaled by cost) falls below strategy_skip_floor
+    adaptive_strategies: bool = Field(default=False, env="ADAPTIVE_STRATEGIES")
+    strategy_skip_floor: float = Field(default=0.02, env="STRATEGY_SKIP_FLOOR")
+    strategy_min_samples: int = Field(default=30, env="STRATEGY_MIN_SAMPLES")
+    # Hedged GETs: duplicate requests slower than the observed p90, within a budget.
+    # Only single attempts made under a study/run timeout are hedged, never after a 429/503
+    hedge_requests: bool = Field(default=False, env="HEDGE_REQUESTS")
+    hedge_budget: float = Field(default=0.05, env="HEDGE_BUDGET")
+    # Circuit breaker: opens on N consecutive transient failures or a high error rate
+    circuit_failure_threshold: int = Field(default=5, env="CIRCUIT_FAILURE_THRESHOLD")
+    circuit_error_rate: float = Field(default=0.5, env="CIRCUIT_ERROR_RATE")
+    circuit_window: int = Field(default=20, env="CIRCUIT_WINDOW")
+    circuit_reset_timeout: float = Field(default=30.0, env="CIRCUIT_RESET_TIMEOUT")
+    # Studies deferred by transient API errors are retried at the end of the run
+    deferred_max_attempts: int = Field(default=3, env="DEFERRED_MAX_ATTEMPTS")
+    deferred_retry_backoff: float = Field(default=5.0, env="DEFERRED_RETRY_BACKOFF")
+    request_timeout: float = Field(default=30.0, env="REQUEST_TIMEOUT")
+    # Fetch up to max_page_depth pages while the best title score is within page_fetch_margin of the threshold
+    max_page_depth: int = Field(default=2, env="MAX_PAGE_DEPTH")
+    page_fetch_margin: float = Field(default=0.05, env="PAGE_FETCH_MARGIN")
+    # Learn per_page per search from the rank of accepted matches (and of full-page misses)
+    adaptive_page_size: bool = Field(default=False, env="ADAPTIVE_PAGE_SIZE")
+    # Directory for state kept between runs (learned page sizes); None keeps everything in memory
+    cache_dir: Optional[str] = Field(default=None, env="CACHE_DIR")
+    # Keep work responses compressed on disk in cache_dir (seconds before an entry expires, 0 = never);
+    # empty responses also expire after rematch_not_found_after
+    response_cache: bool = Field(default=False, env="RESPONSE_CACHE")
+    response_cache_ttl: float = Field(default=0.0, env="RESPONSE_CACHE_TTL")
+    # Request (select=) and keep only the work fields the matcher reads
+    slim_works: bool = Field(default=True, env="SLIM_WORKS")
+    # Title searches kept in memory; narrower queries are answered from complete broader ones (0 = off)
+    query_cache_size: int = Field(default=1024, env="QUERY_CACHE_SIZE")
+    # Coalesce concurrent DOI/PMID lookups arriving within this many seconds into one OR-filter
+    # request of up to identifier_batch_size ids (0 = off; pays off with concurrent studies or callers)
+    identifier_batch_wait: float = Field(default=0.0, env="IDENTIFIER_BATCH_WAIT")
+    identifier_batch_size: int = Field(default=50, env="IDENTIFIER_BATCH_SIZE")
+    # SQLite file storing every result of match_studies(review_id=...); None keeps results in memory only
+    results_db: Optional[str] = Field(default=None, env="RESULTS_DB")
+    # Incremental re-runs reuse unchanged results; NOT_FOUND/REJECTED ones are re-matched after
+    # this many seconds (0 = never)
+    rematch_not_found_after: float = Field(default=604800.0, env="REMATCH_NOT_FOUND_AFTER")
+    # Time budgets in seconds (0 = unlimited); studies over budget end as TIMEOUT
+    study_timeout: float = Field(default=0.0, env="STUDY_TIMEOUT")
+    run_timeout: float = Field(default=0.0, env="RUN_TIMEOUT")
+    # Multiplex requests over HTTP/2 (needs httpx[http2]; falls back to HTTP/1.1)
+    http2: bool = Field(default=False, env="HTTP2")
+    # Batches the match server runs at once, each with its own concurrency; later ones queue
+    server_max_batches: int = Field(default=4, env="SERVER_MAX_BATCHES")
     allow_missing_year: bool = Field(default=False, env="ALLOW_MISSING_YEAR") # Added for has_minimal_data
+    # Profiling (off | cprofile | pyinstrument), wrapping the whole run or each study
+    profile_mode: str = Field(default="off", env="PROFILE_MODE")
+    profile_scope: str = Field(default="run", env="PROFILE_SCOPE")
+    profile_output_dir: str = Field(default="profiles", env="PROFILE_OUTPUT_DIR")
 
     class Config:
         env_file = '.env'
@@ -39,18 +104,52 @@ class Config(BaseModel):
             raise ValueError('Similarity threshold must be between 0.0 and 1.0')
         return v
 
-    @validator('max_retries', 'concurrency')
+    @validator('max_retries', 'concurrency', 'max_concurrency', 'deferred_max_attempts',
+               'circuit_failure_threshold', 'circuit_window', 'query_cache_size',
+               'max_page_depth', 'strategy_min_samples')
     def check_positive_integer(cls, v):
         if v < 0:
             raise ValueError('Value must be a non-negative integer')
         return v
 
-    @validator('retry_backoff_factor')
+    @validator('retry_backoff_factor', 'request_timeout', 'deferred_retry_backoff',
+               'circuit_reset_timeout', 'study_timeout', 'run_timeout', 'page_fetch_margin',
+               'response_cache_ttl', 'rematch_not_found_after', 'identifier_batch_wait')
     def check_positive_float(cls, v):
         if v < 0.0:
             raise ValueError('Value must be a non-negative float')
         return v
 
+    @validator('server_max_batches')
+    def check_server_max_batches(cls, v):
+        if v < 1:
+            raise ValueError('server_max_batches must be at least 1')
+        return v
+
+    @validator('identifier_batch_size')
+    def check_identifier_batch_size(cls, v):
+        if not 1 <= v <= 100:
+            raise ValueError('identifier_batch_size must be between 1 and 100')
+        return v
+
+    @validator('circuit_error_rate')
+    def check_error_rate(cls, v):
+        if not 0.0 < v <= 1.0:
+            raise ValueError('circuit_error_rate must be in (0.0, 1.0]')
+        return v
+
+    @validator('hedge_budget')
+    def check_hedge_budget(cls, v):
+        if not 0.0 <= v <= 1.0:
+            raise ValueError('hedge_budget must be between 0.0 and 1.0')
+        return v
+
+    @validator('strategy_skip_floor')
+    def check_strategy_skip_floor(cls, v):
+        if not 0.0 <= v <= 1.0:
+            raise ValueError('strategy_skip_floor must be between 0.0 and 1.0')
+        return v
+
     @validator('disable_strategies', pre=True, always=True)
     def parse_disable_strategies(cls, v):
         if isinstance(v, str):
@@ -70,9 +169,51 @@ class Config(BaseModel):
              return codes if codes else [429, 500, 503]
          return v if v else [429, 500, 503]
 
+    @validator('concurrency_mode', pre=True, always=True)
+    def check_concurrency_mode(cls, v):
+        mode = (v or "sequential").strip().lower()
+        if mode not in ("sequential", "threads", "adaptive"):
+            raise ValueError('concurrency_mode must be one of: sequential, threads, adaptive')
+        return mode
+
+    @validator('execution_mode', pre=True, always=True)
+    def check_execution_mode(cls, v):
+        mode = (v or "depth_first").strip().lower().replace("-", "_")
+        if mode not in ("depth_first", "breadth_first"):
+            raise ValueError('execution_mode must be one of: depth_first, breadth_first')
+        return mode
+
+    @validator('schedule', pre=True, always=True)
+    def check_schedule(cls, v):
+        schedule = (v or "input").strip().lower().replace("-", "_")
+        if schedule not in ("shortest_first", "input"):
+            raise ValueError('schedule must be one of: input, shortest_first')
+        return schedule
+
+    @validator('profile_mode', pre=True, always=True)
+    def check_profile_mode(cls, v):
+        mode = (v or "off").strip().lower()
+        if mode not in ("off", "cprofile", "pyinstrument"):
+            raise ValueError('profile_mode must be one of: off, cprofile, pyinstrument')
+        return mode
+
+    @validator('profile_scope', pre=True, always=True)
+    def check_profile_scope(cls, v):
+        scope = (v or "run").strip().lower()
+        if scope not in ("run", "study"):
+            raise ValueError('profile_scope must be one of: run, study')
+        return scope
+
     @classmethod
     def from_env(cls) -> "Config":
-        """Create Config from environment variables using Pydantic's built-in handling."""
-        # Pydantic v2 automatically reads from environment variables if 'env' is set in Field
-        # and Config.case_sensitive = False helps find vars like OPENALEX_EMAIL
-        return cls()
+        """Create Config from the environment variables declared on each Field."""
+        # Pydantic v2 BaseModel ignores Field(env=...), so look the names up ourselves.
+        # Lookup is case-insensitive to match Config.case_sensitive = False.
+        environ = {k.upper(): v for k, v in os.environ.items()}
+        values = {}
+        for field_name, field in cls.model_fields.items():
+            extra = field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+            env_name = extra.get("env")
+            if env_name and env_name.upper() in environ:
+                values[field_name] = environ[env_name.upper()]
+        return cls(**values)
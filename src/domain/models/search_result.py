@@ -1,6 +1,7 @@
 # src/domain/models/search_result.py
 """SearchResult model representing results of publication search."""
 
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
@@ -27,6 +28,9 @@ class SearchResult(BaseModel):
     search_details: Optional[Dict[str, Any]] = None
     search_attempts: Optional[List[Dict[str, Any]]] = None
     original_reference: Optional[Dict[str, Any]] = None
+    # Hash of the normalized reference and matching settings; equal hashes can reuse this result
+    reference_hash: Optional[str] = None
+    matched_at: Optional[datetime] = None
 
     def to_json(self) -> Dict[str, Any]:
         """Convert the SearchResult object to JSON output format."""
@@ -55,5 +59,7 @@ class SearchResult(BaseModel):
         output_dict = self.dict(exclude_none=True, exclude=exclude_fields)
         output_dict['study_type'] = self.study_type.value
         output_dict['status'] = self.status.value
+        if self.matched_at is not None:
+            output_dict['matched_at'] = self.matched_at.isoformat()
 
         return output_dict
@@ -1,6 +1,6 @@
 # src/domain/strategies/base_strategy.py
 from abc import abstractmethod
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from loguru import logger
 
@@ -33,6 +33,64 @@ class BaseStrategy(SearchStrategy):
             # Fail silently to avoid stopping execution
 
 
+    def _best_title_similarity(self, reference: Reference, results: List[Dict[str, Any]]) -> float:
+        return max(
+            (self._calculate_title_similarity(reference.title or "", r.get("title", "")) for r in results),
+            default=0.0,
+        )
+
+    def _search_ranked(
+        self, reference: Reference, search: str, args: Sequence[Any], title_threshold: float
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run repository method ``search`` and rank the candidates.
+
+        Returns ``(all candidates, ranked matches)``. If page 1 yields no match
+        but its best title similarity falls within ``config.page_fetch_margin``
+        below ``title_threshold``, further pages are fetched one at a time, up
+        to ``config.max_page_depth``, until something matches or the scores
+        stop being borderline. The repository is told where the match ranked,
+        or that the candidates held none.
+        """
+        results, ranked = self._search_pages(reference, search, args, title_threshold)
+        if ranked:
+            self._record_rank(search, results, ranked[0])
+        elif results:
+            self.publication_repository.record_match_miss(search, len(results))
+        return results, ranked
+
+    def _search_pages(
+        self, reference: Reference, search: str, args: Sequence[Any], title_threshold: float
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        results = getattr(self.publication_repository, search)(*args)
+        ranked = self._filter_and_rank_results(reference, results)
+        if ranked or self.config.max_page_depth <= 1 or not results:
+            return results, ranked
+        floor = title_threshold - self.config.page_fetch_margin
+        # A title at or above the threshold was rejected on other criteria; paging won't help
+        best = self._best_title_similarity(reference, results)
+        if not floor <= best < title_threshold:
+            return results, ranked
+        pages = self.publication_repository.more_pages(
+            search, *args, seen=len(results), max_pages=self.config.max_page_depth
+        )
+        for page in pages:
+            logger.debug(f"{self.name}: best title similarity {best:.2f} is borderline, fetched another page")
+            results = results + page
+            ranked = self._filter_and_rank_results(reference, page)
+            if ranked or not page:
+                break
+            best = max(best, self._best_title_similarity(reference, page))
+            if not floor <= best < title_threshold:
+                break
+        return results, ranked
+
+    def _record_rank(self, search: str, results: List[Dict[str, Any]], best: Dict[str, Any]) -> None:
+        """Report where in the API's result order the accepted match was."""
+        rank = next((i for i, r in enumerate(results) if r is best), None)
+        if rank is not None:
+            self.publication_repository.record_match_rank(search, rank)
+
     @abstractmethod
     def validate_reference(self, reference: Reference) -> bool:
         """Validate that the reference contains required data for this strategy."""
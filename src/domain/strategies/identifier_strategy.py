@@ -3,6 +3,7 @@ import re
 from typing import Any, Dict, List, Tuple, Optional
 
 from ..enums.search_strategy_type import SearchStrategyType
+from ..exceptions import TransientRepositoryError
 from ..interfaces.publication_repository import PublicationRepository
 from ..models.reference import Reference
 from .base_strategy import BaseStrategy
@@ -74,6 +75,8 @@ class IdentifierStrategy(BaseStrategy):
                 else:
                     error_log.append("DOI not found")
                     self.log_attempt(reference, 0, error="DOI not found")
+            except TransientRepositoryError:
+                raise
             except Exception as e:
                 error_log.append(f"DOI API error: {str(e)}")
                 self.log_attempt(reference, 0, error=f"DOI API error: {e}")
@@ -93,6 +96,8 @@ class IdentifierStrategy(BaseStrategy):
                 else:
                     error_log.append("PMID not found")
                     self.log_attempt(reference, 0, error="PMID not found")
+            except TransientRepositoryError:
+                raise
             except Exception as e:
                 error_log.append(f"PMID API error: {str(e)}")
                 self.log_attempt(reference, 0, error=f"PMID API error: {e}")
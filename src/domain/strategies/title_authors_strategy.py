@@ -5,6 +5,7 @@ from rapidfuzz import fuzz, process
 from loguru import logger
 
 from ..enums.search_strategy_type import SearchStrategyType
+from ..exceptions import TransientRepositoryError
 from ..interfaces.publication_repository import PublicationRepository
 from ..models.config import Config
 from ..models.reference import Reference
@@ -110,11 +111,13 @@ class TitleAuthorsStrategy(BaseStrategy):
         }
         try:
             self.validate_reference(reference)
-            results = self.publication_repository.search_by_title_authors(
-                reference.title or "", reference.authors or []
+            results, filtered_results = self._search_ranked(
+                reference,
+                "search_by_title_authors",
+                (reference.title or "", reference.authors or []),
+                self.config.title_similarity_threshold,
             )
             initial_count = len(results)
-            filtered_results = self._filter_and_rank_results(reference, results)
 
             if filtered_results:
                 self.log_attempt(reference, len(filtered_results))
@@ -131,6 +134,8 @@ class TitleAuthorsStrategy(BaseStrategy):
             self.log_attempt(reference, 0, error=str(ve))
             metadata["error"] = f"Validation error: {str(ve)}"
             return [], metadata
+        except TransientRepositoryError:
+            raise
         except Exception as e:
             self.log_attempt(reference, 0, error=f"API error: {e}")
             metadata["error"] = f"API error: {str(e)}"
@@ -5,6 +5,7 @@ from rapidfuzz import fuzz, process
 from loguru import logger
 
 from ..enums.search_strategy_type import SearchStrategyType
+from ..exceptions import TransientRepositoryError
 from ..interfaces.publication_repository import PublicationRepository
 from ..models.config import Config
 from ..models.reference import Reference
@@ -142,11 +143,13 @@ class TitleAuthorsYearStrategy(BaseStrategy):
         }
         try:
             self.validate_reference(reference)
-            results = self.publication_repository.search_by_title_authors_year(
-                reference.title or "", reference.authors or [], reference.year or 0
+            results, filtered_results = self._search_ranked(
+                reference,
+                "search_by_title_authors_year",
+                (reference.title or "", reference.authors or [], reference.year or 0),
+                self.config.title_similarity_threshold,
             )
             initial_count = len(results)
-            filtered_results = self._filter_and_rank_results(reference, results)
 
             if filtered_results:
                 self.log_attempt(reference, len(filtered_results))
@@ -163,6 +166,8 @@ class TitleAuthorsYearStrategy(BaseStrategy):
             self.log_attempt(reference, 0, error=str(ve))
             metadata["error"] = f"Validation error: {str(ve)}"
             return [], metadata
+        except TransientRepositoryError:
+            raise
         except Exception as e:
             self.log_attempt(reference, 0, error=f"API error: {e}")
             metadata["error"] = f"API error: {str(e)}"
@@ -5,6 +5,7 @@ from rapidfuzz import fuzz
 from loguru import logger
 
 from ..enums.search_strategy_type import SearchStrategyType
+from ..exceptions import TransientRepositoryError
 from ..interfaces.publication_repository import PublicationRepository
 from ..models.config import Config
 from ..models.reference import Reference
@@ -82,9 +83,10 @@ class TitleOnlyStrategy(BaseStrategy):
         }
         try:
             self.validate_reference(reference)
-            results = self.publication_repository.search_by_title(reference.title or "")
+            results, filtered_results = self._search_ranked(
+                reference, "search_by_title", (reference.title or "",), self.effective_title_threshold
+            )
             initial_count = len(results)
-            filtered_results = self._filter_and_rank_results(reference, results)
 
             if filtered_results:
                 self.log_attempt(reference, len(filtered_results))
@@ -101,6 +103,8 @@ class TitleOnlyStrategy(BaseStrategy):
             self.log_attempt(reference, 0, error=str(ve))
             metadata["error"] = f"Validation error: {str(ve)}"
             return [], metadata
+        except TransientRepositoryError:
+            raise
         except Exception as e:
             self.log_attempt(reference, 0, error=f"API error: {e}")
             metadata["error"] = f"API error: {str(e)}"
@@ -0,0 +1,4 @@
+# src/infrastructure/exporters/__init__.py
+from .parquet_exporter import ParquetExporter
+
+__all__ = ["ParquetExporter"]
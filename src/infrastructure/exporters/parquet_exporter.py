@@ -0,0 +1,137 @@
+# src/infrastructure/exporters/parquet_exporter.py
+"""Columnar export of match results to partitioned Parquet."""
+
+import itertools
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.domain.models.search_result import SearchResult
+
+# (name, Arrow type name); similarity scores come from the strategies' _debug data
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("review_id", "string"),
+    ("study_id", "string"),
+    ("status", "string"),
+    ("strategy", "string"),
+    ("openalex_id", "string"),
+    ("year", "int32"),
+    ("doi", "string"),
+    ("citation_count", "int64"),
+    ("title_similarity", "float64"),
+    ("authors_similarity", "float64"),
+    ("combined_score", "float64"),
+)
+SCORES = ("title_similarity", "authors_similarity", "combined_score")
+PARTITIONS = ("review_id", "status")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export needs pyarrow: pip install 'openalex-py[parquet]'"
+        ) from e
+    return pyarrow
+
+
+def result_row(review_id: str, result: SearchResult) -> Dict[str, Any]:
+    """One result as a flat row of COLUMNS, scores typed as floats."""
+    details = result.search_details or {}
+    row = {
+        "review_id": review_id,
+        "study_id": result.study_id,
+        "status": getattr(result.status, "value", result.status),
+        "strategy": result.strategy,
+        "openalex_id": result.openalex_id,
+        "year": result.year,
+        "doi": result.doi,
+        "citation_count": result.citation_count,
+    }
+    for score in SCORES:
+        value = details.get(score)
+        row[score] = float(value) if isinstance(value, (int, float)) else None
+    return row
+
+
+class ParquetExporter:
+    """
+    Streams results into Arrow record batches and writes them as Parquet.
+
+    Rows are buffered column by column and written every ``batch_size``
+    results, so memory stays bounded by one batch whatever the corpus size.
+    Files are laid out hive-style under ``root`` by ``partition_by``
+    (``review_id=.../`` or ``status=.../``); each flush adds new files, so
+    an export can be read while it grows. File names carry an id unique to
+    the exporter, so several exporters (or runs) can share one ``root``
+    without overwriting each other's files. Needs pyarrow (the ``parquet``
+    extra). ``writer`` gives an ``on_result`` callback for match_studies.
+    """
+
+    def __init__(self, root: Path, partition_by: str = "review_id", batch_size: int = 10_000):
+        if partition_by not in PARTITIONS:
+            raise ValueError(f"partition_by must be one of: {', '.join(PARTITIONS)}")
+        self._pa = _import_pyarrow()
+        self.root = root
+        self.partition_by = partition_by
+        self.batch_size = batch_size
+        self.schema = self._pa.schema([(name, getattr(self._pa, kind)()) for name, kind in COLUMNS])
+        self.rows_written = 0
+        self._lock = threading.Lock()
+        self._columns: Dict[str, List[Any]] = {name: [] for name, _ in COLUMNS}
+        self._flushes = itertools.count()
+        self._file_prefix = f"part-{uuid.uuid4().hex}"
+
+    def __enter__(self) -> "ParquetExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, review_id: str, result: SearchResult) -> None:
+        with self._lock:
+            for name, value in result_row(review_id, result).items():
+                self._columns[name].append(value)
+            if len(self._columns["study_id"]) >= self.batch_size:
+                self._flush()
+
+    def write_all(self, review_id: str, results: Iterable[SearchResult]) -> None:
+        """Write a review's results, e.g. ``ResultStore.results(review_id=...)``."""
+        for result in results:
+            self.write(review_id, result)
+
+    def writer(self, review_id: str) -> Callable[[SearchResult], None]:
+        """An ``on_result`` callback exporting each result under ``review_id``."""
+        return lambda result: self.write(review_id, result)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        self.flush()
+
+    def record_batch(self) -> Optional[Any]:
+        """The buffered rows as an Arrow RecordBatch, or None if empty."""
+        if not self._columns["study_id"]:
+            return None
+        return self._pa.RecordBatch.from_pydict(self._columns, schema=self.schema)
+
+    def _flush(self) -> None:
+        batch = self.record_batch()
+        if batch is None:
+            return
+        self._pa.dataset.write_dataset(
+            batch,
+            self.root,
+            format="parquet",
+            partitioning=[self.partition_by],
+            partitioning_flavor="hive",
+            basename_template=f"{self._file_prefix}-{next(self._flushes)}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        self.rows_written += batch.num_rows
+        self._columns = {name: [] for name, _ in COLUMNS}
@@ -0,0 +1,12 @@
+# src/infrastructure/http/__init__.py
+from .circuit_breaker import CircuitBreaker
+from .hedging import HedgingTransport
+from .transport import HttpxTransport, RequestsTransport, create_transport
+
+__all__ = [
+    "CircuitBreaker",
+    "HedgingTransport",
+    "HttpxTransport",
+    "RequestsTransport",
+    "create_transport",
+]
@@ -0,0 +1,147 @@
+# src/infrastructure/http/circuit_breaker.py
+"""Circuit breaker that fails OpenAlex calls fast while the API is down."""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional, TypeVar
+
+from loguru import logger
+
+from src.domain.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    TransientRepositoryError,
+)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker around repository calls.
+
+    Only transient failures count. The breaker opens after
+    ``failure_threshold`` consecutive failures, or when at least
+    ``error_rate`` of the last ``window`` calls failed. While open, calls raise
+    CircuitOpenError without touching the network. After ``reset_timeout``
+    seconds a single probe call is let through (half-open): success closes the
+    breaker, failure opens it again for another ``reset_timeout``. Only the
+    probe decides: late results of calls started before the breaker opened
+    are ignored while it is half-open.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        error_rate: float = 0.5,
+        window: int = 20,
+        reset_timeout: float = 30.0,
+        on_state_change: Optional[Callable[[str], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(failure_threshold, 1)
+        self.error_rate = error_rate
+        self.window = max(window, 1)
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._outcomes: deque = deque(maxlen=self.window)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        # Token of the latest half-open probe; calls let through while closed carry None
+        self._probe = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run ``fn`` through the breaker."""
+        probe = self._before_call()
+        try:
+            result = fn()
+        except DeadlineExceededError:
+            # Our own budget ran out; says nothing about the API
+            self._release_probe(probe)
+            raise
+        except TransientRepositoryError:
+            self._record(False, probe)
+            raise
+        except Exception:
+            # The API answered (e.g. a 400), so it is available
+            self._record(True, probe)
+            raise
+        self._record(True, probe)
+        return result
+
+    def _before_call(self) -> Optional[int]:
+        """Let a call through (returning its probe token, if it is the probe) or raise."""
+        with self._lock:
+            if self._state == CLOSED:
+                return None
+            remaining = self._opened_at + self.reset_timeout - self.clock()
+            if self._state == OPEN and remaining <= 0:
+                self._set_state(HALF_OPEN)
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                self._probe += 1
+                return self._probe
+            # While a half-open probe is out, check back shortly
+            retry_after = remaining if remaining > 0 else min(self.reset_timeout, 1.0)
+            raise CircuitOpenError(
+                f"Circuit breaker {self._state}; OpenAlex calls suspended",
+                retry_after=retry_after,
+            )
+
+    def _is_current_probe(self, probe: Optional[int]) -> bool:
+        return self._probe_in_flight and probe == self._probe
+
+    def _release_probe(self, probe: Optional[int]) -> None:
+        with self._lock:
+            if self._is_current_probe(probe):
+                self._probe_in_flight = False
+
+    def _record(self, success: bool, probe: Optional[int] = None) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if not self._is_current_probe(probe):
+                    return  # Late result of a call started before the breaker opened
+                self._probe_in_flight = False
+                if success:
+                    self._outcomes.clear()
+                    self._consecutive_failures = 0
+                    self._set_state(CLOSED)
+                else:
+                    self._trip("half-open probe failed")
+                return
+            if self._state == OPEN:
+                return  # Late result of a call started before the breaker opened
+            self._outcomes.append(success)
+            self._consecutive_failures = 0 if success else self._consecutive_failures + 1
+            if self._consecutive_failures >= self.failure_threshold:
+                self._trip(f"{self._consecutive_failures} consecutive failures")
+            elif len(self._outcomes) == self.window:
+                failures = self._outcomes.count(False)
+                if failures / self.window >= self.error_rate:
+                    self._trip(f"{failures}/{self.window} recent calls failed")
+
+    def _trip(self, reason: str) -> None:
+        logger.warning(f"Circuit breaker opened: {reason}")
+        self._opened_at = self.clock()
+        self._set_state(OPEN)
+
+    def _set_state(self, state: str) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        if self.on_state_change is not None:
+            self.on_state_change(state)
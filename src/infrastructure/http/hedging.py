@@ -0,0 +1,150 @@
+# src/infrastructure/http/hedging.py
+"""Hedged GETs: duplicate a slow request and take whichever answers first."""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+from src.domain.exceptions import TransientRepositoryError
+from src.utils.metrics import percentile
+
+# Statuses that ask the client to slow down; hedging would add load instead
+THROTTLE_STATUSES = {429, 503}
+
+
+class HedgingTransport:
+    """
+    Wraps a transport; only for idempotent GETs.
+
+    If a request has not answered within the observed ``quantile`` latency, a
+    duplicate is sent and the first response wins. Hedges are capped by a
+    global ``budget`` (hedges / requests), so at most e.g. 5% extra load
+    reaches the API. The losing request is left to finish in the background;
+    its result is discarded. No hedging happens until ``min_samples``
+    latencies have been observed. Attempts run in a copy of the caller's
+    context, so its request listeners still see them.
+
+    Only single attempts (``retry=False``) are hedged: a retrying call may be
+    slow because it is sleeping on a 429's Retry-After, so it goes straight
+    to the inner transport. After a 429 or 503 from any call, no hedges are
+    sent until its Retry-After, or at least ``throttle_cooldown`` seconds,
+    has passed.
+    """
+
+    def __init__(
+        self,
+        inner: Any,
+        budget: float = 0.05,
+        quantile: float = 0.9,
+        min_samples: int = 20,
+        window: int = 500,
+        max_workers: int = 32,
+        on_hedge: Optional[Callable[[bool], None]] = None,
+        throttle_cooldown: float = 5.0,
+    ):
+        self.inner = inner
+        self.budget = budget
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.on_hedge = on_hedge
+        self.throttle_cooldown = throttle_cooldown
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=window)
+        self._requests = 0
+        self._hedges = 0
+        # No hedges before this time.monotonic() value (set by 429/503 responses)
+        self._calm_until = 0.0
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+
+    @property
+    def http_version(self) -> str:
+        return self.inner.http_version
+
+    @property
+    def observer(self):
+        return self.inner.observer
+
+    def hedge_delay(self) -> Optional[float]:
+        """Current hedge trigger (seconds), or None while still warming up."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            return percentile(list(self._latencies), self.quantile)
+
+    def _take_hedge_token(self) -> bool:
+        with self._lock:
+            if time.monotonic() < self._calm_until:
+                return False
+            if self._hedges + 1 > self.budget * self._requests:
+                return False
+            self._hedges += 1
+            return True
+
+    def _timed(
+        self, url: str, headers: Dict[str, str], timeout: Optional[float], retry: bool
+    ) -> Dict[str, Any]:
+        start = time.perf_counter()
+        body = self._throttle_aware(url, headers, timeout, retry)
+        with self._lock:
+            self._latencies.append(time.perf_counter() - start)
+        return body
+
+    def _throttle_aware(
+        self, url: str, headers: Dict[str, str], timeout: Optional[float], retry: bool
+    ) -> Dict[str, Any]:
+        """Call the inner transport, pausing hedges when the API pushes back."""
+        try:
+            return self.inner.get_json(url, headers, timeout, retry=retry)
+        except TransientRepositoryError as e:
+            if e.status_code in THROTTLE_STATUSES:
+                calm_for = max(e.retry_after or 0.0, self.throttle_cooldown)
+                with self._lock:
+                    self._calm_until = max(self._calm_until, time.monotonic() + calm_for)
+            raise
+
+    def _submit(self, url: str, headers: Dict[str, str], timeout: Optional[float], retry: bool):
+        context = contextvars.copy_context()
+        return self._pool.submit(context.run, self._timed, url, headers, timeout, retry)
+
+    def get_json(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        retry: bool = True,
+    ) -> Dict[str, Any]:
+        if retry:
+            return self._throttle_aware(url, headers, timeout, retry)
+        with self._lock:
+            self._requests += 1
+        delay = self.hedge_delay()
+        primary = self._submit(url, headers, timeout, retry)
+        if delay is None:
+            return primary.result()
+
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_hedge_token():
+            return primary.result()
+
+        hedge = self._submit(url, headers, timeout, retry)
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if self.on_hedge is not None:
+                        self.on_hedge(future is hedge)
+                    return future.result()
+                first_error = first_error or error
+        if self.on_hedge is not None:
+            self.on_hedge(False)
+        raise first_error
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        self.inner.close()
@@ -0,0 +1,283 @@
+# src/infrastructure/http/transport.py
+"""HTTP transports used by the OpenAlex repository."""
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from src.domain.exceptions import (
+    PermanentRepositoryError,
+    TransientRepositoryError,
+    error_for_status,
+)
+from src.domain.models.config import Config
+
+DEFAULT_RETRY_CODES = [429, 500, 503]
+
+# Called once per HTTP attempt with (status, latency); status 0 means no response
+# and latency is None for attempts that were retried internally
+RequestObserver = Callable[[int, Optional[float]], None]
+
+
+def _notify(observer: Optional[RequestObserver], status: int, latency: Optional[float]) -> None:
+    if observer is not None:
+        observer(status, latency)
+
+
+def connection_pool_size(config: Config, concurrent_runs: int = 1) -> int:
+    """
+    Connections needed at peak: the adaptive ceiling for each concurrent run.
+
+    Adaptive runs grow past ``concurrency`` up to ``max_concurrency``, and a
+    server runs several batches at once; hedged requests get their budget on
+    top. A smaller pool would drop (requests) or block (httpx) the excess.
+    """
+    peak = max(config.concurrency, config.max_concurrency, 1) * max(concurrent_runs, 1)
+    if config.hedge_requests:
+        peak += math.ceil(peak * config.hedge_budget)
+    return peak
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header; HTTP-date values are ignored."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def _decode(
+    status_code: int, url: str, decode: Callable[[], Any], retry_after: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Raise a typed error for HTTP error statuses, otherwise decode the body.
+
+    Transports decode the raw bytes with orjson rather than the client's
+    ``json()``, which skips text decoding and the stdlib parser.
+    """
+    if status_code >= 400:
+        raise error_for_status(status_code, f"HTTP {status_code} for {url}", _retry_after(retry_after))
+    try:
+        return decode()
+    except ValueError as e:
+        raise PermanentRepositoryError(f"Invalid JSON from {url}: {e}", status_code) from e
+
+
+class RequestsTransport:
+    """
+    HTTP/1.1 transport: pooled requests.Sessions with urllib3 retries.
+
+    requests.Session is not documented as thread-safe, so each thread gets
+    its own session, built on first use. The sessions only hold headers:
+    they all mount one shared adapter, whose urllib3 pool is thread-safe,
+    so connections are reused across threads and a finished thread leaves
+    nothing open behind. Calls with ``retry=False`` make a single attempt
+    through a second, retry-free adapter, for callers that retry on their
+    own schedule. ``close`` closes both pools.
+    """
+
+    http_version = "HTTP/1.1"
+
+    def __init__(
+        self,
+        config: Config,
+        observer: Optional[RequestObserver] = None,
+        concurrent_runs: int = 1,
+    ):
+        self.config = config
+        self.observer = observer
+        self._local = threading.local()
+        retries = Retry(
+            total=config.max_retries,
+            backoff_factor=config.retry_backoff_factor,
+            status_forcelist=config.retry_http_codes or DEFAULT_RETRY_CODES,
+            allowed_methods={"GET"},
+            # Hand back the last response so callers see its real status code
+            raise_on_status=False,
+        )
+        pool_maxsize = connection_pool_size(config, concurrent_runs)
+        self._adapter = HTTPAdapter(max_retries=retries, pool_maxsize=pool_maxsize)
+        self._single_attempt = HTTPAdapter(max_retries=0, pool_maxsize=pool_maxsize)
+
+    @property
+    def _session(self) -> requests.Session:
+        """The calling thread's session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._build_session()
+        return session
+
+    def _build_session(self) -> requests.Session:
+        """Create a session on the shared, retrying connection pool."""
+        session = requests.Session()
+        # Mount plain HTTP too, so a local OpenAlex stand-in gets the same policy
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def get_json(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        retry: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        GET ``url`` and return the decoded JSON body.
+
+        ``timeout`` overrides ``config.request_timeout`` for this call; with
+        ``retry=False`` only one attempt is made.
+        Raises TransientRepositoryError or PermanentRepositoryError on failure.
+        """
+        timeout = timeout or self.config.request_timeout
+        start = time.perf_counter()
+        try:
+            if retry:
+                response = self._session.get(url, headers=headers, timeout=timeout)
+            else:
+                request = self._session.prepare_request(requests.Request("GET", url, headers=headers))
+                response = self._single_attempt.send(request, timeout=timeout)
+        except requests.RequestException as e:
+            _notify(self.observer, 0, time.perf_counter() - start)
+            raise TransientRepositoryError(f"Request to {url} failed: {e}") from e
+        latency = time.perf_counter() - start
+        # urllib3 retries transparently; surface the statuses it retried on
+        retries = getattr(response.raw, "retries", None)
+        for attempt in getattr(retries, "history", ()) or ():
+            _notify(self.observer, attempt.status or 0, None)
+        _notify(self.observer, response.status_code, latency)
+        return _decode(
+            response.status_code,
+            url,
+            lambda: orjson.loads(response.content),
+            response.headers.get("Retry-After"),
+        )
+
+    def close(self) -> None:
+        self._local = threading.local()
+        self._adapter.close()
+        self._single_attempt.close()
+
+
+class HttpxTransport:
+    """
+    HTTP/2 transport built on httpx + h2.
+
+    Concurrent requests to the same origin are multiplexed as streams over one
+    TLS connection, so connection count and handshake cost stay flat as
+    concurrency grows. Plain-HTTP origins (e.g. a local stand-in) are spoken
+    to over HTTP/1.1 by httpx.
+    """
+
+    http_version = "HTTP/2"
+
+    def __init__(
+        self,
+        config: Config,
+        observer: Optional[RequestObserver] = None,
+        concurrent_runs: int = 1,
+    ):
+        import httpx
+
+        self.config = config
+        self.observer = observer
+        self._httpx = httpx
+        self._retry_codes = set(config.retry_http_codes or DEFAULT_RETRY_CODES)
+        self._client = httpx.Client(
+            http2=True,
+            timeout=config.request_timeout,
+            # Only used for HTTP/1.1 origins; HTTP/2 shares one connection per origin
+            limits=httpx.Limits(max_connections=connection_pool_size(config, concurrent_runs)),
+        )
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        delay = _retry_after(retry_after)
+        if delay is not None:
+            return delay
+        return self.config.retry_backoff_factor * (2**attempt)
+
+    def get_json(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        retry: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        GET ``url`` and return the decoded JSON body.
+
+        ``timeout`` overrides ``config.request_timeout`` for this call; with
+        ``retry=False`` only one attempt is made.
+        Raises TransientRepositoryError or PermanentRepositoryError on failure.
+        """
+        max_retries = self.config.max_retries if retry else 0
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self._client.get(
+                    url, headers=headers, timeout=timeout or self.config.request_timeout
+                )
+            except self._httpx.TransportError as e:
+                if attempt >= max_retries:
+                    _notify(self.observer, 0, time.perf_counter() - start)
+                    raise TransientRepositoryError(f"Request to {url} failed: {e}") from e
+                _notify(self.observer, 0, None)
+                delay = self._retry_delay(attempt, None)
+                logger.debug(f"Retrying {url} after transport error: {e}")
+            else:
+                if (
+                    response.status_code not in self._retry_codes
+                    or attempt >= max_retries
+                ):
+                    _notify(self.observer, response.status_code, time.perf_counter() - start)
+                    return _decode(
+                        response.status_code,
+                        url,
+                        lambda: orjson.loads(response.content),
+                        response.headers.get("Retry-After"),
+                    )
+                _notify(self.observer, response.status_code, None)
+                delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                logger.debug(f"Retrying {url} after HTTP {response.status_code}")
+            attempt += 1
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def create_transport(
+    config: Config,
+    observer: Optional[RequestObserver] = None,
+    concurrent_runs: int = 1,
+):
+    """
+    Build the transport selected by ``config.http2``.
+
+    Falls back to HTTP/1.1 when httpx or h2 are not installed. ``observer`` is
+    called for every HTTP attempt, including retried ones; ``concurrent_runs``
+    is how many batches will share the pool (see ``connection_pool_size``). Both transports
+    accept gzip and deflate responses, plus br and zstd when the
+    ``compression`` extra is installed.
+    """
+    if config.http2:
+        try:
+            import h2  # noqa: F401
+            import httpx  # noqa: F401
+        except ImportError:
+            logger.warning(
+                "HTTP/2 requested but httpx[http2] is not installed; using HTTP/1.1"
+            )
+        else:
+            return HttpxTransport(config, observer, concurrent_runs)
+    return RequestsTransport(config, observer, concurrent_runs)
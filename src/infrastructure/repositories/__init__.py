@@ -1,4 +1,5 @@
 # src/infrastructure/repositories/__init__.py
 from .openalex_repository import OpenAlexRepository
+from .result_store import ResultStore
 
-__all__ = ["OpenAlexRepository"]
+__all__ = ["OpenAlexRepository", "ResultStore"]
@@ -0,0 +1,156 @@
+# src/infrastructure/repositories/identifier_batcher.py
+"""Coalesces concurrent DOI/PMID lookups into pipe-joined filter requests."""
+
+import contextvars
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from src.domain.exceptions import DeadlineExceededError, TransientRepositoryError
+from src.utils.deadline import Deadline, current_deadline, deadline_scope
+
+# OpenAlex accepts at most 100 values in one OR filter
+MAX_BATCH = 100
+
+# (kind, identifiers) -> works; kind is "doi" or "pmid"
+FetchFn = Callable[[str, List[str]], List[Dict[str, Any]]]
+
+# Lower-cased prefixes a DOI may carry in references and in OpenAlex works
+DOI_PREFIXES = (
+    "https://doi.org/",
+    "http://doi.org/",
+    "https://dx.doi.org/",
+    "http://dx.doi.org/",
+    "doi:",
+)
+
+
+def identifier_key(kind: str, value: Optional[str]) -> Optional[str]:
+    """Comparable form of a DOI or PMID, bare or as an OpenAlex URL."""
+    if not value:
+        return None
+    value = value.strip()
+    if kind == "doi":
+        value = value.lower()
+        for prefix in DOI_PREFIXES:
+            if value.startswith(prefix):
+                return value[len(prefix):].strip()
+        return value
+    return value.rstrip("/").rsplit("/", 1)[-1]
+
+
+def work_identifier(kind: str, work: Dict[str, Any]) -> Optional[str]:
+    """The DOI or PMID a work would be found by, in ``identifier_key`` form."""
+    value = work.get("doi") if kind == "doi" else (work.get("ids") or {}).get("pmid")
+    return identifier_key(kind, value)
+
+
+class _Batch:
+    def __init__(self):
+        self.identifiers: List[str] = []
+        self.keys: Set[str] = set()
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.works: Dict[str, Dict[str, Any]] = {}
+        self.error: Optional[Exception] = None
+        # Each caller's deadline; None once any caller has no time limit
+        self.deadlines: Optional[List[Deadline]] = []
+
+    def add_deadline(self, deadline: Optional[Deadline]) -> None:
+        if deadline is None:
+            self.deadlines = None
+        elif self.deadlines is not None:
+            self.deadlines.append(deadline)
+
+    @property
+    def latest_deadline(self) -> Optional[Deadline]:
+        if not self.deadlines:
+            return None
+        return max(self.deadlines, key=lambda d: d.expires_at)
+
+
+class IdentifierBatcher:
+    """
+    Gathers lookups of one kind that arrive within ``max_wait`` seconds.
+
+    The first caller opens a batch and a helper thread waits up to
+    ``max_wait`` for others to join; it sends the batch early once
+    ``max_batch`` identifiers are in. The whole batch is fetched in one
+    request and every caller gets the work for its own identifier, or None.
+    A caller that finds nobody to share with waits ``max_wait`` at most, so
+    it pays off only under concurrent load.
+
+    The request runs under the latest deadline among the batch's callers
+    (none if any caller has none), while each caller waits only as long as
+    its own deadline allows. Transient errors reach every caller of the
+    batch, except a deadline the shared request ran out of: a caller with
+    time left then looks its identifier up alone. Any other error (e.g. a
+    400 caused by one malformed identifier) is not shared either: each
+    caller of a multi-identifier batch retries its own identifier alone.
+    """
+
+    def __init__(self, fetch: FetchFn, max_wait: float = 0.02, max_batch: int = 50):
+        self.fetch = fetch
+        self.max_wait = max_wait
+        self.max_batch = min(max(max_batch, 1), MAX_BATCH)
+        self._lock = threading.Lock()
+        self._open: Dict[str, _Batch] = {}
+
+    def lookup(self, kind: str, identifier: str) -> Optional[Dict[str, Any]]:
+        key = identifier_key(kind, identifier)
+        deadline = current_deadline()
+        with self._lock:
+            batch = self._open.get(kind)
+            leader = batch is None
+            if leader:
+                batch = self._open[kind] = _Batch()
+            batch.add_deadline(deadline)
+            if key not in batch.keys:
+                batch.keys.add(key)
+                batch.identifiers.append(identifier)
+            if len(batch.identifiers) >= self.max_batch:
+                del self._open[kind]
+                batch.full.set()
+        if leader:
+            # A fresh context, so the request is not bound by the leader's deadline
+            sender = contextvars.Context().run
+            threading.Thread(target=sender, args=(self._send, kind, batch), daemon=True).start()
+        if not batch.done.wait(deadline.remaining() if deadline is not None else None):
+            raise DeadlineExceededError(f"Deadline exceeded waiting for a batched {kind} lookup")
+        if batch.error is not None:
+            if self._retry_alone(batch, deadline):
+                return self._lookup_alone(kind, identifier)
+            raise batch.error
+        return batch.works.get(key)
+
+    @staticmethod
+    def _retry_alone(batch: _Batch, deadline: Optional[Deadline]) -> bool:
+        """Whether a caller should look its identifier up alone after the batch failed."""
+        if isinstance(batch.error, DeadlineExceededError):
+            return deadline is None or not deadline.expired
+        if isinstance(batch.error, TransientRepositoryError):
+            return False
+        return len(batch.identifiers) > 1
+
+    def _lookup_alone(self, kind: str, identifier: str) -> Optional[Dict[str, Any]]:
+        works = self.fetch(kind, [identifier])
+        return works[0] if works else None
+
+    def _send(self, kind: str, batch: _Batch) -> None:
+        batch.full.wait(self.max_wait)
+        with self._lock:
+            if self._open.get(kind) is batch:
+                del self._open[kind]
+        try:
+            with deadline_scope(batch.latest_deadline):
+                works = self.fetch(kind, list(batch.identifiers))
+            if len(batch.identifiers) == 1 and works:
+                # A lone lookup keeps the unbatched answer, whatever form the id comes back in
+                batch.works[next(iter(batch.keys))] = works[0]
+            for work in works:
+                key = work_identifier(kind, work)
+                if key is not None:
+                    batch.works.setdefault(key, work)
+        except Exception as e:
+            batch.error = e
+        finally:
+            batch.done.set()
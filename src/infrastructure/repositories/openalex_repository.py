@@ -1,42 +1,253 @@
 # src/infrastructure/repositories/openalex_repository.py
 """OpenAlex repository implementation using pyalex library."""
 
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, Iterator, List, Optional
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 
 import pyalex
 from loguru import logger
 
+from src.domain.exceptions import (
+    DeadlineExceededError,
+    RepositoryError,
+    TransientRepositoryError,
+)
 from src.domain.interfaces.publication_repository import PublicationRepository
 from src.domain.models.config import Config
+from src.infrastructure.http import CircuitBreaker, HedgingTransport, create_transport
+from src.infrastructure.http.transport import DEFAULT_RETRY_CODES, connection_pool_size
+from src.utils.deadline import current_deadline
+from src.utils.metrics import RunMetrics
 from src.utils.text_normalizer import TextNormalizer
+from .identifier_batcher import IdentifierBatcher
+from .page_size_tuner import PageSizeTuner
+from .query_cache import QueryCache
+from .response_cache import ResponseCache
+from .work_fields import WORK_FIELDS, slim_work
+
+
+# Results requested per search page until the tuner has learned better
+PER_PAGE = 25
 
 
 class OpenAlexRepository(PublicationRepository):
     """Repository for accessing the OpenAlex database using pyalex."""
 
-    def __init__(self, config: Config):
-        """Initialize the OpenAlex repository."""
-        # Set email for "polite pool" if available
-        pyalex.config.email = (
-            config.openalex_email or None
-        )  # Ensure None if empty string
-        logger.info(
-            f"Setting OpenAlex email for polite pool: {pyalex.config.email}"
-        )
-
-        # Configure retry parameters
-        pyalex.config.max_retries = config.max_retries
-        pyalex.config.retry_backoff_factor = config.retry_backoff_factor
-        pyalex.config.retry_http_codes = config.retry_http_codes or [
-            429,
-            500,
-            503,
-        ]
+    def __init__(
+        self,
+        config: Config,
+        metrics: Optional[RunMetrics] = None,
+        concurrent_runs: int = 1,
+    ):
+        """
+        Initialize the OpenAlex repository; ``metrics`` receives every HTTP attempt.
+
+        The connection pool is sized for ``concurrent_runs`` batches running
+        at their adaptive ceiling at once.
+
+        Email, API key, retry policy and connection pool all come from
+        ``config`` and belong to this instance; the process-global
+        ``pyalex.config`` is never written, so differently configured
+        repositories can run side by side. pyalex only builds query URLs.
+        """
+        logger.info(f"OpenAlex email for polite pool: {config.openalex_email or None}")
         logger.info(
             f"Retry settings: max={config.max_retries}, factor={config.retry_backoff_factor}, codes={config.retry_http_codes}"
         )
 
         self.config = config
+        self._headers = self._build_headers(config)
+        # One pooled transport per repository; pyalex would build a new session per call
+        self.metrics = metrics
+        self._transport = create_transport(
+            config,
+            observer=metrics.record_request if metrics else None,
+            concurrent_runs=concurrent_runs,
+        )
+        if config.hedge_requests:
+            self._transport = HedgingTransport(
+                self._transport,
+                budget=config.hedge_budget,
+                max_workers=2 * connection_pool_size(config, concurrent_runs),
+                on_hedge=metrics.record_hedge if metrics else None,
+            )
+        logger.info(f"OpenAlex transport: {self._transport.http_version}")
+        self._breaker = CircuitBreaker(
+            failure_threshold=config.circuit_failure_threshold,
+            error_rate=config.circuit_error_rate,
+            window=config.circuit_window,
+            reset_timeout=config.circuit_reset_timeout,
+            on_state_change=metrics.set_circuit_state if metrics else None,
+        )
+        self._query_cache = (
+            QueryCache(config.query_cache_size) if config.query_cache_size else None
+        )
+        self._response_cache: Optional[ResponseCache] = None
+        if config.response_cache:
+            if config.cache_dir:
+                self._response_cache = ResponseCache(
+                    Path(config.cache_dir) / "responses.sqlite",
+                    ttl=config.response_cache_ttl,
+                    # Empty answers must not outlive the NOT_FOUND results they lead to
+                    empty_ttl=config.rematch_not_found_after,
+                )
+                logger.info(f"Response cache: {self._response_cache.path} ({self._response_cache.codec})")
+            else:
+                logger.warning("RESPONSE_CACHE needs CACHE_DIR; responses will not be cached")
+        self._identifiers: Optional[IdentifierBatcher] = None
+        if config.identifier_batch_wait:
+            self._identifiers = IdentifierBatcher(
+                self._fetch_identifiers,
+                max_wait=config.identifier_batch_wait,
+                max_batch=config.identifier_batch_size,
+            )
+        self._page_sizes: Optional[PageSizeTuner] = None
+        if config.adaptive_page_size:
+            path = Path(config.cache_dir) / "page_sizes.json" if config.cache_dir else None
+            self._page_sizes = PageSizeTuner(default=PER_PAGE, path=path)
+
+    def _rebase_url(self, url: str) -> str:
+        """Point a pyalex-built URL at the configured OpenAlex base URL."""
+        base = urlsplit(self.config.openalex_url)
+        parts = urlsplit(url)
+        path = base.path.rstrip("/") + parts.path
+        return urlunsplit((base.scheme, base.netloc, path, parts.query, ""))
+
+    def _get_works(self, works_query: Any, per_page: int, page: int = 1) -> List[Dict[str, Any]]:
+        """
+        Execute a pyalex Works query and return the list of results.
+
+        With ``slim_works`` the API is asked only for WORK_FIELDS and nested
+        objects are pruned to what the matcher reads (see ``slim_work``).
+        With ``response_cache`` the results are kept on disk by URL.
+        """
+        url = works_query.url
+        url = f"{url}{'&' if '?' in url else '?'}per-page={per_page}"
+        if page > 1:
+            url = f"{url}&page={page}"
+        if self.config.slim_works:
+            url = f"{url}&select={','.join(WORK_FIELDS)}"
+        url = self._rebase_url(url)
+        if self._response_cache is not None:
+            cached = self._response_cache.get(url)
+            if cached is not None:
+                return cached
+        headers = self._auth_headers()
+        body = self._breaker.call(lambda: self._get_json(url, headers))
+        results = body.get("results", [])
+        if self.config.slim_works:
+            results = [slim_work(work) for work in results]
+        if self._response_cache is not None:
+            self._response_cache.put(url, results)
+        return results
+
+    def _get_json(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """
+        One GET, bounded by the active study/run deadline if there is one.
+
+        Under a deadline the transport makes single attempts and the retries
+        happen here, so that no attempt, backoff or Retry-After wait runs past
+        the time left; a retry that would not fit fails fast instead.
+        """
+        deadline = current_deadline()
+        if deadline is None:
+            return self._transport.get_json(url, headers)
+        retry_codes = set(self.config.retry_http_codes or DEFAULT_RETRY_CODES)
+        attempt = 0
+        while True:
+            deadline.check("OpenAlex request")
+            # Sync HTTP cannot be interrupted, so cap the socket timeout at the time left
+            timeout = min(self.config.request_timeout, deadline.remaining())
+            try:
+                return self._transport.get_json(url, headers, timeout, retry=False)
+            except TransientRepositoryError as e:
+                if deadline.expired:
+                    raise DeadlineExceededError(f"Deadline exceeded during OpenAlex request: {e}") from e
+                retryable = e.status_code is None or e.status_code in retry_codes
+                if not retryable or attempt >= self.config.max_retries:
+                    raise
+                delay = e.retry_after
+                if delay is None:
+                    delay = self.config.retry_backoff_factor * (2**attempt)
+                if delay >= deadline.remaining():
+                    raise DeadlineExceededError(
+                        f"Deadline leaves no time to retry OpenAlex request: {e}"
+                    ) from e
+                time.sleep(delay)
+                attempt += 1
+
+    def _search_works(
+        self,
+        search: str,
+        works_query: Any,
+        title: str,
+        year: Optional[int] = None,
+        author_query: Optional[str] = None,
+        page: int = 1,
+        per_page: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run a relevance-sorted title search, answering it from the query cache if possible."""
+        works_query = works_query.sort(relevance_score="desc")
+        per_page = per_page or self.page_size(search)
+        # Only first pages are cached; completeness is judged on them
+        if self._query_cache is None or page > 1:
+            return self._get_works(works_query, per_page=per_page, page=page)
+        cached = self._query_cache.get(title, year, author_query, per_page)
+        if cached is not None:
+            logger.debug(f"Query cache hit for title='{title[:40]}', year={year}, authors={author_query is not None}")
+            return cached
+        results = self._get_works(works_query, per_page=per_page)
+        self._query_cache.put(title, year, author_query, results, complete=len(results) < per_page)
+        return results
+
+    def page_size(self, search: str) -> int:
+        """Current ``per_page`` for a ``search_by_*`` method."""
+        return self._page_sizes.per_page(search) if self._page_sizes else PER_PAGE
+
+    def record_match_rank(self, search: str, rank: int) -> None:
+        if self._page_sizes is not None:
+            self._page_sizes.record(search, rank)
+
+    def record_match_miss(self, search: str, seen: int) -> None:
+        if self._page_sizes is not None:
+            self._page_sizes.record_miss(search, seen)
+
+    def more_pages(
+        self, search: str, *args: Any, seen: int, max_pages: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Lazily fetch further pages of a ``search_by_*`` method while pages come back full."""
+        method = getattr(self, search)
+        if not seen or seen < self.page_size(search):
+            return
+        # The first page was full, so its length is the page size; keep it so offsets line up
+        per_page = seen
+        page = 1
+        while page < max_pages and seen >= page * per_page:
+            page += 1
+            results = method(*args, page=page, per_page=per_page)
+            seen += len(results)
+            yield results
+
+    def close(self) -> None:
+        """Close the connection pool and the response cache."""
+        self._transport.close()
+        if self._response_cache is not None:
+            self._response_cache.close()
+
+    @staticmethod
+    def _build_headers(config: Config) -> Dict[str, str]:
+        """Polite-pool, API key and user-agent headers, as pyalex would send them."""
+        headers = {"User-Agent": config.user_agent or f"pyalex/{pyalex.__version__}"}
+        if config.openalex_api_key:
+            headers["Authorization"] = f"Bearer {config.openalex_api_key}"
+        if config.openalex_email:
+            headers["From"] = config.openalex_email
+        return headers
+
+    def _auth_headers(self) -> Dict[str, str]:
+        return dict(self._headers)
 
     def _log_api_call(
         self,
@@ -56,6 +267,20 @@ class OpenAlexRepository(PublicationRepository):
             f"API Call ({status}): {method}({param_str}){count_str}{error_str}"
         )
 
+    def _get_by_identifier(self, kind: str, value: str) -> Optional[Dict[str, Any]]:
+        """One work by DOI or PMID, batched with concurrent lookups when enabled."""
+        if self._identifiers is not None:
+            return self._identifiers.lookup(kind, value)
+        results = self._get_works(pyalex.Works().filter(**{kind: value}), per_page=1)
+        return results[0] if results else None
+
+    def _fetch_identifiers(self, kind: str, values: List[str]) -> List[Dict[str, Any]]:
+        """Works for several DOIs or PMIDs in one OR-filter request."""
+        if self.metrics is not None:
+            self.metrics.record_identifier_batch(len(values))
+        query = pyalex.Works().filter(**{kind: "|".join(values)})
+        return self._get_works(query, per_page=len(values))
+
     def get_by_doi(self, doi: str) -> Optional[Dict[str, Any]]:
         """Get publication by DOI."""
         if not doi or not doi.strip():
@@ -65,14 +290,17 @@ class OpenAlexRepository(PublicationRepository):
         params = {"doi": normalized_doi}
         try:
             # Use get(return_meta=False) if you only need the first item
-            results = pyalex.Works().filter(doi=normalized_doi).get(per_page=1)
-            result = results[0] if results else None
+            result = self._get_by_identifier("doi", normalized_doi)
             self._log_api_call(
                 "get_by_doi",
                 params,
-                result_count=len(results) if results else 0,
+                result_count=1 if result else 0,
             )
             return result
+        except RepositoryError as e:
+            # Failed calls must not look like "no results"; callers decide what to do
+            self._log_api_call("get_by_doi", params, error=e)
+            raise
         except Exception as e:
             self._log_api_call("get_by_doi", params, error=e)
             logger.error(
@@ -91,16 +319,16 @@ class OpenAlexRepository(PublicationRepository):
             return None
         params = {"pmid": normalized_pmid}
         try:
-            results = (
-                pyalex.Works().filter(pmid=normalized_pmid).get(per_page=1)
-            )
-            result = results[0] if results else None
+            result = self._get_by_identifier("pmid", normalized_pmid)
             self._log_api_call(
                 "get_by_pmid",
                 params,
-                result_count=len(results) if results else 0,
+                result_count=1 if result else 0,
             )
             return result
+        except RepositoryError as e:
+            self._log_api_call("get_by_pmid", params, error=e)
+            raise
         except Exception as e:
             self._log_api_call("get_by_pmid", params, error=e)
             logger.error(
@@ -199,7 +427,7 @@ class OpenAlexRepository(PublicationRepository):
         return final_query
 
     def search_by_title_authors_year(
-        self, title: str, authors: List[str], year: int
+        self, title: str, authors: List[str], year: int, page: int = 1, per_page: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Search by title, authors (with variations), and year."""
         logger.debug(
@@ -234,6 +462,8 @@ class OpenAlexRepository(PublicationRepository):
             "author_query": author_query,
             "year": year,
         }
+        if page > 1:
+            params["page"] = page
         try:
             works_query = pyalex.Works().search_filter(title=normalized_title)
             works_query = works_query.filter(
@@ -243,7 +473,10 @@ class OpenAlexRepository(PublicationRepository):
             logger.debug(
                 f"Constructed pyalex query: Works().search_filter(title=...).filter(raw_author_name={{'search': ...}}).filter(publication_year={year})"
             )
-            results = works_query.sort(relevance_score="desc").get(per_page=25)
+            results = self._search_works(
+                "search_by_title_authors_year", works_query, normalized_title, year, author_query,
+                page=page, per_page=per_page,
+            )
 
             self._log_api_call(
                 "search_by_title_authors_year",
@@ -256,6 +489,9 @@ class OpenAlexRepository(PublicationRepository):
             )  # Trace bo może być dużo danych
             # <<< ----------------------------- >>>
             return results
+        except RepositoryError as e:
+            self._log_api_call("search_by_title_authors_year", params, error=e)
+            raise
         except Exception as e:
             self._log_api_call("search_by_title_authors_year", params, error=e)
             logger.error(
@@ -265,7 +501,7 @@ class OpenAlexRepository(PublicationRepository):
             return []
 
     def search_by_title_authors(
-        self, title: str, authors: List[str]
+        self, title: str, authors: List[str], page: int = 1, per_page: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Search by title and authors (with variations)."""
         logger.debug(
@@ -291,6 +527,8 @@ class OpenAlexRepository(PublicationRepository):
             return []
 
         params = {"title": normalized_title, "author_query": author_query}
+        if page > 1:
+            params["page"] = page
         try:
             works_query = pyalex.Works().search_filter(title=normalized_title)
             works_query = works_query.filter(
@@ -299,7 +537,10 @@ class OpenAlexRepository(PublicationRepository):
             logger.debug(
                 "Constructed pyalex query: Works().search_filter(title=...).filter(raw_author_name={'search': ...})"
             )
-            results = works_query.sort(relevance_score="desc").get(per_page=25)
+            results = self._search_works(
+                "search_by_title_authors", works_query, normalized_title,
+                author_query=author_query, page=page, per_page=per_page,
+            )
 
             self._log_api_call(
                 "search_by_title_authors", params, result_count=len(results)
@@ -310,6 +551,9 @@ class OpenAlexRepository(PublicationRepository):
             )
             # <<< ----------------------------- >>>
             return results
+        except RepositoryError as e:
+            self._log_api_call("search_by_title_authors", params, error=e)
+            raise
         except Exception as e:
             self._log_api_call("search_by_title_authors", params, error=e)
             logger.error(
@@ -319,7 +563,7 @@ class OpenAlexRepository(PublicationRepository):
             return []
 
     def search_by_title_year(
-        self, title: str, year: int
+        self, title: str, year: int, page: int = 1, per_page: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Search by title and year."""
         logger.debug(
@@ -339,13 +583,18 @@ class OpenAlexRepository(PublicationRepository):
             return []
 
         params = {"title": normalized_title, "year": year}
+        if page > 1:
+            params["page"] = page
         try:
             works_query = pyalex.Works().search_filter(title=normalized_title)
             works_query = works_query.filter(publication_year=year)
             logger.debug(
                 f"Constructed pyalex query: Works().search_filter(title=...).filter(publication_year={year})"
             )
-            results = works_query.sort(relevance_score="desc").get(per_page=25)
+            results = self._search_works(
+                "search_by_title_year", works_query, normalized_title, year,
+                page=page, per_page=per_page,
+            )
 
             self._log_api_call(
                 "search_by_title_year", params, result_count=len(results)
@@ -354,6 +603,9 @@ class OpenAlexRepository(PublicationRepository):
                 f"API raw results for TY ({title[:20]}...): {results}"
             )
             return results
+        except RepositoryError as e:
+            self._log_api_call("search_by_title_year", params, error=e)
+            raise
         except Exception as e:
             self._log_api_call("search_by_title_year", params, error=e)
             logger.error(
@@ -364,7 +616,9 @@ class OpenAlexRepository(PublicationRepository):
 
     # Removed search_by_title_journal method
 
-    def search_by_title(self, title: str) -> List[Dict[str, Any]]:
+    def search_by_title(
+        self, title: str, page: int = 1, per_page: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Search by title only."""
         logger.debug(f"Executing search_by_title with title='{title}'")
         if not title or not title.strip():
@@ -378,12 +632,16 @@ class OpenAlexRepository(PublicationRepository):
             return []
 
         params = {"title": normalized_title}
+        if page > 1:
+            params["page"] = page
         try:
             works_query = pyalex.Works().search_filter(title=normalized_title)
             logger.debug(
                 "Constructed pyalex query: Works().search_filter(title=...)"
             )
-            results = works_query.sort(relevance_score="desc").get(per_page=25)
+            results = self._search_works(
+                "search_by_title", works_query, normalized_title, page=page, per_page=per_page
+            )
 
             self._log_api_call(
                 "search_by_title", params, result_count=len(results)
@@ -392,6 +650,9 @@ class OpenAlexRepository(PublicationRepository):
                 f"API raw results for TO ({title[:20]}...): {results}"
             )
             return results
+        except RepositoryError as e:
+            self._log_api_call("search_by_title", params, error=e)
+            raise
         except Exception as e:
             self._log_api_call("search_by_title", params, error=e)
             logger.error(
@@ -0,0 +1,120 @@
+# src/infrastructure/repositories/page_size_tuner.py
+"""Per-search page sizes learned from the rank at which matches are accepted."""
+
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Optional
+
+from loguru import logger
+
+from src.utils.metrics import percentile
+
+# Page sizes to choose from; the smallest one with enough headroom wins
+PAGE_SIZES = (5, 10, 25, 50)
+
+
+class PageSizeTuner:
+    """
+    Chooses ``per_page`` for each search method from observed match ranks.
+
+    Strategies report the 0-based rank of every accepted match, and every
+    search that returned results without one. A miss that filled its page
+    may have had its match just past the end, so it counts as a rank one past
+    the last result seen; counting only accepted matches would let a page
+    that shrank too far hide the very matches that would grow it again. Once
+    ``min_samples`` ranks are known for a search, its page size becomes the
+    smallest of PAGE_SIZES that is at least ``headroom`` times the p95 rank
+    (+1), so matches landing near the end of a page move the size up. With a
+    ``path`` the ranks are saved as JSON whenever a page size changes and
+    every ``save_every`` records, and loaded again on start-up.
+    """
+
+    def __init__(
+        self,
+        default: int = 25,
+        min_samples: int = 30,
+        headroom: float = 2.0,
+        window: int = 500,
+        path: Optional[Path] = None,
+        save_every: int = 100,
+    ):
+        self.default = default
+        self.min_samples = min_samples
+        self.headroom = headroom
+        self.window = window
+        self.path = path
+        self.save_every = save_every
+        self._lock = threading.Lock()
+        self._ranks: Dict[str, Deque[int]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._unsaved = 0
+        self._load()
+
+    def per_page(self, search: str) -> int:
+        with self._lock:
+            return self._sizes.get(search, self.default)
+
+    def record(self, search: str, rank: int) -> None:
+        """Record that a match for ``search`` was accepted at 0-based ``rank``."""
+        self._observe(search, rank)
+
+    def record_miss(self, search: str, seen: int) -> None:
+        """
+        Record that none of the ``seen`` results of ``search`` was accepted.
+
+        Only a full page says anything about depth: with fewer results than
+        the page size, every candidate was seen.
+        """
+        if seen and seen >= self.per_page(search):
+            self._observe(search, seen)
+
+    def _observe(self, search: str, rank: int) -> None:
+        with self._lock:
+            ranks = self._ranks.setdefault(search, deque(maxlen=self.window))
+            ranks.append(rank)
+            self._unsaved += 1
+            old = self._sizes.get(search, self.default)
+            new = self._choose(ranks)
+            if new != old:
+                logger.info(f"Page size for {search}: {old} -> {new}")
+                self._sizes[search] = new
+            if new != old or self._unsaved >= self.save_every:
+                self._save()
+
+    def _choose(self, ranks: Deque[int]) -> int:
+        if len(ranks) < self.min_samples:
+            return self.default
+        needed = (percentile(list(ranks), 0.95) + 1) * self.headroom
+        for size in PAGE_SIZES:
+            if size >= needed:
+                return size
+        return PAGE_SIZES[-1]
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            for search, ranks in data.get("ranks", {}).items():
+                self._ranks[search] = deque((int(r) for r in ranks), maxlen=self.window)
+                self._sizes[search] = self._choose(self._ranks[search])
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable page size file {self.path}: {e}")
+
+    def _save(self) -> None:
+        self._unsaved = 0
+        if self.path is None:
+            return
+        data = {
+            "page_sizes": dict(self._sizes),
+            "ranks": {search: list(ranks) for search, ranks in self._ranks.items()},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not save page sizes to {self.path}: {e}")
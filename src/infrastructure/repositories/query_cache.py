@@ -0,0 +1,147 @@
+# src/infrastructure/repositories/query_cache.py
+"""Subsumption-aware cache for OpenAlex title searches."""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from cachetools import LRUCache
+
+from src.utils.text_normalizer import TextNormalizer
+
+# (normalized title, publication year or None, author query or None)
+QueryKey = Tuple[str, Optional[int], Optional[str]]
+
+
+@dataclass(frozen=True)
+class CachedQuery:
+    results: Tuple[Dict[str, Any], ...]
+    complete: bool  # The API returned fewer results than requested
+
+
+def _name_matches(variation: List[str], name_tokens: List[str]) -> bool:
+    """Every token of the variation appears in the name; single letters match as initials."""
+    for token in variation:
+        if len(token) == 1:
+            if not any(t.startswith(token) for t in name_tokens):
+                return False
+        elif token not in name_tokens:
+            return False
+    return True
+
+
+def _matches_authors(work: Dict[str, Any], variations: List[List[str]]) -> Optional[bool]:
+    """Whether a work has an author matching one variation; None if it cannot be told."""
+    authorships = work.get("authorships")
+    if authorships is None:
+        return None
+    for authorship in authorships:
+        author = authorship.get("author") or {}
+        for raw in (authorship.get("raw_author_name"), author.get("display_name")):
+            name_tokens = TextNormalizer.normalize_text(raw).split()
+            if name_tokens and any(_name_matches(v, name_tokens) for v in variations):
+                return True
+    return False
+
+
+class QueryCache:
+    """
+    LRU cache of title searches that also answers narrower queries.
+
+    Title searches nest: the title-only result set contains every title+year
+    and title+authors(+year) result for the same normalized title. When a
+    broader result set is cached and complete (shorter than the page size, so
+    nothing was cut off), a narrower query is answered by filtering it on
+    ``publication_year`` and author names. Author matching approximates the
+    API's ``raw_author_name`` search; if a cached work has no authorships to
+    check, the cache declines and the query goes to the API. An exact hit
+    that was cut off at a smaller page size than the caller now asks for is
+    a miss too, since the bigger page may hold more results.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._lock = threading.Lock()
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self.hits = 0
+        self.subsumed_hits = 0
+
+    def get(
+        self,
+        title: str,
+        year: Optional[int] = None,
+        author_query: Optional[str] = None,
+        per_page: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Cached or derived results for the query, or None on a miss.
+
+        With ``per_page``, results are limited to that page size, as the API
+        would return them.
+        """
+        key = (title, year, author_query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.complete or per_page is None or len(entry.results) >= per_page
+            ):
+                self.hits += 1
+                return [dict(w) for w in entry.results[:per_page]]
+            for broader in self._broader_keys(key):
+                entry = self._entries.get(broader)
+                if entry is None or not entry.complete:
+                    continue
+                results = self._filter(entry.results, year, author_query, broader)
+                if results is not None:
+                    self.subsumed_hits += 1
+                    return results[:per_page]
+        return None
+
+    def put(
+        self,
+        title: str,
+        year: Optional[int],
+        author_query: Optional[str],
+        results: Iterable[Dict[str, Any]],
+        complete: bool,
+    ) -> None:
+        # Copies: strategies annotate the dicts they get back
+        entry = CachedQuery(tuple(dict(w) for w in results), complete)
+        with self._lock:
+            self._entries[(title, year, author_query)] = entry
+
+    @staticmethod
+    def _broader_keys(key: QueryKey) -> List[QueryKey]:
+        title, year, author_query = key
+        keys = []
+        if author_query is not None:
+            keys.append((title, year, None))
+        if year is not None:
+            keys.append((title, None, author_query))
+        if year is not None and author_query is not None:
+            keys.append((title, None, None))
+        return keys
+
+    @staticmethod
+    def _filter(
+        works: Tuple[Dict[str, Any], ...],
+        year: Optional[int],
+        author_query: Optional[str],
+        broader: QueryKey,
+    ) -> Optional[List[Dict[str, Any]]]:
+        _, broader_year, broader_authors = broader
+        check_year = year is not None and broader_year is None
+        variations = None
+        if author_query is not None and broader_authors is None:
+            variations = [v.split() for v in author_query.split("|") if v.strip()]
+        results = []
+        for work in works:
+            if check_year and work.get("publication_year") != year:
+                continue
+            if variations is not None:
+                matched = _matches_authors(work, variations)
+                if matched is None:
+                    return None
+                if not matched:
+                    continue
+            results.append(dict(work))
+        return results
@@ -0,0 +1,197 @@
+# src/infrastructure/repositories/response_cache.py
+"""On-disk cache of OpenAlex work responses, stored compressed in SQLite."""
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+from loguru import logger
+
+try:  # Optional: pip install "openalex-py[compression]"
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+# Sizes for the trained zstd dictionary; OpenAlex works share most of their keys
+DICTIONARY_SIZE = 112 * 1024
+TRAIN_AFTER = 2000
+# Writes are committed in batches of this many puts, or after this many seconds
+COMMIT_EVERY = 100
+COMMIT_INTERVAL = 2.0
+EMPTY = orjson.dumps([])
+
+
+class ResponseCache:
+    """
+    Work lists keyed by request URL, compressed in a SQLite file.
+
+    Entries are zstd-compressed when ``zstandard`` is installed and zlib
+    otherwise; each row records its codec, so a file written with one codec
+    stays readable, and rows whose codec is unavailable are treated as
+    misses. With zstd, once ``train_after`` entries are stored a dictionary
+    is trained on a sample of them and used for every later write, which
+    shrinks small Work JSON bodies several-fold more than plain zstd.
+    Entries older than ``ttl`` seconds (0 = never) are misses; empty result
+    lists also expire after ``empty_ttl``, so works added to OpenAlex since
+    are found when a NOT_FOUND study is re-matched.
+
+    Puts are committed every ``commit_every`` writes or ``commit_interval``
+    seconds rather than one by one; ``flush`` and ``close`` commit the rest,
+    and a crash loses at most that batch of (re-fetchable) entries.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = 0.0,
+        train_after: int = TRAIN_AFTER,
+        clock: Callable[[], float] = time.time,
+        empty_ttl: float = 0.0,
+        commit_every: int = COMMIT_EVERY,
+        commit_interval: float = COMMIT_INTERVAL,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.empty_ttl = empty_ttl
+        self.train_after = train_after
+        self.clock = clock
+        self.commit_every = max(commit_every, 1)
+        self.commit_interval = commit_interval
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+        self._last_commit = clock()
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, codec TEXT NOT NULL, body BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS dictionaries (id INTEGER PRIMARY KEY, data BLOB NOT NULL)"
+        )
+        self._db.commit()
+        self._dictionaries: Dict[int, Any] = {}
+        self._dictionary_id: Optional[int] = None
+        self._load_dictionaries()
+
+    @property
+    def codec(self) -> str:
+        """Codec used for new entries."""
+        if zstandard is None:
+            return "zlib"
+        if self._dictionary_id is not None:
+            return f"zstd-dict:{self._dictionary_id}"
+        return "zstd"
+
+    def get(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT codec, body, stored_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None or (self.ttl and self.clock() - row[2] > self.ttl):
+                self.misses += 1
+                return None
+            data = self._decompress(row[0], row[1])
+            if data is None or (
+                data == EMPTY and self.empty_ttl and self.clock() - row[2] > self.empty_ttl
+            ):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return orjson.loads(data)
+
+    def put(self, url: str, results: List[Dict[str, Any]]) -> None:
+        data = orjson.dumps(results)
+        with self._lock:
+            codec = self.codec
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (url, codec, body, stored_at) VALUES (?, ?, ?, ?)",
+                (url, codec, self._compress(codec, data), self.clock()),
+            )
+            self._pending += 1
+            if (
+                self._pending >= self.commit_every
+                or self.clock() - self._last_commit >= self.commit_interval
+            ):
+                self._commit()
+            if zstandard is not None and self._dictionary_id is None:
+                count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                if count >= self.train_after:
+                    self._train_dictionary()
+
+    def size(self) -> Tuple[int, int]:
+        """(entries, compressed bytes) currently stored."""
+        with self._lock:
+            count, total = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+            ).fetchone()
+        return count, total
+
+    def flush(self) -> None:
+        """Commit puts still pending in the current batch."""
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._db.close()
+
+    def _commit(self) -> None:
+        """Called with the lock held."""
+        self._db.commit()
+        self._pending = 0
+        self._last_commit = self.clock()
+
+    def _compress(self, codec: str, data: bytes) -> bytes:
+        if codec == "zlib":
+            return zlib.compress(data, 6)
+        dictionary = self._dictionaries.get(self._dictionary_id) if codec != "zstd" else None
+        return zstandard.ZstdCompressor(level=6, dict_data=dictionary).compress(data)
+
+    def _decompress(self, codec: str, body: bytes) -> Optional[bytes]:
+        if codec == "zlib":
+            return zlib.decompress(body)
+        if zstandard is None:
+            return None
+        dictionary = None
+        if codec.startswith("zstd-dict:"):
+            dictionary = self._dictionaries.get(int(codec.split(":", 1)[1]))
+            if dictionary is None:
+                return None
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(body)
+
+    def _load_dictionaries(self) -> None:
+        if zstandard is None:
+            return
+        for dict_id, data in self._db.execute("SELECT id, data FROM dictionaries ORDER BY id"):
+            self._dictionaries[dict_id] = zstandard.ZstdCompressionDict(data)
+            self._dictionary_id = dict_id
+
+    def _train_dictionary(self) -> None:
+        """Train a zstd dictionary on stored bodies; called with the lock held."""
+        samples = []
+        for codec, body in self._db.execute(
+            "SELECT codec, body FROM responses ORDER BY RANDOM() LIMIT ?", (self.train_after,)
+        ):
+            data = self._decompress(codec, body)
+            if data is not None:
+                samples.append(data)
+        try:
+            trained = zstandard.train_dictionary(DICTIONARY_SIZE, samples)
+        except zstandard.ZstdError as e:
+            logger.warning(f"Could not train a response cache dictionary: {e}")
+            self.train_after *= 2
+            return
+        cursor = self._db.execute("INSERT INTO dictionaries (data) VALUES (?)", (trained.as_bytes(),))
+        self._db.commit()
+        self._dictionary_id = cursor.lastrowid
+        self._dictionaries[self._dictionary_id] = trained
+        logger.info(f"Trained response cache dictionary {self._dictionary_id} on {len(samples)} responses")
@@ -0,0 +1,233 @@
+# src/infrastructure/repositories/result_store.py
+"""Persistent, queryable store of matching results in SQLite."""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+from src.domain.enums.search_status import SearchStatus
+from src.domain.enums.study_type import StudyType
+from src.domain.models.search_result import SearchResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS studies (
+    review_id TEXT NOT NULL,
+    study_id TEXT NOT NULL,
+    study_type TEXT NOT NULL,
+    reference TEXT,
+    reference_hash TEXT,
+    PRIMARY KEY (review_id, study_id)
+);
+CREATE TABLE IF NOT EXISTS results (
+    review_id TEXT NOT NULL,
+    study_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    strategy TEXT,
+    openalex_id TEXT,
+    title TEXT,
+    journal TEXT,
+    year INTEGER,
+    doi TEXT,
+    pdf_url TEXT,
+    open_access INTEGER,
+    citation_count INTEGER,
+    matched_at TEXT,
+    search_details TEXT,
+    PRIMARY KEY (review_id, study_id)
+);
+CREATE TABLE IF NOT EXISTS search_attempts (
+    review_id TEXT NOT NULL,
+    study_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    strategy TEXT,
+    query_type TEXT,
+    search_term TEXT,
+    error TEXT,
+    attempt TEXT NOT NULL,
+    PRIMARY KEY (review_id, study_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_studies_study ON studies (study_id);
+CREATE INDEX IF NOT EXISTS idx_results_study ON results (study_id);
+CREATE INDEX IF NOT EXISTS idx_results_openalex ON results (openalex_id);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results (status, review_id);
+CREATE INDEX IF NOT EXISTS idx_results_strategy ON results (strategy, review_id);
+CREATE INDEX IF NOT EXISTS idx_attempts_strategy ON search_attempts (strategy);
+"""
+
+# Columns of ``results`` that filters may use
+FILTERS = ("review_id", "study_id", "status", "strategy", "openalex_id")
+
+
+def _json(value: Any) -> Optional[str]:
+    return orjson.dumps(value).decode() if value is not None else None
+
+
+def _value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+class ResultStore:
+    """
+    SQLite (WAL) store for results of many reviews.
+
+    Studies, results and search attempts live in separate tables, indexed
+    by review, study id, OpenAlex id, status and strategy, so questions such
+    as "every REJECTED study across all reviews" are answered by an index
+    scan. Writes are buffered and committed ``batch_size`` at a time in one
+    transaction; ``write`` is thread-safe and fits ``match_studies``'s
+    ``on_result`` via ``writer``. Writing a study again replaces it.
+    """
+
+    def __init__(self, path: Path, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, SearchResult]] = []
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, review_id: str, result: SearchResult) -> None:
+        """Queue a result; it is committed with the next full batch or ``flush``."""
+        with self._lock:
+            self._pending.append((review_id, result))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def writer(self, review_id: str):
+        """An ``on_result`` callback storing each result under ``review_id``."""
+        return lambda result: self.write(review_id, result)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._db.close()
+
+    def results(self, **filters: Any) -> List[SearchResult]:
+        """
+        Stored results matching every given filter, with their attempts.
+
+        Filters are any of FILTERS, e.g. ``results(status=SearchStatus.REJECTED)``.
+        Pending writes are flushed first.
+        """
+        unknown = set(filters) - set(FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown result filters: {sorted(unknown)}")
+        where = " AND ".join(f"r.{column} = ?" for column in filters) or "1"
+        params = [_value(v) for v in filters.values()]
+        with self._lock:
+            self._flush()
+            rows = self._db.execute(
+                "SELECT r.review_id, r.study_id, s.study_type, r.status, r.strategy, r.openalex_id, "
+                "r.pdf_url, r.title, r.journal, r.year, r.doi, r.open_access, r.citation_count, "
+                "r.search_details, s.reference, s.reference_hash, r.matched_at "
+                "FROM results r JOIN studies s USING (review_id, study_id) "
+                f"WHERE {where} ORDER BY r.review_id, r.study_id",
+                params,
+            ).fetchall()
+            attempts: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+            for review_id, study_id, attempt in self._db.execute(
+                "SELECT a.review_id, a.study_id, a.attempt "
+                "FROM search_attempts a JOIN results r USING (review_id, study_id) "
+                f"WHERE {where} ORDER BY a.review_id, a.study_id, a.position",
+                params,
+            ):
+                attempts.setdefault((review_id, study_id), []).append(orjson.loads(attempt))
+        return [self._to_result(row, attempts.get((row[0], row[1]), [])) for row in rows]
+
+    def previous(self, review_id: str) -> List[SearchResult]:
+        """Results of a review, ready for ``match_studies(previous=...)``."""
+        return self.results(review_id=review_id)
+
+    def counts(self, review_id: Optional[str] = None) -> Dict[str, int]:
+        """Number of results per status, for one review or all of them."""
+        sql = "SELECT status, COUNT(*) FROM results"
+        params: List[Any] = []
+        if review_id is not None:
+            sql += " WHERE review_id = ?"
+            params.append(review_id)
+        with self._lock:
+            self._flush()
+            return dict(self._db.execute(sql + " GROUP BY status", params).fetchall())
+
+    def _flush(self) -> None:
+        """Commit pending writes in one transaction; called with the lock held."""
+        if not self._pending:
+            return
+        # The last write of a study wins
+        latest = {(review_id, r.study_id): (review_id, r) for review_id, r in self._pending}
+        pending = list(latest.values())
+        self._pending = []
+        keys = list(latest)
+        studies = [
+            (review_id, r.study_id, _value(r.study_type), _json(r.original_reference), r.reference_hash)
+            for review_id, r in pending
+        ]
+        results = [
+            (
+                review_id, r.study_id, _value(r.status), r.strategy, r.openalex_id, r.title,
+                r.journal, r.year, r.doi, r.pdf_url, r.open_access, r.citation_count,
+                r.matched_at.isoformat() if r.matched_at else None, _json(r.search_details),
+            )
+            for review_id, r in pending
+        ]
+        attempts = [
+            (
+                review_id, r.study_id, position, a.get("strategy"), a.get("query_type"),
+                a.get("search_term"), a.get("error"), _json(a),
+            )
+            for review_id, r in pending
+            for position, a in enumerate(r.search_attempts or [])
+        ]
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM search_attempts WHERE review_id = ? AND study_id = ?", keys
+            )
+            self._db.executemany("INSERT OR REPLACE INTO studies VALUES (?, ?, ?, ?, ?)", studies)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", results
+            )
+            self._db.executemany(
+                "INSERT INTO search_attempts VALUES (?, ?, ?, ?, ?, ?, ?, ?)", attempts
+            )
+
+    @staticmethod
+    def _to_result(row: tuple, attempts: List[Dict[str, Any]]) -> SearchResult:
+        (_, study_id, study_type, status, strategy, openalex_id, pdf_url, title, journal, year,
+         doi, open_access, citation_count, details, reference, reference_hash, matched_at) = row
+        return SearchResult(
+            study_id=study_id,
+            study_type=StudyType(study_type),
+            status=SearchStatus(status),
+            strategy=strategy,
+            openalex_id=openalex_id,
+            pdf_url=pdf_url,
+            title=title,
+            journal=journal,
+            year=year,
+            doi=doi,
+            open_access=None if open_access is None else bool(open_access),
+            citation_count=citation_count,
+            search_details=orjson.loads(details) if details else None,
+            search_attempts=attempts,
+            original_reference=orjson.loads(reference) if reference else None,
+            reference_hash=reference_hash,
+            matched_at=datetime.fromisoformat(matched_at) if matched_at else None,
+        )
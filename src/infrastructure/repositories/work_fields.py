@@ -0,0 +1,56 @@
+# src/infrastructure/repositories/work_fields.py
+"""The slice of an OpenAlex work that the matcher reads."""
+
+from typing import Any, Dict, Iterable, Optional
+
+# Top-level fields requested with ``select=``; the API cannot select nested ones
+WORK_FIELDS = (
+    "id",
+    "doi",
+    "title",
+    "publication_year",
+    "publication_date",
+    "type",
+    "authorships",
+    "primary_location",
+    "open_access",
+    "cited_by_count",
+    "ids",
+)
+
+
+def _pick(data: Any, keys: Iterable[str]) -> Optional[Dict[str, Any]]:
+    if not isinstance(data, dict):
+        return data
+    return {key: data[key] for key in keys if key in data}
+
+
+def slim_work(work: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of ``work`` with only the fields the matcher reads.
+
+    Keeps id, title, year, date, type, DOI, PMID, author names, source
+    name, landing page, OA status and URL, and citation count; institutions,
+    concepts, locations, abstracts and the rest are dropped. Missing keys
+    stay missing, so ``.get`` defaults behave as on the full work.
+    """
+    slim = _pick(work, WORK_FIELDS)
+    if isinstance(work.get("authorships"), list):
+        slim["authorships"] = [
+            {
+                **_pick(authorship, ("raw_author_name",)),
+                "author": _pick(authorship.get("author"), ("display_name",)) or {},
+            }
+            for authorship in work["authorships"]
+            if isinstance(authorship, dict)
+        ]
+    location = work.get("primary_location")
+    if isinstance(location, dict):
+        slim["primary_location"] = _pick(location, ("landing_page_url",))
+        if "source" in location:
+            slim["primary_location"]["source"] = _pick(location["source"], ("display_name",))
+    if "ids" in work:
+        slim["ids"] = _pick(work["ids"], ("pmid",))
+    if "open_access" in work:
+        slim["open_access"] = _pick(work["open_access"], ("is_oa", "oa_url"))
+    return slim
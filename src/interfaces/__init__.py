@@ -0,0 +1 @@
+"""Interface layer package: entry points such as the match server."""
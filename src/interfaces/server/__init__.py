@@ -0,0 +1,4 @@
+# src/interfaces/server/__init__.py
+from .match_server import MatchServer, create_app, run_server
+
+__all__ = ["MatchServer", "create_app", "run_server"]
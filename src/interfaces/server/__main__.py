@@ -0,0 +1,18 @@
+# src/interfaces/server/__main__.py
+"""Run the matching server: python -m src.interfaces.server --port 8080"""
+
+import argparse
+
+from .match_server import run_server
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args(argv)
+    run_server(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# src/interfaces/server/match_server.py
+"""Long-running HTTP matching server sharing one warm MatchingService."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+import orjson
+from aiohttp import web
+from loguru import logger
+
+from src.application.services.matching_service import MatchingService
+from src.domain.enums.study_type import StudyType
+from src.domain.models.config import Config
+from src.domain.models.reference import Reference
+from src.domain.models.search_result import SearchResult
+from src.domain.models.study import Study
+
+NDJSON = "application/x-ndjson"
+
+
+def parse_batch(body: Any) -> Tuple[List[Study], Optional[str]]:
+    """
+    Studies and review id from a ``POST /match`` body.
+
+    The body is a list of references in the ``Reference.from_json`` shape,
+    or ``{"references": [...], "review_id": ..., "study_type": ...}``. A
+    reference may carry its own ``study_id``; otherwise its position in the
+    batch is used. Raises ValueError for anything else.
+    """
+    if isinstance(body, list):
+        body = {"references": body}
+    if not isinstance(body, dict) or not isinstance(body.get("references"), list):
+        raise ValueError('Expected a list of references or {"references": [...]}')
+    review_id = body.get("review_id")
+    if review_id is not None and not isinstance(review_id, str):
+        raise ValueError("review_id must be a string")
+    study_type = StudyType.from_string(str(body.get("study_type", StudyType.INCLUDED.value)))
+    studies = []
+    for index, data in enumerate(body["references"]):
+        if not isinstance(data, dict):
+            raise ValueError(f"Reference {index} is not an object")
+        studies.append(
+            Study(
+                id=str(data.get("study_id", index)),
+                type=study_type,
+                reference=Reference.from_json(data),
+            )
+        )
+    return studies, review_id
+
+
+class MatchServer:
+    """
+    Runs batches posted by any number of callers on one MatchingService.
+
+    The service lives as long as the process, so its connection pool,
+    circuit breaker, query and response caches, learned page sizes and
+    metrics stay warm across requests. Up to ``server_max_batches`` batches
+    run at once, each with the service's own concurrency and its own run
+    state (run deadline, strategy advisor); later ones wait their turn, in
+    arrival order. A batch whose client disconnects keeps running, and
+    keeps its slot, until it finishes. With ``results_db``
+    and a ``review_id``, the review's stored results are passed as
+    ``previous``, so unchanged references are answered without searching.
+    """
+
+    def __init__(self, service: MatchingService):
+        self.service = service
+        max_batches = service.config.server_max_batches
+        self._executor = ThreadPoolExecutor(max_workers=max_batches, thread_name_prefix="match")
+        self._slots = asyncio.Semaphore(max_batches)
+        self.pending = 0
+
+    def match(
+        self,
+        studies: List[Study],
+        review_id: Optional[str],
+        on_result: Callable[[SearchResult], None],
+    ) -> List[SearchResult]:
+        previous = None
+        if self.service.result_store is not None and review_id is not None:
+            previous = self.service.result_store.previous(review_id)
+        return self.service.match_studies(
+            studies, on_result=on_result, previous=previous, review_id=review_id
+        )
+
+    async def handle_match(self, request: web.Request) -> web.StreamResponse:
+        """Match a batch, streaming each final result as one NDJSON line."""
+        try:
+            studies, review_id = parse_batch(orjson.loads(await request.read()))
+        except (orjson.JSONDecodeError, ValueError) as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        response = web.StreamResponse(headers={"Content-Type": NDJSON})
+        await response.prepare(request)
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Optional[SearchResult]]" = asyncio.Queue()
+        # Set once nobody reads the queue any more (e.g. the client disconnected)
+        stopped = threading.Event()
+
+        def on_result(result: SearchResult) -> None:
+            if not stopped.is_set():
+                loop.call_soon_threadsafe(queue.put_nowait, result)
+
+        self.pending += 1
+        try:
+            async with self._slots:
+                run = loop.run_in_executor(self._executor, self.match, studies, review_id, on_result)
+                # Scheduled after every on_result call, so the sentinel comes last
+                run.add_done_callback(lambda _: queue.put_nowait(None))
+                awaited = False
+                try:
+                    while (result := await queue.get()) is not None:
+                        await response.write(orjson.dumps(result.to_json()) + b"\n")
+                    awaited = True
+                    try:
+                        await run
+                    except Exception as e:
+                        # Headers are already sent, so the failure is reported in-band
+                        logger.exception(f"Batch of {len(studies)} studies failed: {e}")
+                        await response.write(orjson.dumps({"error": str(e)}) + b"\n")
+                finally:
+                    if not awaited:
+                        # The executor keeps running the batch after a disconnect;
+                        # hold the slot until it is done, so pending stays truthful
+                        stopped.set()
+                        try:
+                            await asyncio.shield(run)
+                        except Exception as e:
+                            logger.exception(f"Batch of {len(studies)} studies failed after its client left: {e}")
+        finally:
+            self.pending -= 1
+        await response.write_eof()
+        return response
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok", "pending_batches": self.pending})
+
+    async def close(self, app: web.Application) -> None:
+        """Finish running batches, then close the service."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self.service.close()
+
+
+def create_app(
+    config: Optional[Config] = None, service: Optional[MatchingService] = None
+) -> web.Application:
+    """The aiohttp application: ``POST /match`` and ``GET /health``."""
+    if service is None:
+        config = config or Config.from_env()
+        service = MatchingService(config, concurrent_runs=config.server_max_batches)
+    server = MatchServer(service)
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_post("/match", server.handle_match)
+    app.router.add_get("/health", server.handle_health)
+    app.on_cleanup.append(server.close)
+    return app
+
+
+def run_server(host: str = "127.0.0.1", port: int = 8080, config: Optional[Config] = None) -> None:
+    web.run_app(create_app(config), host=host, port=port)
@@ -1,6 +1,18 @@
 # src/utils/__init__.py
+from .deadline import Deadline, current_deadline, deadline_scope
 from .dict_helpers import add_optional_field
+from .metrics import RunMetrics
+from .profiler import RunProfiler
 from .report_formatter import ReportFormatter
 from .text_normalizer import TextNormalizer
 
-__all__ = ["add_optional_field", "ReportFormatter", "TextNormalizer"]
+__all__ = [
+    "add_optional_field",
+    "current_deadline",
+    "Deadline",
+    "deadline_scope",
+    "ReportFormatter",
+    "RunMetrics",
+    "RunProfiler",
+    "TextNormalizer",
+]
@@ -0,0 +1,62 @@
+# src/utils/deadline.py
+"""Time budgets for studies and runs, visible to code running in the same context."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from src.domain.exceptions import DeadlineExceededError
+
+_current: ContextVar[Optional["Deadline"]] = ContextVar("deadline", default=None)
+
+
+class Deadline:
+    """An absolute point in time (on ``clock``) after which work should stop."""
+
+    def __init__(self, expires_at: float, clock: Callable[[], float] = time.monotonic):
+        self.expires_at = expires_at
+        self.clock = clock
+
+    @classmethod
+    def after(
+        cls, seconds: Optional[float], clock: Callable[[], float] = time.monotonic
+    ) -> Optional["Deadline"]:
+        """A deadline ``seconds`` from now, or None for a budget of 0/None (unlimited)."""
+        if not seconds:
+            return None
+        return cls(clock() + seconds, clock)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - self.clock(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.clock() >= self.expires_at
+
+    def check(self, what: str = "operation") -> None:
+        """Raise DeadlineExceededError if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceededError(f"Deadline exceeded before {what}")
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The innermost active deadline, or None when no budget applies."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(*deadlines: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Make the earliest of ``deadlines`` (and any enclosing scope) current.
+
+    Context variables do not follow work into thread pools, so code that
+    hands work to another thread should pass the deadline along explicitly.
+    """
+    candidates = [d for d in (*deadlines, _current.get()) if d is not None]
+    deadline = min(candidates, key=lambda d: d.expires_at) if candidates else None
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
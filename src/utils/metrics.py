@@ -0,0 +1,187 @@
+# src/utils/metrics.py
+"""Thread-safe run metrics for OpenAlex requests and batch execution."""
+
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Status recorded for requests that failed without an HTTP response
+CONNECTION_ERROR = 0
+
+RequestListener = Callable[[int, Optional[float]], None]
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0.0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(int(fraction * len(ordered)), len(ordered) - 1)
+    return ordered[index]
+
+
+class RunMetrics:
+    """
+    Counters and gauges for one matching run.
+
+    Transports report every HTTP attempt through ``record_request``; listeners
+    get the same feed. ``subscribe`` listens to every request, while
+    ``listening`` scopes a listener to the current context, so the adaptive
+    controller of one run (e.g. a server batch) only sees that run's
+    requests. A request shared by several runs, such as a batched DOI
+    lookup, reaches only the ``subscribe`` listeners.
+
+    Counters accumulate for the life of the object, but throughput and time
+    to first result are timed per run (``begin_run``/``end_run``), so a
+    long-lived service reports the current run rather than an average since
+    it started. Runs that overlap share one timing window.
+    """
+
+    def __init__(self, latency_window: int = 1000):
+        self._lock = threading.Lock()
+        self._listeners: List[RequestListener] = []
+        self._scoped: ContextVar[Tuple[RequestListener, ...]] = ContextVar(
+            f"run_metrics_listeners_{id(self)}", default=()
+        )
+        self._latencies: deque = deque(maxlen=latency_window)
+        self.started_at = time.perf_counter()
+        self._ended_at: Optional[float] = None
+        self._active_runs = 0
+        self._studies_before_run = 0
+        self.requests = 0
+        self.statuses: Counter = Counter()
+        self.studies_completed = 0
+        self.first_study_at: Optional[float] = None
+        self.study_statuses: Counter = Counter()
+        self.deferrals = 0
+        self.concurrency = 0
+        self.peak_concurrency = 0
+        self.circuit_state = "closed"
+        self.circuit_opens = 0
+        self.hedges = 0
+        self.hedges_won = 0
+        self.identifier_batches = 0
+        self.identifiers_batched = 0
+
+    def begin_run(self) -> None:
+        """Start timing a run, unless another run is still going."""
+        with self._lock:
+            if self._active_runs == 0:
+                self.started_at = time.perf_counter()
+                self._ended_at = None
+                self.first_study_at = None
+                self._studies_before_run = self.studies_completed
+            self._active_runs += 1
+
+    def end_run(self) -> None:
+        """Stop the run timing once the last overlapping run has finished."""
+        with self._lock:
+            self._active_runs = max(self._active_runs - 1, 0)
+            if self._active_runs == 0:
+                self._ended_at = time.perf_counter()
+
+    def subscribe(self, listener: RequestListener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: RequestListener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    @contextmanager
+    def listening(self, listener: Optional[RequestListener]) -> Iterator[None]:
+        """Feed ``listener`` the requests recorded in this context only."""
+        if listener is None:
+            yield
+            return
+        token = self._scoped.set(self._scoped.get() + (listener,))
+        try:
+            yield
+        finally:
+            self._scoped.reset(token)
+
+    def record_request(self, status: int, latency: Optional[float] = None) -> None:
+        """Record one HTTP attempt; ``latency`` is None for retried attempts."""
+        with self._lock:
+            self.requests += 1
+            self.statuses[status] += 1
+            if latency is not None:
+                self._latencies.append(latency)
+            listeners = list(self._listeners)
+        for listener in (*listeners, *self._scoped.get()):
+            listener(status, latency)
+
+    def record_study(self, status: Optional[str] = None) -> None:
+        """Record a study with its final status."""
+        with self._lock:
+            self.studies_completed += 1
+            if self.first_study_at is None:
+                self.first_study_at = time.perf_counter()
+            if status is not None:
+                self.study_statuses[str(getattr(status, "value", status))] += 1
+
+    def record_deferral(self) -> None:
+        """Record a study sent to the retry queue after a transient failure."""
+        with self._lock:
+            self.deferrals += 1
+
+    def set_concurrency(self, value: int) -> None:
+        with self._lock:
+            self.concurrency = value
+            self.peak_concurrency = max(self.peak_concurrency, value)
+
+    def record_hedge(self, won: bool) -> None:
+        """Record a hedged request; ``won`` when the duplicate answered first."""
+        with self._lock:
+            self.hedges += 1
+            if won:
+                self.hedges_won += 1
+
+    def record_identifier_batch(self, size: int) -> None:
+        """Record one OR-filter request answering ``size`` DOI/PMID lookups."""
+        with self._lock:
+            self.identifier_batches += 1
+            self.identifiers_batched += size
+
+    def set_circuit_state(self, state: str) -> None:
+        with self._lock:
+            self.circuit_state = state
+            if state == "open":
+                self.circuit_opens += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of all metrics."""
+        with self._lock:
+            latencies = list(self._latencies)
+            elapsed = (self._ended_at or time.perf_counter()) - self.started_at
+            run_studies = self.studies_completed - self._studies_before_run
+            throttled = self.statuses.get(429, 0)
+            server_errors = sum(n for s, n in self.statuses.items() if s >= 500)
+            return {
+                "requests": self.requests,
+                "throttled": throttled,
+                "server_errors": server_errors,
+                "connection_errors": self.statuses.get(CONNECTION_ERROR, 0),
+                "latency_p50": percentile(latencies, 0.50),
+                "latency_p95": percentile(latencies, 0.95),
+                "studies_completed": self.studies_completed,
+                "deferrals": self.deferrals,
+                "failed": self.study_statuses.get("failed", 0),
+                "timeouts": self.study_statuses.get("timeout", 0),
+                "studies_per_sec": run_studies / elapsed if elapsed > 0 else 0.0,
+                "time_to_first_result": (
+                    self.first_study_at - self.started_at if self.first_study_at is not None else None
+                ),
+                "concurrency": self.concurrency,
+                "peak_concurrency": self.peak_concurrency,
+                "circuit_state": self.circuit_state,
+                "circuit_opens": self.circuit_opens,
+                "hedges": self.hedges,
+                "hedges_won": self.hedges_won,
+                "identifier_batches": self.identifier_batches,
+                "identifiers_batched": self.identifiers_batched,
+            }
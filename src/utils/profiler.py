@@ -0,0 +1,198 @@
+"""Optional profiling hooks for matching runs (cProfile or pyinstrument)."""
+
+import cProfile
+import json
+import os
+import pstats
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from src.domain.models.config import Config
+
+# Path fragments used to attribute profiled time to a component of the matcher.
+# Checked in order; the first match wins. Network libraries count as repository time.
+COMPONENT_PATTERNS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("normalization", ("text_normalizer",)),
+    ("strategy", ("domain/strategies",)),
+    ("repository", (
+        "infrastructure/",
+        "pyalex",
+        "requests",
+        "urllib3",
+        "http/client",
+        "ssl.py",
+        "socket.py",
+    )),
+    ("logging", ("loguru", "logging/")),
+)
+
+SAFE_LABEL_REGEX = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def categorize_path(file_path: Optional[str]) -> Optional[str]:
+    """Return the matcher component a source file belongs to, or None if unknown."""
+    if not file_path:
+        return None
+    normalized = file_path.replace(os.sep, "/")
+    for component, fragments in COMPONENT_PATTERNS:
+        if any(fragment in normalized for fragment in fragments):
+            return component
+    return None
+
+
+def attribute_pstats(stats: pstats.Stats) -> Dict[str, float]:
+    """
+    Sum self-time per component from cProfile statistics.
+
+    Built-in functions (C code such as regex or rapidfuzz calls) have no source
+    file, so their time is charged to the component of whoever called them.
+    """
+    buckets: Dict[str, float] = defaultdict(float)
+    for func, (_cc, _nc, tottime, _ct, callers) in stats.stats.items():
+        component = categorize_path(func[0])
+        if component is None and func[0] == "~" and callers:
+            for caller, edge in callers.items():
+                buckets[categorize_path(caller[0]) or "other"] += edge[2]
+            continue
+        buckets[component or "other"] += tottime
+    return dict(buckets)
+
+
+def attribute_pyinstrument(root_frame: Any) -> Dict[str, float]:
+    """Sum self-time per component from a pyinstrument frame tree."""
+    buckets: Dict[str, float] = defaultdict(float)
+    stack = [(root_frame, "other")]
+    while stack:
+        frame, parent_component = stack.pop()
+        if frame is None:
+            continue
+        children = list(getattr(frame, "children", []) or [])
+        self_time = frame.time - sum(child.time for child in children)
+        # Frames without a recognisable file inherit their caller's component
+        component = categorize_path(getattr(frame, "file_path", None)) or parent_component
+        buckets[component] += max(self_time, 0.0)
+        stack.extend((child, component) for child in children)
+    return dict(buckets)
+
+
+class RunProfiler:
+    """
+    Wraps a batch run or individual studies with a profiler, driven by Config.
+
+    Artifacts are written to ``<profile_output_dir>/<run_id>/``: a ``.pstats``
+    file (cProfile) or a speedscope ``.json`` file (pyinstrument), plus a
+    ``.summary.json`` with wall time and per-component attribution.
+
+    Both profilers only see the thread that started them, and only one can
+    run at a time: with concurrent studies, run scope misses the strategy
+    and HTTP time spent in worker threads, and study scope profiles one
+    study at a time while the others run unprofiled.
+    """
+
+    def __init__(self, config: Config):
+        self.mode = config.profile_mode
+        self.scope = config.profile_scope
+        self.output_dir = Path(config.profile_output_dir)
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        # Profilers cannot be nested or run in two threads at once
+        self._active = threading.Lock()
+
+        if self.mode == "pyinstrument":
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError:
+                logger.warning("pyinstrument is not installed; falling back to cProfile.")
+                self.mode = "cprofile"
+        if self.enabled and config.concurrency_mode != "sequential":
+            logger.warning(
+                f"Profiling with concurrency_mode={config.concurrency_mode}: only the profiling "
+                f"thread is recorded ({'the dispatcher' if self.scope == 'run' else 'one study at a time'}); "
+                "use concurrency_mode=sequential for a complete profile."
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @property
+    def run_dir(self) -> Path:
+        return self.output_dir / self.run_id
+
+    @contextmanager
+    def profile(self, label: str, scope: str) -> Iterator[None]:
+        """Profile the enclosed block if profiling is enabled for ``scope``."""
+        if not self.enabled or scope != self.scope or not self._active.acquire(blocking=False):
+            yield
+            return
+
+        safe_label = SAFE_LABEL_REGEX.sub("_", label) or "unnamed"
+        start = time.perf_counter()
+        try:
+            if self.mode == "pyinstrument":
+                with self._pyinstrument(safe_label, start):
+                    yield
+            else:
+                with self._cprofile(safe_label, start):
+                    yield
+        finally:
+            self._active.release()
+
+    @contextmanager
+    def _cprofile(self, label: str, start: float) -> Iterator[None]:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            wall_time = time.perf_counter() - start
+            try:
+                self.run_dir.mkdir(parents=True, exist_ok=True)
+                artifact = self.run_dir / f"{label}.pstats"
+                profiler.dump_stats(str(artifact))
+                attribution = attribute_pstats(pstats.Stats(profiler))
+                self._write_summary(label, artifact, wall_time, attribution)
+            except Exception as e:
+                logger.error(f"Failed to write cProfile artifacts for '{label}': {e}")
+
+    @contextmanager
+    def _pyinstrument(self, label: str, start: float) -> Iterator[None]:
+        from pyinstrument import Profiler
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            session = profiler.stop()
+            wall_time = time.perf_counter() - start
+            try:
+                self.run_dir.mkdir(parents=True, exist_ok=True)
+                artifact = self.run_dir / f"{label}.speedscope.json"
+                artifact.write_text(profiler.output(renderer=SpeedscopeRenderer()))
+                attribution = attribute_pyinstrument(session.root_frame())
+                self._write_summary(label, artifact, wall_time, attribution)
+            except Exception as e:
+                logger.error(f"Failed to write pyinstrument artifacts for '{label}': {e}")
+
+    def _write_summary(
+        self, label: str, artifact: Path, wall_time: float, attribution: Dict[str, float]
+    ) -> None:
+        summary = {
+            "label": label,
+            "mode": self.mode,
+            "artifact": artifact.name,
+            "wall_time": round(wall_time, 6),
+            "attribution": {k: round(v, 6) for k, v in sorted(attribution.items())},
+        }
+        summary_path = self.run_dir / f"{label}.summary.json"
+        summary_path.write_text(json.dumps(summary, indent=2))
+        logger.info(f"Profile for '{label}' written to {artifact} ({wall_time:.2f}s)")
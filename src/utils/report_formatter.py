@@ -21,6 +21,9 @@ EMOJI = {
     "NOT_FOUND": "❌",
     "REJECTED": "⚠️", # Warning sign for rejected
     "SKIPPED": "⏭️", # Skip track symbol
+    "DEFERRED": "⏳", # Hourglass: retry later
+    "FAILED": "🛑",
+    "TIMEOUT": "⏱️", # Stopwatch: time budget ran out
     "CONFIG": "⚙️",
     "THRESHOLDS": "📏",
     "STRATEGIES": "🧭",
@@ -28,6 +31,7 @@ EMOJI = {
     "SUMMARY": "📊",
     "STRATEGY_FLOW": "➡️",
     "SUGGESTIONS": "💡",
+    "METRICS": "📈",
 }
 
 # Colors for different statuses
@@ -36,6 +40,9 @@ STATUS_COLORS = {
     SearchStatus.NOT_FOUND: "red",
     SearchStatus.REJECTED: "yellow",
     SearchStatus.SKIPPED: "dim", # Dim for skipped
+    SearchStatus.DEFERRED: "magenta",
+    SearchStatus.FAILED: "bright_red",
+    SearchStatus.TIMEOUT: "dark_orange",
 }
 
 # Updated strategy names and status mapping
@@ -64,10 +71,14 @@ class ReportFormatter:
         self.console = Console()
         self.results: List[SearchResult] = []
         self.start_time: Optional[float] = None # Set when processing starts
+        self.metrics: Optional[Dict[str, Any]] = None # RunMetrics.snapshot(), if collected
 
     def add_results(self, results: List[SearchResult]) -> None:
         self.results = results
 
+    def add_metrics(self, metrics: Dict[str, Any]) -> None:
+        self.metrics = metrics
+
     def set_start_time(self, start_time: float) -> None:
         self.start_time = start_time
 
@@ -80,6 +91,9 @@ class ReportFormatter:
         self.console.print("\n")
         self.generate_statistics_panel()
         self.console.print("\n")
+        if self.metrics:
+            self.generate_metrics_panel()
+            self.console.print("\n")
 
     def render(self) -> None:
         """Render the report to the console."""
@@ -338,6 +352,9 @@ class ReportFormatter:
             f"  - Not Found: {status_counts.get(SearchStatus.NOT_FOUND, 0)} ({status_counts.get(SearchStatus.NOT_FOUND, 0)/total_studies*100:.1f}%)",
             f"  - Rejected: {status_counts.get(SearchStatus.REJECTED, 0)} ({status_counts.get(SearchStatus.REJECTED, 0)/total_studies*100:.1f}%)",
             f"  - Skipped: {status_counts.get(SearchStatus.SKIPPED, 0)} ({status_counts.get(SearchStatus.SKIPPED, 0)/total_studies*100:.1f}%)",
+            f"  - Deferred: {status_counts.get(SearchStatus.DEFERRED, 0)} ({status_counts.get(SearchStatus.DEFERRED, 0)/total_studies*100:.1f}%)",
+            f"  - Failed (API errors): {status_counts.get(SearchStatus.FAILED, 0)} ({status_counts.get(SearchStatus.FAILED, 0)/total_studies*100:.1f}%)",
+            f"  - Timed Out: {status_counts.get(SearchStatus.TIMEOUT, 0)} ({status_counts.get(SearchStatus.TIMEOUT, 0)/total_studies*100:.1f}%)",
             f"Found w/ PDF URL: {with_pdf_url}",
             f"Found w/ Open Access: {open_access}",
             f"Found w/ DOI: {with_doi}",
@@ -348,6 +365,27 @@ class ReportFormatter:
         panel = Panel(panel_content, title=panel_title, title_align="left", border_style="green")
         self.console.print(panel)
 
+    def generate_metrics_panel(self) -> None:
+        """Generate and print the API / concurrency metrics panel."""
+        panel_title = f"{EMOJI['METRICS']} Run Metrics"
+        m = self.metrics or {}
+        metrics_content = [
+            f"API Requests: {m.get('requests', 0)}",
+            f"  - Throttled (429): {m.get('throttled', 0)}",
+            f"  - Server Errors (5xx): {m.get('server_errors', 0)}",
+            f"  - Connection Errors: {m.get('connection_errors', 0)}",
+            f"Latency p50 / p95: {m.get('latency_p50', 0.0) * 1000:.0f}ms / {m.get('latency_p95', 0.0) * 1000:.0f}ms",
+            f"Throughput: {m.get('studies_per_sec', 0.0):.1f} studies/s",
+            f"Time to First Result: {m.get('time_to_first_result') or 0.0:.2f}s",
+            f"Deferred Retries: {m.get('deferrals', 0)} (failed after retries: {m.get('failed', 0)})",
+            f"Effective Concurrency: {m.get('concurrency', 0)} (peak {m.get('peak_concurrency', 0)})",
+            f"Circuit Breaker: {m.get('circuit_state', 'closed')} (opened {m.get('circuit_opens', 0)}x)",
+            f"Hedged Requests: {m.get('hedges', 0)} (won {m.get('hedges_won', 0)})",
+            f"Identifier Batches: {m.get('identifier_batches', 0)} ({m.get('identifiers_batched', 0)} lookups)",
+        ]
+        panel = Panel("\n".join(metrics_content), title=panel_title, title_align="left", border_style="cyan")
+        self.console.print(panel)
+
     def generate_improvement_suggestions(self, result: SearchResult) -> List[str]:
         """Generate improvement suggestions for a result."""
         suggestions = []
@@ -0,0 +1,25 @@
+"""Benchmark fixtures. Benchmarks only run with RUN_BENCHMARKS=1."""
+import os
+import sys
+
+import pytest
+from loguru import logger
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("RUN_BENCHMARKS") == "1":
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with RUN_BENCHMARKS=1")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    """Keep per-attempt INFO logging out of the measured loop."""
+    logger.remove()
+    handler_id = logger.add(sys.stderr, level="WARNING")
+    yield
+    logger.remove(handler_id)
+    logger.add(sys.stderr)
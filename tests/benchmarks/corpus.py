@@ -0,0 +1,80 @@
+"""Benchmark corpora: the bundled review and fake OpenAlex Works that match it.
+
+Larger synthetic corpora come from ``corpus_generator``.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.domain.enums.study_type import StudyType
+from src.domain.models.study import Study
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+BUNDLED_REVIEW = DATA_DIR / "antibiotics-for-sore-throat.json"
+
+AUTHOR_SPLIT_REGEX = re.compile(r",\s*|;\s*|\s+and\s+")
+
+
+def load_review(path: Path = BUNDLED_REVIEW) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def studies_from_review(review: Dict[str, Any]) -> List[Study]:
+    """Parse included and excluded studies the same way the matcher does."""
+    studies = []
+    for study_type in (StudyType.INCLUDED, StudyType.EXCLUDED):
+        for study_data in review.get("studies", {}).get(study_type.value, []):
+            studies.append(Study.from_json(study_data, study_type))
+    return studies
+
+
+def _display_name(author: str) -> str:
+    """Turn a RevMan "Surname INITIALS" string into an OpenAlex-style display name."""
+    parts = author.split()
+    if len(parts) >= 2 and parts[-1].isupper():
+        return f"{' '.join(parts[-1])} {' '.join(parts[:-1])}"
+    return author
+
+
+def work_for_study(study: Study, index: int) -> Dict[str, Any]:
+    """Build the OpenAlex Work record that the study's reference should resolve to."""
+    reference = study.reference
+    authors: List[str] = []
+    for entry in reference.authors or []:
+        authors.extend(a.strip() for a in AUTHOR_SPLIT_REGEX.split(entry) if a.strip())
+
+    work_id = f"https://openalex.org/W{9000000000 + index}"
+    return {
+        "id": work_id,
+        "doi": f"https://doi.org/{reference.doi.strip()}" if reference.doi else None,
+        "title": reference.title,
+        "display_name": reference.title,
+        "publication_year": reference.year,
+        "publication_date": f"{reference.year}-01-01" if reference.year else None,
+        "type": "article",
+        "ids": {
+            "openalex": work_id,
+            "pmid": f"https://pubmed.ncbi.nlm.nih.gov/{reference.pmid.strip()}" if reference.pmid else None,
+        },
+        "authorships": [
+            {"author": {"display_name": _display_name(author)}} for author in authors
+        ],
+        "primary_location": {
+            "source": {"display_name": reference.journal} if reference.journal else None,
+            "landing_page_url": None,
+        },
+        "open_access": {"is_oa": index % 3 == 0, "oa_url": None},
+        "cited_by_count": index % 250,
+    }
+
+
+def works_for_studies(studies: List[Study]) -> List[Dict[str, Any]]:
+    return [work_for_study(study, idx) for idx, study in enumerate(studies)]
+
+
+def ground_truth_for(studies: List[Study], works: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Map study ids to the Work built for them by ``works_for_studies``."""
+    return {study.id: work["id"] for study, work in zip(studies, works)}
@@ -0,0 +1,282 @@
+"""Synthetic RevMan-style review generator for load and accuracy testing.
+
+Produces review JSON in the ``studies.included/excluded[*].reference`` shape read
+by ``Study.from_json``, the OpenAlex Work records those references should
+resolve to (plus look-alike distractors), and the ground-truth mapping between
+them. Noise mimics real RevMan exports: "Bennike TBMK, Kjaer E" author strings,
+truncated titles, missing or off-by-one years and malformed DOIs.
+
+Usage::
+
+    python -m tests.benchmarks.corpus_generator --studies 10000 --out-dir corpus/
+"""
+
+import argparse
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+TITLE_WORDS = [
+    "randomised", "controlled", "trial", "penicillin", "amoxicillin", "cefuroxime",
+    "azithromycin", "placebo", "acute", "chronic", "tonsillitis", "pharyngitis",
+    "sore", "throat", "children", "adults", "general", "practice", "streptococcal",
+    "infection", "treatment", "therapy", "prevention", "outcome", "symptom",
+    "duration", "recurrence", "complications", "rheumatic", "fever", "otitis",
+    "media", "sinusitis", "quinsy", "antibiotic", "prescribing", "delayed",
+    "immediate", "comparison", "efficacy", "safety", "double", "blind",
+    "multicentre", "study", "evaluation", "primary", "care", "group", "beta",
+    "haemolytic", "clinical", "response", "short", "course", "versus", "days",
+    "oral", "intramuscular", "benzathine", "erythromycin", "cephalosporin",
+    "resistance", "carriage", "eradication", "bacteriological", "cure", "relapse",
+]
+# Syllables for rare, drug- or place-like title terms; real titles mix common
+# vocabulary with a few rare words, which is what keeps title search selective
+RARE_SYLLABLES = [
+    "am", "ce", "clo", "dox", "ery", "flu", "le", "mox", "ox", "pen", "stre",
+    "sul", "te", "van", "zi", "ka", "lor", "mi", "nor", "ta", "vel", "bra",
+]
+RARE_SUFFIXES = ["cillin", "mycin", "floxacin", "cycline", "zole", "ville", "berg", "dine"]
+
+SURNAMES = [
+    "Bennike", "Kjaer", "Skadhauge", "Trolle", "Little", "Williamson", "Warner",
+    "Zwart", "Rovers", "Dagnelie", "Melker", "Peterson", "Phillips", "Howe",
+    "Millar", "Dowell", "Pitkethly", "Schalen", "Eliasson", "Jensen", "Larsen",
+    "Shvartzman", "Tabenkin", "Kolobukhina", "Kapur", "Hannay", "Baxter",
+    "Nasonova", "Belov", "Leelarasamee", "Supajatura", "Pandraud", "Brink",
+    "Chapple", "Denny", "Landsman", "Middleton", "Petersen", "Siegel", "Whitfield",
+]
+FIRST_NAMES = [
+    "Anne", "Paul", "Chris", "Tove", "Erik", "Karen", "John", "Maria", "Sander",
+    "Pieter", "Lars", "Ingrid", "Helen", "Robert", "Olga", "Anil", "David",
+    "Gillian", "Vera", "Boris", "Somchai", "Louise", "Jan", "Eva", "Michael",
+]
+JOURNALS = [
+    "Acta Medica Scandinavica", "BMJ", "Lancet", "British Journal of General Practice",
+    "Journal of Pediatrics", "Pediatric Infectious Disease Journal",
+    "Family Practice", "Scandinavian Journal of Infectious Diseases",
+    "Journal of the American Medical Association", "Clinical Infectious Diseases",
+]
+
+
+@dataclass
+class NoiseProfile:
+    """Probabilities of each kind of reference noise (applied independently)."""
+
+    with_doi: float = 0.30
+    with_pmid: float = 0.15
+    bad_doi: float = 0.05
+    truncated_title: float = 0.10
+    missing_year: float = 0.08
+    wrong_year: float = 0.04
+    distractors_per_work: int = 1
+
+
+@dataclass
+class SyntheticCorpus:
+    """A generated review plus the Work records and ground truth behind it."""
+
+    review: Dict[str, Any]
+    works: List[Dict[str, Any]]
+    ground_truth: Dict[str, str] = field(default_factory=dict)
+
+
+class CorpusGenerator:
+    """Seeded generator of synthetic reviews and matching OpenAlex Works."""
+
+    def __init__(self, seed: int = 0, noise: Optional[NoiseProfile] = None):
+        self.rng = random.Random(seed)
+        self.noise = noise or NoiseProfile()
+        self._next_work = 0
+
+    def generate(self, n_studies: int, included_ratio: float = 0.4) -> SyntheticCorpus:
+        included: List[Dict[str, Any]] = []
+        excluded: List[Dict[str, Any]] = []
+        works: List[Dict[str, Any]] = []
+        ground_truth: Dict[str, str] = {}
+
+        for idx in range(n_studies):
+            authors = self._authors()
+            title = self._title()
+            year = self.rng.randint(1950, 2024)
+            journal = self.rng.choice(JOURNALS)
+            doi = f"10.{self.rng.randint(1000, 9999)}/synth.{idx:07d}"
+            pmid = str(10_000_000 + idx)
+
+            work = self._work(title, year, authors, journal, doi, pmid)
+            works.append(work)
+            for _ in range(self.noise.distractors_per_work):
+                works.append(self._distractor(title, year, journal))
+
+            surname = authors[0][1]
+            study_id = f"STD-{surname}-{year}-{idx}"
+            study = {
+                "study_id": study_id,
+                "name": f"{surname} {year}",
+                "year": year,
+                "reference": self._reference(title, year, authors, journal, doi, pmid),
+            }
+            ground_truth[study_id] = work["id"]
+
+            if self.rng.random() < included_ratio:
+                study["characteristics"] = {"methods": "Randomised controlled trial"}
+                included.append(study)
+            else:
+                study["reason_for_exclusion"] = "Not randomised"
+                excluded.append(study)
+
+        review = {
+            "metadata": {
+                "review_id": f"synthetic-{n_studies}",
+                "title": f"Synthetic review with {n_studies} studies",
+                "type": "INTERVENTION",
+            },
+            "studies": {"included": included, "excluded": excluded},
+        }
+        return SyntheticCorpus(review=review, works=works, ground_truth=ground_truth)
+
+    def _title(self) -> str:
+        words = self.rng.sample(TITLE_WORDS, self.rng.randint(6, 12))
+        for _ in range(self.rng.randint(1, 3)):
+            rare = "".join(self.rng.choices(RARE_SYLLABLES, k=2)) + self.rng.choice(RARE_SUFFIXES)
+            words.insert(self.rng.randrange(len(words) + 1), rare)
+        return " ".join(words).capitalize()
+
+    def _authors(self) -> List[tuple]:
+        """Return (first names, surname) pairs; first names may include a middle name."""
+        authors = []
+        for _ in range(self.rng.randint(1, 8)):
+            names = [self.rng.choice(FIRST_NAMES)]
+            if self.rng.random() < 0.4:
+                names.append(self.rng.choice(FIRST_NAMES))
+            authors.append((names, self.rng.choice(SURNAMES)))
+        return authors
+
+    def _reference(
+        self, title: str, year: int, authors: List[tuple], journal: str, doi: str, pmid: str
+    ) -> Dict[str, Any]:
+        noise = self.noise
+        ref_title = title
+        if self.rng.random() < noise.truncated_title:
+            words = title.split()
+            ref_title = " ".join(words[: max(3, int(len(words) * 0.6))])
+
+        ref_year: Optional[int] = year
+        if self.rng.random() < noise.missing_year:
+            ref_year = None
+        elif self.rng.random() < noise.wrong_year:
+            ref_year = year + self.rng.choice((-1, 1))
+
+        # RevMan packs every author into one "Surname INITIALS" string
+        author_string = ", ".join(
+            f"{surname} {''.join(n[0] for n in names)}" for names, surname in authors
+        )
+        reference: Dict[str, Any] = {
+            "authors_list": [author_string],
+            "title": ref_title,
+            "source": journal,
+            "year": ref_year,
+            "volume": str(self.rng.randint(1, 400)),
+            "pages": f"{self.rng.randint(1, 900)}-{self.rng.randint(1, 99)}",
+        }
+        if self.rng.random() < noise.with_doi:
+            reference["doi"] = self._bad_doi(doi) if self.rng.random() < noise.bad_doi else doi
+        if self.rng.random() < noise.with_pmid:
+            reference["pmid"] = pmid
+        return reference
+
+    def _bad_doi(self, doi: str) -> str:
+        kind = self.rng.randrange(3)
+        if kind == 0:
+            return doi[: len(doi) // 2]  # Truncated during export
+        if kind == 1:
+            return doi.replace("10.", "1O.", 1)  # OCR-style typo
+        return f"{doi}x"  # Trailing garbage, resolves to nothing
+
+    def _work_id(self) -> str:
+        self._next_work += 1
+        return f"https://openalex.org/W{8_000_000_000 + self._next_work}"
+
+    def _work(
+        self,
+        title: str,
+        year: int,
+        authors: List[tuple],
+        journal: str,
+        doi: Optional[str],
+        pmid: Optional[str],
+    ) -> Dict[str, Any]:
+        work_id = self._work_id()
+        is_oa = self.rng.random() < 0.35
+        return {
+            "id": work_id,
+            "doi": f"https://doi.org/{doi}" if doi else None,
+            "title": title,
+            "display_name": title,
+            "publication_year": year,
+            "publication_date": f"{year}-{self.rng.randint(1, 12):02d}-01",
+            "type": "article",
+            "ids": {
+                "openalex": work_id,
+                "doi": f"https://doi.org/{doi}" if doi else None,
+                "pmid": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}" if pmid else None,
+            },
+            "authorships": [
+                {"author_position": "first" if i == 0 else "middle",
+                 "author": {"display_name": f"{' '.join(names)} {surname}"}}
+                for i, (names, surname) in enumerate(authors)
+            ],
+            "primary_location": {
+                "source": {"display_name": journal},
+                "landing_page_url": f"https://example.org/{work_id.rsplit('/', 1)[-1]}",
+            },
+            "open_access": {
+                "is_oa": is_oa,
+                "oa_url": f"https://example.org/{work_id.rsplit('/', 1)[-1]}.pdf" if is_oa else None,
+            },
+            "cited_by_count": self.rng.randint(0, 500),
+        }
+
+    def _distractor(self, title: str, year: int, journal: str) -> Dict[str, Any]:
+        """A look-alike Work: same topic, one word swapped, different year and authors."""
+        words = title.split()
+        words[self.rng.randrange(len(words))] = self.rng.choice(TITLE_WORDS)
+        return self._work(
+            " ".join(words).capitalize(),
+            year + self.rng.choice((-3, -2, 2, 3)),
+            self._authors(),
+            journal,
+            doi=None,
+            pmid=None,
+        )
+
+
+def generate_corpus(
+    n_studies: int, seed: int = 0, noise: Optional[NoiseProfile] = None
+) -> SyntheticCorpus:
+    """Convenience wrapper around CorpusGenerator."""
+    return CorpusGenerator(seed=seed, noise=noise).generate(n_studies)
+
+
+def write_corpus(corpus: SyntheticCorpus, out_dir: Path) -> None:
+    """Write review.json, works.jsonl and ground_truth.json into ``out_dir``."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "review.json").write_text(json.dumps(corpus.review, indent=2))
+    with open(out_dir / "works.jsonl", "w", encoding="utf-8") as handle:
+        for work in corpus.works:
+            handle.write(json.dumps(work) + "\n")
+    (out_dir / "ground_truth.json").write_text(json.dumps(corpus.ground_truth, indent=2))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--studies", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out-dir", type=Path, required=True)
+    args = parser.parse_args(argv)
+    write_corpus(generate_corpus(args.studies, seed=args.seed), args.out_dir)
+
+
+if __name__ == "__main__":
+    main()
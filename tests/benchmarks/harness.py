@@ -0,0 +1,221 @@
+"""Measurement and regression checks for end-to-end matching benchmarks."""
+
+import json
+import os
+import platform
+import re
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.application.services.matching_service import MatchingService
+from src.domain.enums.search_status import SearchStatus
+from src.domain.models.config import Config
+from src.domain.models.study import Study
+
+from .openalex_standin import OpenAlexStandIn
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# Allowed relative drift before a metric counts as a regression.
+# Throughput may not drop, the others may not rise, by more than this.
+TOLERANCES = {
+    "precision": 0.01,
+    "recall": 0.02,
+    "studies_per_sec": 0.20,
+    "api_calls_per_study": 0.05,
+    "cpu_time": 0.25,
+    "peak_alloc_mb": 0.25,
+}
+HIGHER_IS_BETTER = {"studies_per_sec", "precision", "recall"}
+# Metrics that depend on the machine; they are compared only against a
+# baseline recorded on the same machine (see machine_baseline_path)
+MACHINE_METRICS = {"studies_per_sec", "cpu_time"}
+
+
+def machine_baseline_path(path: Path = BASELINE_PATH) -> Path:
+    """
+    Baseline file for this machine's timings, next to the shared baseline.
+
+    Named after ``BENCHMARK_MACHINE`` (default: the host name); these files
+    are not committed, so a machine without one skips the timing checks.
+    """
+    machine = os.environ.get("BENCHMARK_MACHINE") or platform.node() or "local"
+    return path.with_name(f"{path.stem}.{re.sub(r'[^A-Za-z0-9._-]+', '_', machine)}.json")
+
+
+@dataclass
+class BenchmarkReport:
+    """Metrics for one benchmark scenario."""
+
+    name: str
+    studies: int
+    found: int
+    correct: int
+    wall_time: float
+    cpu_time: float
+    api_calls: int
+    faults: int
+    # Peak Python heap allocated during one traced round (tracemalloc)
+    peak_alloc_mb: float
+
+    @property
+    def studies_per_sec(self) -> float:
+        return self.studies / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def api_calls_per_study(self) -> float:
+        return self.api_calls / self.studies if self.studies else 0.0
+
+    @property
+    def precision(self) -> float:
+        """Share of FOUND studies matched to their ground-truth Work."""
+        return self.correct / self.found if self.found else 0.0
+
+    @property
+    def recall(self) -> float:
+        """Share of all studies matched to their ground-truth Work."""
+        return self.correct / self.studies if self.studies else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["studies_per_sec"] = round(self.studies_per_sec, 3)
+        data["api_calls_per_study"] = round(self.api_calls_per_study, 3)
+        data["precision"] = round(self.precision, 4)
+        data["recall"] = round(self.recall, 4)
+        return data
+
+
+def run_benchmark(
+    name: str,
+    studies: List[Study],
+    standin: OpenAlexStandIn,
+    ground_truth: Dict[str, str],
+    rounds: int = 1,
+    **config_overrides: Any,
+) -> BenchmarkReport:
+    """
+    Match ``studies`` end-to-end against a running stand-in and measure it.
+
+    ``ground_truth`` maps study ids to the OpenAlex Work id they should match.
+    With several ``rounds`` the fastest round is reported, which keeps short
+    scenarios stable against warm-up and scheduler noise. Memory is measured
+    in one extra, untimed round under tracemalloc, so it covers this scenario
+    only (including the in-process stand-in) and does not slow the timings.
+    """
+    config = Config(
+        openalex_url=standin.base_url,
+        retry_backoff_factor=0.0,
+        **config_overrides,
+    )
+    peak_alloc_mb = _peak_alloc_mb(config, studies, standin)
+    best = None
+    for _ in range(max(rounds, 1)):
+        # A fresh service per round so no state carries over between rounds
+        service = MatchingService(config)
+        standin.reseed()
+        calls_before = standin.request_count
+        faults_before = standin.fault_count
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        results = service.match_studies(studies)
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        api_calls = standin.request_count - calls_before
+        faults = standin.fault_count - faults_before
+        if best is None or wall_time < best[0]:
+            best = (wall_time, cpu_time, api_calls, faults, results)
+    wall_time, cpu_time, api_calls, faults, results = best
+
+    found = [r for r in results if r.status == SearchStatus.FOUND]
+    correct = sum(
+        1 for r in found
+        if r.openalex_id and ground_truth.get(r.study_id, "").endswith(f"/{r.openalex_id}")
+    )
+    return BenchmarkReport(
+        name=name,
+        studies=len(studies),
+        found=len(found),
+        correct=correct,
+        wall_time=round(wall_time, 4),
+        # Includes the stand-in's own threads; they run in this process
+        cpu_time=round(cpu_time, 4),
+        api_calls=api_calls,
+        faults=faults,
+        peak_alloc_mb=round(peak_alloc_mb, 1),
+    )
+
+
+def _peak_alloc_mb(config: Config, studies: List[Study], standin: OpenAlexStandIn) -> float:
+    standin.reseed()
+    tracemalloc.start()
+    try:
+        MatchingService(config).match_studies(studies)
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Dict[str, float]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def find_regressions(
+    report: BenchmarkReport, baseline: Optional[Dict[str, float]]
+) -> List[str]:
+    """Compare a report with its baseline entry and describe every regression."""
+    if not baseline:
+        return []
+    current = report.to_dict()
+    regressions = []
+    for metric, tolerance in TOLERANCES.items():
+        expected = baseline.get(metric)
+        if expected is None or expected == 0:
+            continue
+        actual = current[metric]
+        if metric in HIGHER_IS_BETTER:
+            regressed = actual < expected * (1 - tolerance)
+        else:
+            regressed = actual > expected * (1 + tolerance)
+        if regressed:
+            regressions.append(
+                f"{report.name}: {metric} {actual} vs baseline {expected} (tolerance {tolerance:.0%})"
+            )
+    return regressions
+
+
+def record_report(report: BenchmarkReport, path: Path = BASELINE_PATH) -> None:
+    """
+    Write the report into the baseline files (used with BENCHMARK_UPDATE_BASELINE=1).
+
+    Portable metrics go to the shared baseline, timings to this machine's file.
+    """
+    data = report.to_dict()
+    for target, metrics in (
+        (path, [m for m in TOLERANCES if m not in MACHINE_METRICS]),
+        (machine_baseline_path(path), sorted(MACHINE_METRICS)),
+    ):
+        baseline = load_baseline(target)
+        baseline[report.name] = {metric: data[metric] for metric in metrics}
+        target.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def merged_baseline(name: str, path: Path = BASELINE_PATH) -> Dict[str, float]:
+    """Shared metrics for ``name`` plus this machine's timings, if recorded."""
+    shared = {
+        metric: value for metric, value in load_baseline(path).get(name, {}).items()
+        if metric not in MACHINE_METRICS
+    }
+    return {**shared, **load_baseline(machine_baseline_path(path)).get(name, {})}
+
+
+def check_report(report: BenchmarkReport) -> List[str]:
+    """Record or compare a report depending on the environment."""
+    if os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1":
+        record_report(report)
+        return []
+    return find_regressions(report, merged_baseline(report.name))
@@ -0,0 +1,299 @@
+"""Local HTTP stand-in for the OpenAlex /works endpoint used by benchmarks."""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import unquote_plus, urlsplit
+
+TOKEN_REGEX = re.compile(r"[a-z0-9]+")
+# Parameters that do not change which works a request selects
+UNKEYED_PARAMS = {"per-page", "page", "cursor", "mailto", "api_key", "select"}
+# Number of least frequent query terms used to collect title-search candidates
+RARE_TERMS = 3
+
+
+def _tokens(text: Optional[str]) -> List[str]:
+    return TOKEN_REGEX.findall((text or "").lower())
+
+
+def _normalize_doi(doi: Optional[str]) -> str:
+    doi = (doi or "").strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            doi = doi[len(prefix):]
+    return doi
+
+
+def request_key(path: str, query: str) -> str:
+    """Canonical key for a recorded request: path plus sorted selecting params."""
+    params = sorted(
+        part for part in query.split("&")
+        if part and part.split("=", 1)[0] not in UNKEYED_PARAMS
+    )
+    return f"{path}?{'&'.join(params)}"
+
+
+def load_recordings(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load recorded responses from a JSONL file.
+
+    Each line is ``{"request": "/works?filter=...", "status": 200, "body": {...}}``.
+    """
+    recordings = {}
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            url = urlsplit(entry["request"])
+            recordings[request_key(url.path, url.query)] = entry
+    return recordings
+
+
+class WorksIndex:
+    """In-memory index answering the subset of /works filters the matcher sends."""
+
+    def __init__(self, works: Iterable[Dict[str, Any]]):
+        self.works: List[Dict[str, Any]] = list(works)
+        self.by_doi: Dict[str, int] = {}
+        self.by_pmid: Dict[str, int] = {}
+        self.title_postings: Dict[str, Set[int]] = defaultdict(set)
+        self.title_tokens: List[Set[str]] = []
+        self.author_tokens: List[Set[str]] = []
+
+        for idx, work in enumerate(self.works):
+            if work.get("doi"):
+                self.by_doi[_normalize_doi(work["doi"])] = idx
+            pmid = (work.get("ids") or {}).get("pmid")
+            if pmid:
+                self.by_pmid[pmid.rstrip("/").split("/")[-1]] = idx
+            title_tokens = set(_tokens(work.get("title")))
+            self.title_tokens.append(title_tokens)
+            for token in title_tokens:
+                self.title_postings[token].add(idx)
+            names = set()
+            for authorship in work.get("authorships") or []:
+                names.update(_tokens((authorship.get("author") or {}).get("display_name")))
+            self.author_tokens.append(names)
+
+    def search(self, filters: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Return works matching all filters, most relevant first."""
+        candidates: Optional[List[int]] = None
+
+        if "doi" in filters:
+            candidates = [
+                self.by_doi[d] for d in map(_normalize_doi, filters["doi"].split("|"))
+                if d in self.by_doi
+            ]
+        if "pmid" in filters:
+            pmids = [p.strip() for p in filters["pmid"].split("|")]
+            candidates = [self.by_pmid[p] for p in pmids if p in self.by_pmid]
+
+        if "title.search" in filters:
+            query_tokens = {t for t in _tokens(filters["title.search"]) if len(t) > 2}
+            # Like a real engine, draw candidates from the rarest terms only,
+            # then score them against the whole query
+            rarest = sorted(query_tokens, key=lambda t: len(self.title_postings.get(t, ())))
+            common_cutoff = max(50, len(self.works) // 200)
+            pool: Set[int] = set()
+            for token in rarest[:RARE_TERMS]:
+                postings = self.title_postings.get(token, ())
+                if pool and len(postings) > common_cutoff:
+                    break  # Common words add cost, not recall
+                pool.update(postings)
+            needed = max(1, len(query_tokens) // 2)
+            scored = Counter(
+                {idx: len(query_tokens & self.title_tokens[idx]) for idx in pool}
+            )
+            ranked = [idx for idx, count in scored.most_common() if count >= needed]
+            if candidates is not None:
+                allowed = set(candidates)
+                ranked = [idx for idx in ranked if idx in allowed]
+            candidates = ranked
+
+        if candidates is None:
+            candidates = list(range(len(self.works)))
+
+        if "publication_year" in filters:
+            year = filters["publication_year"]
+            candidates = [
+                idx for idx in candidates
+                if str(self.works[idx].get("publication_year")) == year
+            ]
+
+        if "raw_author_name.search" in filters:
+            variant_tokens = {
+                token
+                for variant in filters["raw_author_name.search"].split("|")
+                for token in _tokens(variant)
+                if len(token) > 2
+            }
+            candidates = [
+                idx for idx in candidates if variant_tokens & self.author_tokens[idx]
+            ]
+
+        return [self.works[idx] for idx in candidates]
+
+
+class OpenAlexStandIn:
+    """
+    Threaded HTTP server imitating ``GET /works`` for offline benchmarks.
+
+    Recorded responses are replayed first; anything not recorded is answered
+    from an index of Work records. Latency and error injection are seeded so
+    runs are repeatable.
+    """
+
+    def __init__(
+        self,
+        works: Iterable[Dict[str, Any]] = (),
+        recordings: Optional[Dict[str, Dict[str, Any]]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        faults: Optional[Dict[int, float]] = None,
+        seed: int = 0,
+    ):
+        self.index = WorksIndex(works)
+        self.recordings = recordings or {}
+        self.latency = latency
+        self.jitter = jitter
+        self.faults = faults or {}
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.request_count = 0
+        self.fault_count = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def reseed(self) -> None:
+        """Restart the latency/fault sequence, so every round sees the same one."""
+        with self._lock:
+            self._rng = random.Random(self.seed)
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Stand-in is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Start serving on a free local port and return the base URL."""
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in one segment; avoids 40ms delayed-ACK stalls
+            disable_nagle_algorithm = True
+            wbufsize = 1 << 16
+
+            def do_GET(self):  # noqa: N802 - http.server naming
+                status, body, headers = standin.handle(self.path)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "OpenAlexStandIn":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle(self, raw_path: str):
+        """Produce (status, body, headers) for a request path."""
+        with self._lock:
+            self.request_count += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self._rng.random()
+
+        if delay:
+            time.sleep(delay)
+
+        threshold = 0.0
+        for status, ratio in sorted(self.faults.items()):
+            threshold += ratio
+            if roll < threshold:
+                with self._lock:
+                    self.fault_count += 1
+                return status, {"error": "injected fault"}, {"Retry-After": "0"}
+
+        url = urlsplit(raw_path)
+        recorded = self.recordings.get(request_key(url.path, url.query))
+        if recorded is not None:
+            return recorded.get("status", 200), recorded["body"], {}
+
+        if url.path.rstrip("/") != "/works":
+            return 404, {"error": f"Unsupported path {url.path}"}, {}
+
+        params = self._parse_query(url.query)
+        filters = self._parse_filters(params.get("filter", ""))
+        per_page = int(params.get("per-page", 25))
+        offset = 0
+        cursor = params.get("cursor")
+        if cursor and cursor != "*":
+            offset = int(cursor)
+        elif params.get("page"):
+            offset = (int(params["page"]) - 1) * per_page
+
+        matches = self.index.search(filters)
+        page = matches[offset:offset + per_page]
+        if params.get("select"):
+            fields = params["select"].split(",")
+            page = [{key: work[key] for key in fields if key in work} for work in page]
+        next_offset = offset + per_page
+        meta = {
+            "count": len(matches),
+            "per_page": per_page,
+            "page": None if cursor else offset // per_page + 1,
+            "next_cursor": str(next_offset) if cursor and next_offset < len(matches) else None,
+        }
+        return 200, {"meta": meta, "results": page}, {}
+
+    @staticmethod
+    def _parse_query(query: str) -> Dict[str, str]:
+        params = {}
+        for part in query.split("&"):
+            if not part:
+                continue
+            key, _, value = part.partition("=")
+            # Keep filter values raw: commas separate filters, escaped commas do not
+            params[key] = value if key == "filter" else unquote_plus(value)
+        return params
+
+    @staticmethod
+    def _parse_filters(raw_filter: str) -> Dict[str, str]:
+        filters = {}
+        for clause in raw_filter.split(","):
+            if not clause:
+                continue
+            key, _, value = clause.partition(":")
+            filters[key] = unquote_plus(value)
+        return filters
@@ -0,0 +1,70 @@
+"""Tests for the synthetic corpus generator."""
+import json
+
+from src.domain.models.study import Study
+
+from .corpus import studies_from_review
+from .corpus_generator import CorpusGenerator, NoiseProfile, generate_corpus, write_corpus
+
+
+def test_review_parses_with_matcher_models():
+    corpus = generate_corpus(50, seed=1)
+    studies = studies_from_review(corpus.review)
+
+    assert len(studies) == 50
+    assert all(isinstance(study, Study) for study in studies)
+    assert all(study.reference.title for study in studies)
+
+
+def test_authors_use_revman_string_form():
+    corpus = generate_corpus(5, seed=1)
+    study = (corpus.review["studies"]["included"] + corpus.review["studies"]["excluded"])[0]
+    authors_list = study["reference"]["authors_list"]
+
+    assert len(authors_list) == 1
+    surname, initials = authors_list[0].split(",")[0].split(" ")
+    assert surname[0].isupper() and initials.isupper()
+
+
+def test_ground_truth_points_at_emitted_works():
+    corpus = generate_corpus(20, seed=3)
+    work_ids = {work["id"] for work in corpus.works}
+
+    assert len(corpus.ground_truth) == 20
+    assert set(corpus.ground_truth.values()) <= work_ids
+    # One distractor per study by default
+    assert len(corpus.works) == 40
+
+
+def test_generation_is_deterministic_per_seed():
+    first = generate_corpus(30, seed=7)
+    second = generate_corpus(30, seed=7)
+    other = generate_corpus(30, seed=8)
+
+    assert first.review == second.review
+    assert first.works == second.works
+    assert first.review != other.review
+
+
+def test_noise_profile_is_applied():
+    noise = NoiseProfile(missing_year=1.0, with_doi=1.0, bad_doi=1.0, distractors_per_work=0)
+    corpus = CorpusGenerator(seed=0, noise=noise).generate(20)
+    references = [
+        s["reference"]
+        for s in corpus.review["studies"]["included"] + corpus.review["studies"]["excluded"]
+    ]
+    work_dois = {work["doi"] for work in corpus.works}
+
+    assert all(ref["year"] is None for ref in references)
+    assert all(f"https://doi.org/{ref['doi']}" not in work_dois for ref in references)
+
+
+def test_write_corpus(tmp_path):
+    corpus = generate_corpus(3, seed=0)
+    write_corpus(corpus, tmp_path)
+
+    review = json.loads((tmp_path / "review.json").read_text())
+    works = (tmp_path / "works.jsonl").read_text().splitlines()
+    assert review["metadata"]["review_id"] == "synthetic-3"
+    assert len(works) == len(corpus.works)
+    assert json.loads((tmp_path / "ground_truth.json").read_text()) == corpus.ground_truth
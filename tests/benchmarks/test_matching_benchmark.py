@@ -0,0 +1,172 @@
+"""End-to-end matching benchmarks against the local OpenAlex stand-in.
+
+Run with ``RUN_BENCHMARKS=1 pytest tests/benchmarks``. Set
+``BENCHMARK_UPDATE_BASELINE=1`` to rewrite ``baseline.json`` after an
+intentional performance change. ``baseline.json`` holds the portable metrics
+(precision, recall, API calls, allocations); throughput and CPU time are
+recorded per machine in ``baseline.<machine>.json`` and only checked where
+one exists. ``BENCHMARK_SYNTHETIC_STUDIES`` controls the
+size of the synthetic corpus (default 10000).
+"""
+import os
+
+import pytest
+from loguru import logger
+
+from .corpus import ground_truth_for, load_review, studies_from_review, works_for_studies
+from .corpus_generator import generate_corpus
+from .harness import check_report, run_benchmark
+from .openalex_standin import OpenAlexStandIn
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def review_studies():
+    return studies_from_review(load_review())
+
+
+def _run_and_check(
+    name, studies, works, ground_truth, rounds=1, config=None, **standin_options
+):
+    with OpenAlexStandIn(works, **standin_options) as standin:
+        report = run_benchmark(
+            name, studies, standin, ground_truth, rounds=rounds, **(config or {})
+        )
+    logger.warning(f"Benchmark {report.to_dict()}")
+    regressions = check_report(report)
+    assert not regressions, "\n".join(regressions)
+    return report
+
+
+def test_bundled_review(review_studies):
+    """Bundled review with no injected latency: CPU-bound matcher cost."""
+    works = works_for_studies(review_studies)
+    report = _run_and_check(
+        "bundled_review",
+        review_studies,
+        works,
+        ground_truth_for(review_studies, works),
+        rounds=5,
+    )
+    assert report.found > 0
+
+
+def test_bundled_review_with_latency_and_429s(review_studies):
+    """Bundled review with WAN-like latency and 5% rate limiting."""
+    works = works_for_studies(review_studies)
+    report = _run_and_check(
+        "bundled_review_latency_429",
+        review_studies,
+        works,
+        ground_truth_for(review_studies, works),
+        latency=0.02,
+        jitter=0.01,
+        faults={429: 0.05},
+        seed=7,
+    )
+    assert report.found > 0
+
+
+def test_bundled_review_adaptive_concurrency(review_studies):
+    """Same latency and rate limiting, with the AIMD batch runner."""
+    works = works_for_studies(review_studies)
+    report = _run_and_check(
+        "bundled_review_adaptive",
+        review_studies,
+        works,
+        ground_truth_for(review_studies, works),
+        rounds=3,
+        config={"concurrency_mode": "adaptive", "concurrency": 4},
+        latency=0.02,
+        jitter=0.01,
+        faults={429: 0.05},
+        seed=7,
+    )
+    assert report.found > 0
+
+
+def test_bundled_review_threads(review_studies):
+    """Same latency and rate limiting, with a fixed pool of worker threads."""
+    works = works_for_studies(review_studies)
+    report = _run_and_check(
+        "bundled_review_threads",
+        review_studies,
+        works,
+        ground_truth_for(review_studies, works),
+        rounds=3,
+        config={"concurrency_mode": "threads", "concurrency": 16},
+        latency=0.02,
+        jitter=0.01,
+        faults={429: 0.05},
+        seed=7,
+    )
+    assert report.found > 0
+
+
+def test_bundled_review_breadth_first(review_studies):
+    """Adaptive concurrency with the cascade run stage by stage."""
+    works = works_for_studies(review_studies)
+    report = _run_and_check(
+        "bundled_review_breadth_first",
+        review_studies,
+        works,
+        ground_truth_for(review_studies, works),
+        rounds=3,
+        config={"concurrency_mode": "adaptive", "concurrency": 4, "execution_mode": "breadth_first"},
+        latency=0.02,
+        jitter=0.01,
+        faults={429: 0.05},
+        seed=7,
+    )
+    assert report.found > 0
+
+
+def test_bundled_review_503_burst(review_studies):
+    """10% 503s with no HTTP retries: the deferred queue must keep recall intact."""
+    works = works_for_studies(review_studies)
+    report = _run_and_check(
+        "bundled_review_503_burst",
+        review_studies,
+        works,
+        ground_truth_for(review_studies, works),
+        rounds=5,
+        config={"max_retries": 0, "deferred_max_attempts": 5, "deferred_retry_backoff": 0.01},
+        faults={503: 0.10},
+        seed=11,
+    )
+    assert report.found > 0
+
+
+def test_synthetic_corpus():
+    """Noisy synthetic corpus (10k studies by default) with look-alike distractors."""
+    count = int(os.environ.get("BENCHMARK_SYNTHETIC_STUDIES", "10000"))
+    corpus = generate_corpus(count, seed=42)
+    studies = studies_from_review(corpus.review)
+    report = _run_and_check(
+        f"synthetic_{count}", studies, corpus.works, corpus.ground_truth
+    )
+    assert report.found > 0
+
+
+@pytest.mark.parametrize("batch_wait", [0.0, 0.02], ids=["unbatched", "batched"])
+def test_synthetic_identifier_batching(batch_wait):
+    """Threads over the identifier stage, with and without coalesced DOI/PMID lookups."""
+    corpus = generate_corpus(2000, seed=42)
+    studies = studies_from_review(corpus.review)
+    report = _run_and_check(
+        f"synthetic_2000_identifiers_{'batched' if batch_wait else 'unbatched'}",
+        studies,
+        corpus.works,
+        corpus.ground_truth,
+        config={
+            "concurrency_mode": "threads",
+            "concurrency": 16,
+            "execution_mode": "breadth_first",
+            "identifier_batch_wait": batch_wait,
+        },
+        latency=0.02,
+        jitter=0.01,
+        seed=7,
+    )
+    assert report.found > 0
@@ -127,7 +127,8 @@ class TestOpenAlexRepository:
             mock_sort = mock.MagicMock()
             mock_get = mock.MagicMock()
             
-            with mock.patch("pyalex.Works", return_value=mock_works):
+            with mock.patch("pyalex.Works", return_value=mock_works), \
+                    mock.patch.object(repository, "_get_works", return_value=[]):
                 mock_works.search_filter.return_value = mock_search_filter
                 mock_search_filter.filter.return_value = mock_filter
                 mock_filter.sort.return_value = mock_sort
@@ -169,6 +170,7 @@ class TestOpenAlexRepository:
         
         # Apply the mock
         monkeypatch.setattr("pyalex.Works", mock_works)
+        monkeypatch.setattr(repository, "_get_works", mock.MagicMock(return_value=[]))
         
         # Get a reference from the sample data
         reference = sample_data["studies"]["included"][0]["reference"]
@@ -207,8 +209,8 @@ class TestOpenAlexRepository:
         assert "relevance_score" in kwargs
         assert kwargs["relevance_score"] == "desc"
         
-        # Check that get was called with per_page=25
-        args, kwargs = mock_sort.get.call_args
+        # Check that the query was executed with per_page=25
+        args, kwargs = repository._get_works.call_args
         assert "per_page" in kwargs
         assert kwargs["per_page"] == 25
     
@@ -230,6 +232,7 @@ class TestOpenAlexRepository:
         
         # Apply the mock
         monkeypatch.setattr("pyalex.Works", mock_works)
+        monkeypatch.setattr(repository, "_get_works", mock.MagicMock(return_value=[]))
         
         # Get a reference from the sample data
         reference = sample_data["studies"]["included"][0]["reference"]
@@ -261,8 +264,8 @@ class TestOpenAlexRepository:
         assert "relevance_score" in kwargs
         assert kwargs["relevance_score"] == "desc"
         
-        # Check that get was called with per_page=25
-        args, kwargs = mock_sort.get.call_args
+        # Check that the query was executed with per_page=25
+        args, kwargs = repository._get_works.call_args
         assert "per_page" in kwargs
         assert kwargs["per_page"] == 25
     
@@ -284,6 +287,7 @@ class TestOpenAlexRepository:
         
         # Apply the mock
         monkeypatch.setattr("pyalex.Works", mock_works)
+        monkeypatch.setattr(repository, "_get_works", mock.MagicMock(return_value=[]))
         
         # Get a reference from the sample data
         reference = sample_data["studies"]["included"][0]["reference"]
@@ -307,8 +311,8 @@ class TestOpenAlexRepository:
         assert "relevance_score" in kwargs
         assert kwargs["relevance_score"] == "desc"
         
-        # Check that get was called with per_page=25
-        args, kwargs = mock_sort.get.call_args
+        # Check that the query was executed with per_page=25
+        args, kwargs = repository._get_works.call_args
         assert "per_page" in kwargs
         assert kwargs["per_page"] == 25
     
@@ -330,6 +334,7 @@ class TestOpenAlexRepository:
         
         # Apply the mock
         monkeypatch.setattr("pyalex.Works", mock_works)
+        monkeypatch.setattr(repository, "_get_works", mock.MagicMock(return_value=[]))
         
         # Get a reference from the sample data
         reference = sample_data["studies"]["included"][0]["reference"]
@@ -356,8 +361,8 @@ class TestOpenAlexRepository:
         assert "relevance_score" in kwargs
         assert kwargs["relevance_score"] == "desc"
         
-        # Check that get was called with per_page=25
-        args, kwargs = mock_sort.get.call_args
+        # Check that the query was executed with per_page=25
+        args, kwargs = repository._get_works.call_args
         assert "per_page" in kwargs
         assert kwargs["per_page"] == 25
     
@@ -377,6 +382,7 @@ class TestOpenAlexRepository:
         
         # Apply the mock
         monkeypatch.setattr("pyalex.Works", mock_works)
+        monkeypatch.setattr(repository, "_get_works", mock.MagicMock(return_value=[]))
         
         # Get a reference from the sample data
         reference = sample_data["studies"]["included"][0]["reference"]
@@ -397,8 +403,8 @@ class TestOpenAlexRepository:
         assert "relevance_score" in kwargs
         assert kwargs["relevance_score"] == "desc"
         
-        # Check that get was called with per_page=25
-        args, kwargs = mock_sort.get.call_args
+        # Check that the query was executed with per_page=25
+        args, kwargs = repository._get_works.call_args
         assert "per_page" in kwargs
         assert kwargs["per_page"] == 25
         
@@ -433,6 +439,7 @@ class TestOpenAlexRepository:
             
             # Apply the mock
             monkeypatch.setattr("pyalex.Works", mock_works)
+            monkeypatch.setattr(repository, "_get_works", mock.MagicMock(return_value=[]))
             
             # Call the method
             repository.get_by_doi(test_case["doi"])
@@ -480,6 +487,7 @@ class TestOpenAlexRepository:
             
             # Apply the mock
             monkeypatch.setattr("pyalex.Works", mock_works)
+            monkeypatch.setattr(repository, "_get_works", mock.MagicMock(return_value=[]))
             
             # Call the method
             repository.get_by_pmid(test_case["pmid"])
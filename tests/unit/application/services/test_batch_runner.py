@@ -0,0 +1,264 @@
+"""Tests for the batch runner and adaptive concurrency controller."""
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.application.services.batch_runner import AdaptiveConcurrencyController, BatchRunner
+from src.domain.enums.search_status import SearchStatus
+from src.utils.deadline import Deadline
+from src.utils.metrics import RunMetrics
+
+
+class TestAdaptiveConcurrencyController:
+    """Tests for the AIMD concurrency limit."""
+
+    def test_initial_limit_is_clamped(self):
+        assert AdaptiveConcurrencyController(initial=100, max_limit=10).limit == 10
+        assert AdaptiveConcurrencyController(initial=0).limit == 1
+
+    def test_additive_increase_after_a_window_of_successes(self):
+        controller = AdaptiveConcurrencyController(initial=4, max_limit=10)
+        for _ in range(4):
+            controller.on_request(200, 0.1)
+        assert controller.limit == 5
+
+    def test_increase_stops_at_max(self):
+        controller = AdaptiveConcurrencyController(initial=2, max_limit=2)
+        for _ in range(10):
+            controller.on_request(200, 0.1)
+        assert controller.limit == 2
+
+    def test_multiplicative_decrease_on_throttling(self):
+        controller = AdaptiveConcurrencyController(initial=16)
+        controller.on_request(429, None)
+        assert controller.limit == 8
+
+    def test_one_decrease_per_window(self):
+        controller = AdaptiveConcurrencyController(initial=16)
+        for _ in range(5):
+            controller.on_request(503, None)
+        assert controller.limit == 8
+        # A full window at the new limit later, another error counts again
+        for _ in range(8):
+            controller.on_request(200, 0.1)
+        controller.on_request(0, 1.0)
+        assert controller.limit == 4
+
+    def test_decrease_on_rising_p95(self):
+        controller = AdaptiveConcurrencyController(initial=8, max_limit=8, window=10)
+        for _ in range(10):
+            controller.on_request(200, 0.1)
+        for _ in range(10):
+            controller.on_request(200, 0.5)
+        assert controller.limit == 4
+
+    def test_limit_published_to_metrics(self):
+        metrics = RunMetrics()
+        controller = AdaptiveConcurrencyController(initial=6, metrics=metrics)
+        controller.on_request(429, None)
+        snapshot = metrics.snapshot()
+        assert snapshot["concurrency"] == 3
+        assert snapshot["peak_concurrency"] == 6
+
+
+def result_for(study, status=SearchStatus.FOUND, attempts=None):
+    return SimpleNamespace(study_id=study, status=status, search_attempts=attempts or [])
+
+
+class TestBatchRunner:
+    """Tests for concurrent batch execution."""
+
+    def test_preserves_input_order(self):
+        def match(study):
+            time.sleep(0.001 * (5 - study))
+            return result_for(study)
+
+        controller = AdaptiveConcurrencyController(initial=4, max_limit=4)
+        results = BatchRunner(match, controller).run(list(range(5)))
+        assert [r.study_id for r in results] == [0, 1, 2, 3, 4]
+
+    def test_in_flight_never_exceeds_limit(self):
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def match(study):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.005)
+            with lock:
+                state["current"] -= 1
+            return result_for(study)
+
+        controller = AdaptiveConcurrencyController(initial=3, max_limit=8)
+        BatchRunner(match, controller).run(list(range(20)))
+        assert 1 < state["peak"] <= 3
+
+    def test_counts_completed_studies(self):
+        metrics = RunMetrics()
+        controller = AdaptiveConcurrencyController(initial=2)
+        BatchRunner(result_for, controller, metrics).run([1, 2, 3])
+        assert metrics.snapshot()["studies_completed"] == 3
+
+    def test_sequential_without_controller(self):
+        threads = set()
+
+        def match(study):
+            threads.add(threading.get_ident())
+            return result_for(study)
+
+        results = BatchRunner(match).run([1, 2, 3])
+        assert [r.study_id for r in results] == [1, 2, 3]
+        assert threads == {threading.get_ident()}
+
+
+class TestShortestFirst:
+    """Tests for cost-ordered scheduling and streamed results."""
+
+    def test_cheapest_studies_start_first(self):
+        calls = []
+
+        def match(study):
+            calls.append(study)
+            return result_for(study)
+
+        cost = {"slow": 4, "quick": 1, "medium": 2, "skip": 0}
+        results = BatchRunner(match, cost=cost.get).run(["slow", "quick", "medium", "skip"])
+
+        assert calls == ["skip", "quick", "medium", "slow"]
+        assert [r.study_id for r in results] == ["slow", "quick", "medium", "skip"]
+
+    def test_equal_costs_keep_input_order(self):
+        calls = []
+
+        def match(study):
+            calls.append(study)
+            return result_for(study)
+
+        BatchRunner(match, cost=lambda study: 1).run(["a", "b", "c"])
+        assert calls == ["a", "b", "c"]
+
+    def test_on_result_streams_final_results(self):
+        streamed = []
+        failures = {"b": 1}
+
+        def match(study):
+            if failures.get(study):
+                failures[study] -= 1
+                return result_for(study, SearchStatus.DEFERRED)
+            return result_for(study)
+
+        controller = AdaptiveConcurrencyController(initial=2, max_limit=2)
+        BatchRunner(
+            match, controller, retry_backoff=0.0, on_result=lambda r: streamed.append((r.study_id, r.status))
+        ).run(["a", "b", "c"])
+
+        assert sorted(streamed) == [
+            ("a", SearchStatus.FOUND), ("b", SearchStatus.FOUND), ("c", SearchStatus.FOUND)
+        ]
+        assert streamed[-1] == ("b", SearchStatus.FOUND)
+
+
+class TestDeferredRetryQueue:
+    """Tests for retrying studies deferred by transient API errors."""
+
+    @pytest.fixture(params=["sequential", "concurrent"])
+    def controller(self, request):
+        if request.param == "sequential":
+            return None
+        return AdaptiveConcurrencyController(initial=2, max_limit=2)
+
+    def test_deferred_study_retried_after_fresh_ones(self, controller):
+        calls = []
+        failures = {"b": 1}
+
+        def match(study):
+            calls.append(study)
+            if failures.get(study, 0) > 0:
+                failures[study] -= 1
+                return result_for(study, SearchStatus.DEFERRED)
+            return result_for(study)
+
+        metrics = RunMetrics()
+        runner = BatchRunner(match, controller, metrics, retry_backoff=0.0)
+        results = runner.run(["a", "b", "c"])
+
+        assert [r.status for r in results] == [SearchStatus.FOUND] * 3
+        assert calls.index("c") < len(calls) - 1 and calls[-1] == "b"
+        assert metrics.snapshot()["deferrals"] == 1
+
+    def test_exhausted_study_fails(self, controller):
+        calls = []
+
+        def match(study):
+            calls.append(study)
+            return result_for(study, SearchStatus.DEFERRED if study == "b" else SearchStatus.FOUND)
+
+        metrics = RunMetrics()
+        runner = BatchRunner(match, controller, metrics, max_attempts=3, retry_backoff=0.0)
+        results = runner.run(["a", "b"])
+
+        assert results[1].status == SearchStatus.FAILED
+        assert calls.count("b") == 3
+        assert metrics.snapshot()["failed"] == 1
+
+    def test_backoff_grows_exponentially(self):
+        now = [0.0]
+        seen = []
+
+        def match(study):
+            seen.append(now[0])
+            return result_for(study, SearchStatus.DEFERRED)
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        runner = BatchRunner(match, max_attempts=3, retry_backoff=2.0, clock=lambda: now[0])
+        with patch("src.application.services.batch_runner.time.sleep", sleep):
+            runner.run(["a"])
+        assert seen == [0.0, 2.0, 6.0]
+
+    def test_open_circuit_parks_until_retry_after(self):
+        now = [0.0]
+        seen = []
+        outcomes = iter([[{"error": "Transient API error", "retry_after": 30.0}], None])
+
+        def match(study):
+            seen.append(now[0])
+            attempts = next(outcomes)
+            if attempts:
+                return result_for(study, SearchStatus.DEFERRED, attempts)
+            return result_for(study)
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        runner = BatchRunner(match, max_attempts=2, retry_backoff=2.0, clock=lambda: now[0])
+        with patch("src.application.services.batch_runner.time.sleep", sleep):
+            results = runner.run(["a"])
+        # The breaker's retry_after outweighs the 2s backoff
+        assert seen == [0.0, 30.0]
+        assert results[0].status == SearchStatus.FOUND
+
+    def test_retry_past_run_deadline_times_out(self):
+        now = [0.0]
+        calls = []
+
+        def match(study):
+            calls.append(study)
+            return result_for(study, SearchStatus.DEFERRED)
+
+        metrics = RunMetrics()
+        deadline = Deadline(expires_at=3.0, clock=lambda: now[0])
+        runner = BatchRunner(
+            match, metrics=metrics, max_attempts=3, retry_backoff=5.0,
+            deadline=deadline, clock=lambda: now[0],
+        )
+        results = runner.run(["a"])
+
+        assert results[0].status == SearchStatus.TIMEOUT
+        assert calls == ["a"]
+        assert metrics.snapshot()["timeouts"] == 1
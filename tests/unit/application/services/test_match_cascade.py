@@ -0,0 +1,434 @@
+"""Tests for how MatchingService runs the strategy cascade."""
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from loguru import logger
+
+from src.application.services import matching_service
+from src.application.services.matching_service import MatchingService
+from src.domain.enums.search_status import SearchStatus
+from src.domain.enums.study_type import StudyType
+from src.domain.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    PermanentRepositoryError,
+    TransientRepositoryError,
+)
+from src.domain.models.config import Config
+from src.domain.models.reference import Reference
+from src.domain.models.study import Study
+from src.utils.deadline import Deadline, current_deadline, deadline_scope
+
+
+def make_strategy(name, execute):
+    strategy = MagicMock()
+    strategy.name = name
+    strategy.supported.return_value = True
+    strategy.execute.side_effect = execute
+    return strategy
+
+
+@pytest.fixture
+def study():
+    reference = Reference(title="A randomised trial of penicillin", authors=["Smith J"], year=2001)
+    return Study(id="STD-1", type=StudyType.INCLUDED, reference=reference)
+
+
+@pytest.fixture
+def service():
+    return MatchingService(Config())
+
+
+class TestTransientErrors:
+    """Transient repository errors defer the study instead of ending as NOT_FOUND."""
+
+    def test_transient_error_stops_cascade(self, service, study):
+        first = make_strategy("title_authors_year", TransientRepositoryError("HTTP 503", 503))
+        second = make_strategy("title_only", lambda ref: ([], {"error": "No results found"}))
+        service.strategies = [first, second]
+
+        result = service.match_study(study)
+
+        assert result.status == SearchStatus.DEFERRED
+        second.execute.assert_not_called()
+        assert len(result.search_attempts) == 1
+        assert "Transient API error" in result.search_attempts[0]["error"]
+
+    def test_open_circuit_records_retry_after(self, service, study):
+        service.strategies = [
+            make_strategy("title_authors_year", CircuitOpenError("Circuit breaker open", retry_after=12.5))
+        ]
+
+        result = service.match_study(study)
+
+        assert result.status == SearchStatus.DEFERRED
+        assert result.search_attempts[0]["retry_after"] == 12.5
+
+    def test_permanent_error_moves_to_next_strategy(self, service, study):
+        first = make_strategy("title_authors_year", PermanentRepositoryError("HTTP 400", 400))
+        second = make_strategy(
+            "title_only",
+            lambda ref: ([{"id": "https://openalex.org/W1", "title": "x"}], {"query_type": "title"}),
+        )
+        service.strategies = [first, second]
+
+        result = service.match_study(study)
+
+        assert result.status == SearchStatus.FOUND
+        assert result.openalex_id == "W1"
+        assert len(result.search_attempts) == 2
+
+
+class TestDeadlines:
+    """Studies over their time budget end as TIMEOUT with the attempts made so far."""
+
+    def test_deadline_during_strategy_times_out(self, service, study):
+        first = make_strategy("title_authors_year", lambda ref: ([], {"error": "No results found"}))
+        second = make_strategy("title_only", DeadlineExceededError("Deadline exceeded"))
+        third = make_strategy("title_year", lambda ref: ([], {}))
+        service.strategies = [first, second, third]
+
+        result = service.match_study(study)
+
+        assert result.status == SearchStatus.TIMEOUT
+        assert [a["strategy"] for a in result.search_attempts] == ["title_authors_year", "title_only"]
+        third.execute.assert_not_called()
+
+    def test_expired_budget_skips_remaining_strategies(self, service, study):
+        now = [0.0]
+        deadline = Deadline(expires_at=1.0, clock=lambda: now[0])
+
+        def slow(ref):
+            now[0] = 2.0
+            return [], {"error": "No results found"}
+
+        first = make_strategy("title_authors_year", slow)
+        second = make_strategy("title_only", lambda ref: ([], {}))
+        service.strategies = [first, second]
+
+        with deadline_scope(deadline):
+            result = service.match_study(study)
+
+        assert result.status == SearchStatus.TIMEOUT
+        assert len(result.search_attempts) == 1
+        second.execute.assert_not_called()
+
+    def test_study_timeout_is_applied(self, study):
+        service = MatchingService(Config(study_timeout=0.01))
+        seen = []
+
+        def record(ref):
+            seen.append(current_deadline())
+            return [], {}
+
+        service.strategies = [make_strategy("title_only", record)]
+        service.match_study(study)
+
+        assert seen[0] is not None
+
+
+class TestBreadthFirst:
+    """The breadth-first execution mode gives the same results as the depth-first cascade."""
+
+    @staticmethod
+    def strategies():
+        return [
+            make_strategy("identifier", lambda ref: ([], {"error": "No results found"})),
+            make_strategy(
+                "title_only",
+                lambda ref: ([{"id": "https://openalex.org/W1", "title": ref.title}], {})
+                if "penicillin" in ref.title else ([], {"error": "Results found but similarity below threshold (0.95)"}),
+            ),
+        ]
+
+    def test_same_results_as_depth_first(self, study):
+        other = Study(
+            id="STD-2", type=StudyType.INCLUDED,
+            reference=Reference(title="Tonsillectomy outcomes in adults", authors=["Brown K"], year=1999),
+        )
+        outcomes = {}
+        for mode in ("depth_first", "breadth_first"):
+            service = MatchingService(Config(execution_mode=mode))
+            service.strategies = self.strategies()
+            outcomes[mode] = [
+                (r.status, r.openalex_id, [a["strategy"] for a in r.search_attempts])
+                for r in service.match_studies([study, other])
+            ]
+
+        assert outcomes["breadth_first"] == outcomes["depth_first"]
+        assert outcomes["breadth_first"][1][0] == SearchStatus.REJECTED
+
+    def test_deferred_studies_are_retried(self, study):
+        calls = iter([TransientRepositoryError("HTTP 503", 503)])
+
+        def flaky(ref):
+            error = next(calls, None)
+            if error:
+                raise error
+            return [{"id": "https://openalex.org/W7", "title": ref.title}], {}
+
+        service = MatchingService(Config(execution_mode="breadth_first", deferred_retry_backoff=0.0))
+        service.strategies = [make_strategy("title_only", flaky)]
+
+        result = service.match_studies([study])[0]
+
+        assert result.status == SearchStatus.FOUND
+        assert result.openalex_id == "W7"
+
+
+class TestScheduling:
+    """Studies keep input order unless shortest_first orders them by expected searches."""
+
+    def test_estimate_cost(self, study, service):
+        service.strategies = [
+            make_strategy("identifier", lambda ref: ([], {})),
+            make_strategy("title_only", lambda ref: ([], {})),
+            make_strategy("title_year", lambda ref: ([], {})),
+        ]
+        service.strategies[0].supported.side_effect = lambda ref: ref.doi is not None
+        with_doi = Study(id="STD-2", type=StudyType.INCLUDED, reference=study.reference.copy(update={"doi": "10.1/x"}))
+        no_data = Study(id="STD-3", type=StudyType.INCLUDED, reference=Reference(title="", authors=[]))
+
+        assert service.estimate_cost(no_data) == 0
+        assert service.estimate_cost(with_doi) == 1
+        assert service.estimate_cost(study) == 2
+
+    @pytest.mark.parametrize("schedule, expected", [("input", ["STD-1", "STD-0"]), ("shortest_first", ["STD-0", "STD-1"])])
+    def test_results_keep_input_order_and_stream(self, study, schedule, expected):
+        service = MatchingService(Config(schedule=schedule))
+        service.strategies = [
+            make_strategy("title_only", lambda ref: ([{"id": "https://openalex.org/W1", "title": ref.title}], {}))
+        ]
+        skipped = Study(id="STD-0", type=StudyType.INCLUDED, reference=Reference(title="", authors=[]))
+        streamed = []
+
+        results = service.match_studies([study, skipped], on_result=lambda r: streamed.append(r.study_id))
+
+        assert [r.study_id for r in results] == ["STD-1", "STD-0"]
+        assert streamed == expected
+
+    def test_input_order_by_default(self, study):
+        service = MatchingService(Config())
+        service.strategies = [
+            make_strategy("title_only", lambda ref: ([{"id": "https://openalex.org/W1", "title": ref.title}], {}))
+        ]
+        studies = [
+            study,
+            Study(id="STD-0", type=StudyType.INCLUDED, reference=Reference(title="", authors=[])),
+            Study(id="STD-2", type=StudyType.INCLUDED, reference=study.reference),
+        ]
+        streamed = []
+
+        service.match_studies(studies, on_result=lambda r: streamed.append(r.study_id))
+
+        assert service.config.schedule == "input"
+        assert streamed == ["STD-1", "STD-0", "STD-2"]
+
+
+class TestAdaptiveStrategies:
+    """Strategies that stop winning are skipped, and the skip is recorded."""
+
+    def test_losing_strategy_is_skipped_and_recorded(self, study):
+        service = MatchingService(Config(adaptive_strategies=True, strategy_min_samples=2, strategy_skip_floor=0.1))
+        loser = make_strategy("title_authors", lambda ref: ([], {"error": "No results found"}))
+        winner = make_strategy(
+            "title_only", lambda ref: ([{"id": "https://openalex.org/W1", "title": ref.title}], {})
+        )
+        service.strategies = [loser, winner]
+
+        results = service.match_studies([study] * 4)
+
+        assert all(r.status == SearchStatus.FOUND for r in results)
+        assert loser.execute.call_count == 2
+        skipped = results[-1].search_attempts[0]
+        assert skipped["strategy"] == "title_authors"
+        assert skipped["decision"] == "skipped"
+        assert "won 0/2" in skipped["reason"]
+
+    def test_off_by_default(self, study, service):
+        loser = make_strategy("title_authors", lambda ref: ([], {"error": "No results found"}))
+        service.strategies = [loser]
+        service.match_studies([study] * 40)
+        assert loser.execute.call_count == 40
+
+
+class TestThreadPoolMode:
+    """The threads concurrency mode runs studies on a fixed pool of workers."""
+
+    def test_runs_on_worker_threads_in_input_order(self):
+        threads = set()
+        logged = []
+
+        def execute(ref):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return [{"id": f"https://openalex.org/W{ref.year}", "title": ref.title}], {}
+
+        service = MatchingService(Config(concurrency_mode="threads", concurrency=4))
+        service.strategies = [make_strategy("title_only", execute)]
+        studies = [
+            Study(id=f"STD-{i}", type=StudyType.INCLUDED,
+                  reference=Reference(title=f"Trial number {i}", authors=["Smith J"], year=2000 + i))
+            for i in range(8)
+        ]
+        sink = logger.add(lambda m: logged.append(m.record["extra"].get("study_id")), level="INFO")
+        try:
+            results = service.match_studies(studies)
+        finally:
+            logger.remove(sink)
+
+        assert [r.openalex_id for r in results] == [f"W{2000 + i}" for i in range(8)]
+        assert threading.get_ident() not in threads
+        assert 1 < len(threads) <= 4
+        assert service.metrics.snapshot()["peak_concurrency"] == 4
+        assert {f"STD-{i}" for i in range(8)} <= set(logged)
+
+
+class TestAdaptiveConcurrency:
+    """Each adaptive run's controller is fed its own run's requests only."""
+
+    def test_concurrent_runs_do_not_share_request_feedback(self):
+        controllers = []
+
+        class RecordingController(matching_service.AdaptiveConcurrencyController):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.statuses = []
+                controllers.append(self)
+
+            def on_request(self, status, latency):
+                self.statuses.append(status)
+                super().on_request(status, latency)
+
+        service = MatchingService(Config(concurrency_mode="adaptive", concurrency=2))
+        both_running = threading.Barrier(2)
+
+        def execute(ref):
+            both_running.wait()
+            # The throttled run gets 429s; the other run only successes
+            service.metrics.record_request(429 if ref.year == 1999 else 200, 0.1)
+            return [{"id": f"https://openalex.org/W{ref.year}", "title": ref.title}], {}
+
+        service.strategies = [make_strategy("title_only", execute)]
+
+        def batch(year):
+            reference = Reference(title="A randomised trial of penicillin", authors=["Smith J"], year=year)
+            return [Study(id=f"STD-{year}", type=StudyType.INCLUDED, reference=reference)]
+
+        with patch.object(matching_service, "AdaptiveConcurrencyController", RecordingController):
+            runs = [threading.Thread(target=service.match_studies, args=(batch(year),)) for year in (1999, 2001)]
+            for run in runs:
+                run.start()
+            for run in runs:
+                run.join()
+
+        assert sorted(c.statuses for c in controllers) == [[200], [429]]
+
+
+class TestIncrementalRematch:
+    """Re-runs reuse results whose reference and settings are unchanged."""
+
+    @staticmethod
+    def service(**config):
+        service = MatchingService(Config(**config))
+        service.strategies = [
+            make_strategy(
+                "title_only",
+                lambda ref: ([{"id": "https://openalex.org/W1", "title": ref.title}], {})
+                if "penicillin" in ref.title else ([], {"error": "No results found"}),
+            )
+        ]
+        return service
+
+    def test_unchanged_studies_are_not_searched_again(self, study):
+        service = self.service()
+        edited = Study(
+            id="STD-2", type=StudyType.INCLUDED,
+            reference=Reference(title="Tonsillectomy outcomes", authors=["Brown K"], year=1999),
+        )
+        first = service.match_studies([study, edited])
+        edited.reference = Reference(title="Tonsillectomy outcomes in adults", authors=["Brown K"], year=1999)
+        service.strategies[0].execute.reset_mock()
+
+        second = service.match_studies([study, edited], previous=first)
+
+        assert second[0] is first[0]
+        assert second[1] is not first[1]
+        assert service.strategies[0].execute.call_count == 1
+
+    def test_hash_ignores_formatting_but_not_settings(self, study):
+        service = self.service()
+        reformatted = Reference(title="A Randomised Trial of Penicillin.", authors=["SMITH J"], year=2001)
+        assert service.reference_hash(reformatted) == service.reference_hash(study.reference)
+        assert self.service(title_similarity_threshold=0.9).reference_hash(study.reference) != (
+            service.reference_hash(study.reference)
+        )
+
+    def test_old_not_found_results_are_rematched(self, study):
+        service = self.service(rematch_not_found_after=3600)
+        missing = Study(
+            id="STD-2", type=StudyType.INCLUDED,
+            reference=Reference(title="Tonsillectomy outcomes", authors=["Brown K"], year=1999),
+        )
+        first = service.match_studies([missing])
+        assert first[0].status == SearchStatus.NOT_FOUND
+
+        assert service.match_studies([missing], previous=first)[0] is first[0]
+        first[0].matched_at -= timedelta(hours=2)
+        assert service.match_studies([missing], previous=first)[0] is not first[0]
+
+    def test_unsettled_results_are_rematched(self, study):
+        service = self.service()
+        first = service.match_studies([study])
+        first[0].status = SearchStatus.FAILED
+        assert service.match_studies([study], previous=first)[0].status == SearchStatus.FOUND
+
+    def test_reused_results_are_streamed(self, study):
+        service = self.service()
+        first = service.match_studies([study])
+        streamed = []
+        service.match_studies([study], on_result=streamed.append, previous=first)
+        assert streamed == first
+        assert first[0].to_json()["matched_at"] == first[0].matched_at.isoformat()
+
+
+class TestResultStore:
+    """Results of a review are written to the configured store."""
+
+    def test_results_are_stored_and_feed_the_next_run(self, study, tmp_path):
+        service = MatchingService(Config(results_db=str(tmp_path / "results.sqlite")))
+        service.strategies = [
+            make_strategy("title_only", lambda ref: ([{"id": "https://openalex.org/W1", "title": ref.title}], {}))
+        ]
+
+        results = service.match_studies([study], review_id="review-1")
+        stored = service.result_store.previous("review-1")
+
+        assert stored == results
+        service.strategies[0].execute.reset_mock()
+        assert service.match_studies([study], previous=stored)[0].openalex_id == "W1"
+        service.strategies[0].execute.assert_not_called()
+
+
+class TestReport:
+    """The service builds the terminal report with its run metrics."""
+
+    def test_report_includes_run_metrics(self, study):
+        service = MatchingService(Config())
+        service.strategies = [
+            make_strategy("title_only", lambda ref: ([{"id": "https://openalex.org/W1", "title": ref.title}], {}))
+        ]
+        results = service.match_studies([study])
+
+        formatter = service.report(results)
+
+        assert formatter.results == results
+        assert formatter.metrics["studies_completed"] == 1
+        assert formatter.start_time == service.metrics.started_at
+        with patch.object(formatter, "console") as console:
+            formatter.render()
+        titles = [call.args[0].title for call in console.print.call_args_list if hasattr(call.args[0], "title")]
+        assert any("Run Metrics" in str(title) for title in titles)
@@ -0,0 +1,67 @@
+"""Tests for breadth-first stage execution."""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.services.batch_runner import AdaptiveConcurrencyController
+from src.application.services.stage_pipeline import StagePipeline
+from src.domain.enums.search_status import SearchStatus
+
+
+def make_pipeline(matches, skipped=(), controller=None):
+    """Strategy ``s`` matches the studies listed in ``matches[s]``; records call order."""
+    calls = []
+    lock = threading.Lock()
+    strategies = [SimpleNamespace(name=name) for name in matches]
+
+    def start(study):
+        status = SearchStatus.SKIPPED if study in skipped else SearchStatus.NOT_FOUND
+        return SimpleNamespace(study_id=study, status=status, search_attempts=[])
+
+    def attempt(study, result, strategy):
+        with lock:
+            calls.append((strategy.name, study))
+        result.search_attempts.append({"strategy": strategy.name})
+        if study in matches[strategy.name]:
+            result.status = SearchStatus.FOUND
+            return True
+        return False
+
+    def conclude(study, result):
+        result.status = SearchStatus.NOT_FOUND
+
+    return StagePipeline(strategies, start, attempt, conclude, controller), calls
+
+
+@pytest.fixture(params=["sequential", "concurrent"])
+def controller(request):
+    return None if request.param == "sequential" else AdaptiveConcurrencyController(initial=3)
+
+
+def test_each_stage_finishes_before_the_next(controller):
+    pipeline, calls = make_pipeline({"identifier": {"a"}, "title_only": {"b"}}, controller=controller)
+    pipeline.run(["a", "b", "c"])
+
+    stages = [name for name, _ in calls]
+    assert stages == sorted(stages, key=["identifier", "title_only"].index)
+    assert sorted(calls) == [("identifier", "a"), ("identifier", "b"), ("identifier", "c"),
+                             ("title_only", "b"), ("title_only", "c")]
+
+
+def test_results_keep_order_and_per_study_attempts(controller):
+    pipeline, _ = make_pipeline({"identifier": {"b"}, "title_year": set(), "title_only": {"c"}},
+                                controller=controller)
+    results = pipeline.run(["a", "b", "c"])
+
+    assert [r.study_id for r in results] == ["a", "b", "c"]
+    assert [r.status for r in results] == [SearchStatus.NOT_FOUND, SearchStatus.FOUND, SearchStatus.FOUND]
+    assert [a["strategy"] for a in results[0].search_attempts] == ["identifier", "title_year", "title_only"]
+    assert [a["strategy"] for a in results[1].search_attempts] == ["identifier"]
+
+
+def test_skipped_studies_never_run():
+    pipeline, calls = make_pipeline({"identifier": set()}, skipped={"a"})
+    results = pipeline.run(["a", "b"])
+    assert calls == [("identifier", "b")]
+    assert results[0].status == SearchStatus.SKIPPED
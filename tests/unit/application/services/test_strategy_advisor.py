@@ -0,0 +1,45 @@
+"""Tests for adaptive strategy skipping."""
+from src.application.services.strategy_advisor import StrategyAdvisor
+
+
+def test_runs_while_learning():
+    advisor = StrategyAdvisor(floor=0.1, min_samples=5)
+    for _ in range(4):
+        advisor.record("title_authors", False, 0.1)
+    assert advisor.value("title_authors") is None
+    assert advisor.decide("title_authors") == ("run", None)
+
+
+def test_skips_strategy_that_never_wins():
+    advisor = StrategyAdvisor(floor=0.1, min_samples=5)
+    for _ in range(5):
+        advisor.record("title_authors", False, 0.1)
+    decision, reason = advisor.decide("title_authors")
+    assert decision == "skip"
+    assert "won 0/5" in reason
+
+
+def test_keeps_strategy_that_wins():
+    advisor = StrategyAdvisor(floor=0.1, min_samples=5)
+    for won in (True, False, False, False, True):
+        advisor.record("title_only", won, 0.1)
+    assert advisor.value("title_only") == 0.4
+    assert advisor.decide("title_only")[0] == "run"
+
+
+def test_slow_strategies_are_discounted():
+    advisor = StrategyAdvisor(floor=0.1, min_samples=4)
+    for won in (True, False, False, False):
+        advisor.record("cheap", won, 0.1)
+        advisor.record("slow", won, 0.7)
+    assert advisor.value("cheap") == 0.25
+    # Mean attempt cost is 0.4s; the slow strategy costs 0.7s
+    assert abs(advisor.value("slow") - 0.25 * 0.4 / 0.7) < 1e-9
+    assert advisor.decide("slow")[0] == "run"
+
+
+def test_explores_periodically():
+    advisor = StrategyAdvisor(floor=0.1, min_samples=1, explore_every=3)
+    advisor.record("title_authors", False, 0.1)
+    decisions = [advisor.decide("title_authors")[0] for _ in range(6)]
+    assert decisions == ["skip", "skip", "explore", "skip", "skip", "explore"]
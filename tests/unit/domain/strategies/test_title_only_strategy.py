@@ -1,6 +1,7 @@
 import pytest
 from typing import Dict, List, Tuple, Any
 
+from src.domain.exceptions import TransientRepositoryError
 from src.domain.models.reference import Reference
 from src.domain.strategies.title_only_strategy import TitleOnlyStrategy
 from src.domain.models.config import Config
@@ -224,4 +225,67 @@ def test_execute_api_error(title_only_strategy, mock_repository):
     
     assert len(results) == 0
     assert "API error" in metadata["error"]
-    assert "API timeout" in metadata["error"]
\ No newline at end of file
+    assert "API timeout" in metadata["error"]
+
+def test_execute_transient_error_propagates(title_only_strategy, mock_repository):
+    """Transient API errors are re-raised so the cascade can stop."""
+    mock_repository.raise_exception(TransientRepositoryError("HTTP 503", 503))
+
+    reference = Reference(
+        title="Test Publication",
+        year=2023
+    )
+
+    with pytest.raises(TransientRepositoryError):
+        title_only_strategy.execute(reference)
+
+
+class PagedRepository(MockRepository):
+    """Serves ``pages`` through more_pages, recording which pages were fetched."""
+
+    def __init__(self, first_page, pages):
+        super().__init__({"title": first_page})
+        self.pages = pages
+        self.fetched = []
+        self.outcomes = []
+
+    def more_pages(self, search, *args, seen, max_pages):
+        for number, page in enumerate(self.pages[: max_pages - 1], start=2):
+            self.fetched.append(number)
+            yield page
+
+    def record_match_rank(self, search, rank):
+        self.outcomes.append(("rank", search, rank))
+
+    def record_match_miss(self, search, seen):
+        self.outcomes.append(("miss", search, seen))
+
+
+def test_borderline_scores_fetch_next_page():
+    """A near-miss on page 1 pulls page 2, where the right work is."""
+    config = Config(title_similarity_threshold=0.85, max_page_depth=3, page_fetch_margin=0.15)
+    near_miss = {"id": "W1", "title": "Test Publication on Medical Research Methods in Rural Clinics"}
+    target = {"id": "W2", "title": "Test Publication on Medical Research"}
+    repository = PagedRepository([near_miss], [[target], [{"id": "W3", "title": "Unused"}]])
+    strategy = TitleOnlyStrategy(repository, config)
+    best = strategy._best_title_similarity(Reference(title=target["title"]), [near_miss])
+    assert strategy.effective_title_threshold - 0.15 <= best < strategy.effective_title_threshold
+
+    results, metadata = strategy.execute(Reference(title=target["title"]))
+
+    assert [r["id"] for r in results] == ["W2"]
+    assert repository.fetched == [2]
+    assert repository.outcomes == [("rank", "search_by_title", 1)]
+
+
+def test_clear_miss_does_not_page():
+    config = Config(title_similarity_threshold=0.85, max_page_depth=3)
+    repository = PagedRepository([{"id": "W1", "title": "Different Publication Title"}], [[{"id": "W2"}]])
+    strategy = TitleOnlyStrategy(repository, config)
+
+    results, _ = strategy.execute(Reference(title="Test Publication on Medical Research"))
+
+    assert results == []
+    assert repository.fetched == []
+    # The miss is reported too, so page sizes are not learned from matches alone
+    assert repository.outcomes == [("miss", "search_by_title", 1)]
@@ -1,6 +1,7 @@
 import pytest
 from typing import Dict, List, Tuple, Any
 
+from src.domain.exceptions import TransientRepositoryError
 from src.domain.models.reference import Reference
 from src.domain.strategies.title_year_strategy import TitleYearStrategy
 from src.domain.models.config import Config
@@ -231,4 +232,16 @@ def test_execute_api_error(title_year_strategy, mock_repository):
     
     assert len(results) == 0
     assert "API error" in metadata["error"]
-    assert "API timeout" in metadata["error"]
\ No newline at end of file
+    assert "API timeout" in metadata["error"]
+
+def test_execute_transient_error_propagates(title_year_strategy, mock_repository):
+    """Transient API errors are re-raised so the cascade can stop."""
+    mock_repository.raise_exception(TransientRepositoryError("HTTP 503", 503))
+
+    reference = Reference(
+        title="Test Publication",
+        year=2023
+    )
+
+    with pytest.raises(TransientRepositoryError):
+        title_year_strategy.execute(reference)
@@ -0,0 +1,26 @@
+"""Tests for repository error classification."""
+import pytest
+
+from src.domain.exceptions import (
+    PermanentRepositoryError,
+    RepositoryError,
+    TransientRepositoryError,
+    error_for_status,
+)
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_rate_limits_and_server_errors_are_transient(status):
+    error = error_for_status(status, "boom")
+    assert isinstance(error, TransientRepositoryError)
+    assert error.status_code == status
+
+
+@pytest.mark.parametrize("status", [400, 403, 404])
+def test_client_errors_are_permanent(status):
+    assert isinstance(error_for_status(status, "boom"), PermanentRepositoryError)
+
+
+def test_both_kinds_are_repository_errors():
+    assert issubclass(TransientRepositoryError, RepositoryError)
+    assert issubclass(PermanentRepositoryError, RepositoryError)
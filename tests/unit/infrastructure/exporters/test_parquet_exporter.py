@@ -0,0 +1,96 @@
+"""Tests for the Parquet exporter."""
+import sys
+
+import pytest
+
+from src.domain.enums.search_status import SearchStatus
+from src.domain.enums.study_type import StudyType
+from src.domain.models.search_result import SearchResult
+from src.infrastructure.exporters.parquet_exporter import COLUMNS, ParquetExporter, result_row
+
+
+def make_result(study_id, status=SearchStatus.FOUND, **fields):
+    return SearchResult(study_id=study_id, study_type=StudyType.INCLUDED, status=status, **fields)
+
+
+def test_result_row_flattens_scores():
+    result = make_result(
+        "STD-1", strategy="title_only", openalex_id="W1", year=2001, doi="10.1/x", citation_count=12,
+        search_details={"title_similarity": 0.97, "authors_similarity": 1, "combined_score": "n/a"},
+    )
+    row = result_row("review-1", result)
+
+    assert list(row) == [name for name, _ in COLUMNS]
+    assert row["status"] == "found"
+    assert row["title_similarity"] == 0.97
+    assert row["authors_similarity"] == 1.0
+    assert row["combined_score"] is None
+
+
+def test_result_row_without_details():
+    row = result_row("review-1", make_result("STD-1", SearchStatus.NOT_FOUND))
+    assert row["openalex_id"] is None
+    assert row["title_similarity"] is None
+
+
+def test_missing_pyarrow_names_the_extra(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match=r"openalex-py\[parquet\]"):
+        ParquetExporter(tmp_path)
+
+
+def test_rejects_unknown_partition(tmp_path):
+    with pytest.raises(ValueError, match="partition_by"):
+        ParquetExporter(tmp_path, partition_by="strategy")
+
+
+class TestWrite:
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_partitions_by_review(self, tmp_path):
+        import pyarrow.dataset as ds
+
+        with ParquetExporter(tmp_path, batch_size=2) as exporter:
+            exporter.write("review-1", make_result("STD-1", strategy="doi", year=2001, citation_count=3))
+            exporter.write("review-1", make_result("STD-2", SearchStatus.REJECTED))
+            exporter.write_all("review-2", [make_result("STD-1", search_details={"title_similarity": 0.9})])
+
+        assert exporter.rows_written == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["review_id=review-1", "review_id=review-2"]
+        table = ds.dataset(tmp_path, format="parquet", partitioning="hive").to_table()
+        rows = sorted(table.to_pylist(), key=lambda r: (r["review_id"], r["study_id"]))
+        assert [(r["review_id"], r["study_id"]) for r in rows] == [
+            ("review-1", "STD-1"), ("review-1", "STD-2"), ("review-2", "STD-1"),
+        ]
+        assert rows[0]["year"] == 2001 and rows[0]["citation_count"] == 3
+        assert rows[2]["title_similarity"] == 0.9
+
+    def test_partitions_by_status(self, tmp_path):
+        exporter = ParquetExporter(tmp_path, partition_by="status")
+        on_result = exporter.writer("review-1")
+        on_result(make_result("STD-1"))
+        on_result(make_result("STD-2", SearchStatus.NOT_FOUND))
+        assert exporter.rows_written == 0
+        exporter.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["status=found", "status=not_found"]
+        assert exporter.rows_written == 2
+
+    def test_exporters_sharing_a_root_keep_each_others_files(self, tmp_path):
+        import pyarrow.dataset as ds
+
+        for study_id in ("STD-1", "STD-2"):
+            with ParquetExporter(tmp_path) as exporter:
+                exporter.write("review-1", make_result(study_id))
+
+        table = ds.dataset(tmp_path, format="parquet", partitioning="hive").to_table()
+        assert sorted(table.column("study_id").to_pylist()) == ["STD-1", "STD-2"]
+
+    def test_typed_schema(self, tmp_path, pyarrow):
+        exporter = ParquetExporter(tmp_path)
+        exporter.write("review-1", make_result("STD-1"))
+        batch = exporter.record_batch()
+        assert batch.schema.field("year").type == pyarrow.int32()
+        assert batch.schema.field("combined_score").type == pyarrow.float64()
@@ -0,0 +1,143 @@
+"""Tests for the repository circuit breaker."""
+import threading
+
+import pytest
+
+from src.domain.exceptions import (
+    CircuitOpenError,
+    PermanentRepositoryError,
+    TransientRepositoryError,
+)
+from src.infrastructure.http.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def fail():
+    raise TransientRepositoryError("HTTP 503", 503)
+
+
+def call_failing(breaker, times):
+    for _ in range(times):
+        with pytest.raises(TransientRepositoryError):
+            breaker.call(fail)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, window=100, clock=clock)
+    call_failing(breaker, 2)
+    assert breaker.state == CLOSED
+    call_failing(breaker, 1)
+    assert breaker.state == OPEN
+
+
+def test_open_breaker_fails_fast(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=clock)
+    call_failing(breaker, 1)
+    clock.now = 10.0
+    calls = []
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.call(lambda: calls.append(1))
+    assert calls == []
+    assert excinfo.value.retry_after == pytest.approx(20.0)
+
+
+def test_opens_on_error_rate(clock):
+    breaker = CircuitBreaker(failure_threshold=100, error_rate=0.5, window=4, clock=clock)
+    for _ in range(2):
+        breaker.call(lambda: "ok")
+        call_failing(breaker, 1)
+    assert breaker.state == OPEN
+
+
+def test_permanent_errors_do_not_count(clock):
+    breaker = CircuitBreaker(failure_threshold=1, clock=clock)
+
+    def bad_request():
+        raise PermanentRepositoryError("HTTP 400", 400)
+
+    with pytest.raises(PermanentRepositoryError):
+        breaker.call(bad_request)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_closes_on_success(clock):
+    states = []
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=5.0, clock=clock, on_state_change=states.append
+    )
+    call_failing(breaker, 1)
+    clock.now = 5.0
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+    assert states == [OPEN, HALF_OPEN, CLOSED]
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+    call_failing(breaker, 1)
+    clock.now = 6.0
+    call_failing(breaker, 1)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.call(lambda: "ok")
+    assert excinfo.value.retry_after == pytest.approx(5.0)
+
+
+def test_only_one_probe_while_half_open(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+    call_failing(breaker, 1)
+    clock.now = 5.0
+
+    def probe():
+        # A concurrent caller arriving during the probe is turned away
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "second")
+        return "probe"
+
+    assert breaker.call(probe) == "probe"
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.parametrize("late_outcome", [fail, lambda: "late"])
+def test_late_results_do_not_decide_half_open(clock, late_outcome):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+    started, finish = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        finish.wait(5)
+        return late_outcome()
+
+    def straggle():
+        try:
+            breaker.call(slow)
+        except TransientRepositoryError:
+            pass
+
+    straggler = threading.Thread(target=straggle)
+    straggler.start()
+    started.wait(5)
+    call_failing(breaker, 1)
+    clock.now = 5.0
+
+    def probe():
+        # The call started while closed finishes while the probe is out
+        finish.set()
+        straggler.join(5)
+        assert breaker.state == HALF_OPEN
+        return "probe"
+
+    assert breaker.call(probe) == "probe"
+    assert breaker.state == CLOSED
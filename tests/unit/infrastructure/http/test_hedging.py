@@ -0,0 +1,132 @@
+"""Tests for hedged OpenAlex requests."""
+import threading
+
+import pytest
+
+from src.domain.exceptions import TransientRepositoryError
+from src.infrastructure.http.hedging import HedgingTransport
+
+
+class ScriptedTransport:
+    """Answers immediately unless the call number is listed in ``slow`` or ``throttled``."""
+
+    http_version = "HTTP/1.1"
+    observer = None
+
+    def __init__(self, slow=(), fail=False, throttled=()):
+        self.slow = set(slow)
+        self.fail = fail
+        self.throttled = set(throttled)
+        self.calls = 0
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def get_json(self, url, headers, timeout=None, retry=True):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call in self.throttled:
+            raise TransientRepositoryError("HTTP 429", 429, retry_after=1.0)
+        if call in self.slow:
+            self.release.wait(5)
+        if self.fail:
+            raise TransientRepositoryError("HTTP 503", 503)
+        return {"call": call}
+
+    def close(self):
+        pass
+
+
+def single_attempt(hedging):
+    return hedging.get_json("https://api.openalex.org/works", {}, retry=False)
+
+
+def warm_up(hedging, count=20):
+    for _ in range(count):
+        single_attempt(hedging)
+
+
+def test_no_hedge_before_warm_up():
+    inner = ScriptedTransport()
+    hedging = HedgingTransport(inner, budget=1.0, min_samples=20)
+    assert hedging.hedge_delay() is None
+    warm_up(hedging, 5)
+    assert inner.calls == 5
+    assert hedging.hedge_delay() is None
+
+
+def test_hedge_answers_for_slow_primary():
+    inner = ScriptedTransport(slow={21})
+    outcomes = []
+    hedging = HedgingTransport(inner, budget=0.5, min_samples=20, on_hedge=outcomes.append)
+    warm_up(hedging)
+
+    body = single_attempt(hedging)
+    inner.release.set()
+
+    assert body == {"call": 22}
+    assert outcomes == [True]
+    hedging.close()
+
+
+def test_budget_caps_hedges():
+    inner = ScriptedTransport(slow={21, 23})
+    outcomes = []
+    # 21 requests * 0.05 allows one hedge only
+    hedging = HedgingTransport(inner, budget=0.05, min_samples=20, on_hedge=outcomes.append)
+    warm_up(hedging)
+
+    def release_soon():
+        threading.Timer(0.2, inner.release.set).start()
+
+    release_soon()
+    single_attempt(hedging)
+    assert outcomes == [True]
+    inner.release.clear()
+    release_soon()
+    body = single_attempt(hedging)
+    assert outcomes == [True]
+    assert body == {"call": 23}
+    hedging.close()
+
+
+def test_raises_when_primary_and_hedge_fail():
+    inner = ScriptedTransport(slow={21})
+    hedging = HedgingTransport(inner, budget=1.0, min_samples=20)
+    warm_up(hedging)
+    inner.fail = True
+    threading.Timer(0.1, inner.release.set).start()
+
+    with pytest.raises(TransientRepositoryError):
+        single_attempt(hedging)
+    hedging.close()
+
+
+def test_retrying_calls_are_not_hedged():
+    inner = ScriptedTransport(slow={21})
+    outcomes = []
+    hedging = HedgingTransport(inner, budget=1.0, min_samples=20, on_hedge=outcomes.append)
+    warm_up(hedging)
+    threading.Timer(0.2, inner.release.set).start()
+
+    # Slow because urllib3 may be sleeping on a Retry-After; a duplicate would only add load
+    assert hedging.get_json("https://api.openalex.org/works", {}) == {"call": 21}
+    assert inner.calls == 21
+    assert outcomes == []
+    hedging.close()
+
+
+def test_no_hedges_after_a_429():
+    inner = ScriptedTransport(slow={22}, throttled={21})
+    outcomes = []
+    hedging = HedgingTransport(inner, budget=1.0, min_samples=20, on_hedge=outcomes.append)
+    warm_up(hedging)
+
+    with pytest.raises(TransientRepositoryError, match="429"):
+        single_attempt(hedging)
+    # The caller's retry is slow, but the API asked to slow down: no duplicate
+    threading.Timer(0.2, inner.release.set).start()
+    assert single_attempt(hedging) == {"call": 22}
+    assert inner.calls == 22
+    assert outcomes == []
+    hedging.close()
@@ -0,0 +1,191 @@
+"""Tests for the OpenAlex HTTP transports."""
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import urllib3.response
+
+from src.application.services.batch_runner import AdaptiveConcurrencyController
+from src.domain.exceptions import PermanentRepositoryError, TransientRepositoryError
+from src.domain.models.config import Config
+from src.infrastructure.http.transport import (
+    HttpxTransport,
+    RequestsTransport,
+    connection_pool_size,
+    create_transport,
+)
+
+
+class TestCreateTransport:
+    """Tests for transport selection."""
+
+    def test_http11_by_default(self):
+        transport = create_transport(Config())
+        assert isinstance(transport, RequestsTransport)
+        assert transport.http_version == "HTTP/1.1"
+
+    def test_falls_back_to_http11_without_h2(self, monkeypatch):
+        # A None entry in sys.modules makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, "h2", None)
+        transport = create_transport(Config(http2=True))
+        assert isinstance(transport, RequestsTransport)
+
+    def test_http2_when_available(self):
+        pytest.importorskip("h2")
+        transport = create_transport(Config(http2=True))
+        assert isinstance(transport, HttpxTransport)
+        assert transport.http_version == "HTTP/2"
+
+    def test_requests_connection_errors_are_transient(self):
+        # Nothing listens on port 9 (discard) locally
+        transport = RequestsTransport(Config(max_retries=0, request_timeout=1.0))
+        with pytest.raises(TransientRepositoryError):
+            transport.get_json("http://127.0.0.1:9/works", {})
+
+    def test_requests_pool_and_retries_follow_config(self):
+        transport = RequestsTransport(
+            Config(concurrency=7, max_concurrency=7, max_retries=4, retry_http_codes=[429])
+        )
+        adapter = transport._session.get_adapter("http://localhost")
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 4
+        assert adapter.max_retries.status_forcelist == [429]
+
+    def test_pool_covers_adaptive_ceiling(self):
+        config = Config(concurrency=4, max_concurrency=48)
+        controller = AdaptiveConcurrencyController(initial=config.concurrency, max_limit=config.max_concurrency)
+        transport = RequestsTransport(config)
+        assert transport._adapter._pool_maxsize >= controller.max_limit
+        assert transport._single_attempt._pool_maxsize >= controller.max_limit
+
+    def test_pool_covers_concurrent_runs_and_hedges(self):
+        config = Config(concurrency=10, max_concurrency=10, hedge_requests=True, hedge_budget=0.1)
+        assert connection_pool_size(config) == 11
+        assert connection_pool_size(config, concurrent_runs=4) == 44
+        transport = RequestsTransport(config, concurrent_runs=4)
+        assert transport._adapter._pool_maxsize == 44
+
+    def test_requests_accepts_compressed_responses(self):
+        transport = RequestsTransport(Config())
+        accepted = transport._session.headers["Accept-Encoding"]
+        assert "gzip" in accepted
+        # urllib3 offers zstd once it has a decoder for it (backports.zstd on 3.13 and older)
+        if getattr(urllib3.response, "HAS_ZSTD", False):
+            assert "zstd" in accepted
+
+    def test_requests_sessions_are_per_thread(self):
+        transport = RequestsTransport(Config())
+        sessions = []
+        worker = threading.Thread(target=lambda: sessions.append(transport._session))
+        worker.start()
+        worker.join()
+
+        assert transport._session is transport._session
+        assert sessions[0] is not transport._session
+        # One connection pool serves every thread's session
+        assert sessions[0].get_adapter("http://localhost") is transport._session.get_adapter("http://localhost")
+
+    def test_requests_threads_do_not_accumulate_pools(self):
+        transport = RequestsTransport(Config())
+        for _ in range(5):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                adapters = set(
+                    pool.map(lambda _: id(transport._session.get_adapter("http://localhost")), range(8))
+                )
+            assert adapters == {id(transport._adapter)}
+        transport.close()
+
+
+class TestHttpxTransport:
+    """Tests for the HTTP/2 transport's retry loop."""
+
+    @pytest.fixture
+    def httpx(self):
+        pytest.importorskip("h2")
+        return pytest.importorskip("httpx")
+
+    def _transport(self, httpx, handler, **config):
+        transport = HttpxTransport(Config(retry_backoff_factor=0.0, **config))
+        transport._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return transport
+
+    def test_returns_json_and_sends_headers(self, httpx):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("From"))
+            return httpx.Response(200, json={"results": [{"id": "W1"}]})
+
+        transport = self._transport(httpx, handler)
+        body = transport.get_json("https://api.openalex.org/works", {"From": "a@b.c"})
+
+        assert body == {"results": [{"id": "W1"}]}
+        assert seen == ["a@b.c"]
+
+    def test_retries_configured_status_codes(self, httpx):
+        statuses = iter([429, 503, 200])
+
+        def handler(request):
+            status = next(statuses)
+            return httpx.Response(status, json={"results": []})
+
+        transport = self._transport(httpx, handler, max_retries=3)
+        assert transport.get_json("https://api.openalex.org/works", {}) == {"results": []}
+
+    def test_raises_after_max_retries(self, httpx):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        transport = self._transport(httpx, handler, max_retries=2, retry_http_codes=[500])
+        with pytest.raises(TransientRepositoryError) as excinfo:
+            transport.get_json("https://api.openalex.org/works", {})
+        assert excinfo.value.status_code == 500
+        assert len(calls) == 3
+
+    def test_single_attempt_reports_retry_after(self, httpx):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, headers={"Retry-After": "7"})
+
+        transport = self._transport(httpx, handler, max_retries=3)
+        with pytest.raises(TransientRepositoryError) as excinfo:
+            transport.get_json("https://api.openalex.org/works", {}, retry=False)
+        assert excinfo.value.retry_after == 7.0
+        assert len(calls) == 1
+
+    def test_client_errors_are_permanent(self, httpx):
+        transport = self._transport(httpx, lambda request: httpx.Response(400))
+        with pytest.raises(PermanentRepositoryError):
+            transport.get_json("https://api.openalex.org/works", {})
+
+    def test_connection_errors_are_transient(self, httpx):
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        transport = self._transport(httpx, handler, max_retries=1)
+        with pytest.raises(TransientRepositoryError):
+            transport.get_json("https://api.openalex.org/works", {})
+
+    def test_retry_after_header_overrides_backoff(self, httpx):
+        transport = self._transport(httpx, lambda request: httpx.Response(200))
+        assert transport._retry_delay(0, "2") == 2.0
+        assert transport._retry_delay(2, None) == 0.0
+
+    def test_observer_sees_every_attempt(self, httpx):
+        statuses = iter([429, 200])
+        observed = []
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={"results": []})
+
+        transport = self._transport(httpx, handler, max_retries=3)
+        transport.observer = lambda status, latency: observed.append((status, latency is None))
+        transport.get_json("https://api.openalex.org/works", {})
+
+        assert observed == [(429, True), (200, False)]
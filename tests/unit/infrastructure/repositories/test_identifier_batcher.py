@@ -0,0 +1,194 @@
+"""Tests for coalescing concurrent identifier lookups."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.domain.exceptions import (
+    DeadlineExceededError,
+    PermanentRepositoryError,
+    TransientRepositoryError,
+)
+from src.infrastructure.repositories.identifier_batcher import IdentifierBatcher, identifier_key
+from src.utils.deadline import Deadline, current_deadline, deadline_scope
+
+
+def doi_work(doi):
+    doi = identifier_key("doi", doi)
+    return {"id": f"W-{doi}", "doi": f"https://doi.org/{doi}"}
+
+
+class RecordingFetch:
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+        self.lock = threading.Lock()
+
+    def __call__(self, kind, identifiers):
+        with self.lock:
+            self.calls.append((kind, list(identifiers)))
+        if self.error is not None:
+            raise self.error
+        if kind == "doi":
+            return [doi_work(i) for i in identifiers if not i.endswith("missing")]
+        return [{"id": f"W{i}", "ids": {"pmid": f"https://pubmed.ncbi.nlm.nih.gov/{i}"}} for i in identifiers]
+
+
+def lookup_all(batcher, kind, identifiers):
+    with ThreadPoolExecutor(max_workers=len(identifiers)) as pool:
+        return list(pool.map(lambda i: batcher.lookup(kind, i), identifiers))
+
+
+@pytest.mark.parametrize(
+    "doi",
+    [
+        "10.1/abc",
+        " https://doi.org/10.1/ABC ",
+        "http://doi.org/10.1/abc",
+        "https://dx.doi.org/10.1/abc",
+        "http://dx.doi.org/10.1/ABC",
+        "doi:10.1/abc",
+        "DOI: 10.1/abc",
+    ],
+)
+def test_identifier_key_doi_forms(doi):
+    assert identifier_key("doi", doi) == "10.1/abc"
+
+
+def test_identifier_key():
+    assert identifier_key("pmid", "https://pubmed.ncbi.nlm.nih.gov/123/") == "123"
+    assert identifier_key("doi", None) is None
+
+
+def test_concurrent_lookups_share_one_request():
+    fetch = RecordingFetch()
+    batcher = IdentifierBatcher(fetch, max_wait=0.5, max_batch=4)
+    dois = ["10.1/a", "10.1/B", "10.1/c", "10.1/missing"]
+
+    works = lookup_all(batcher, "doi", dois)
+
+    assert len(fetch.calls) == 1
+    assert sorted(fetch.calls[0][1]) == sorted(dois)
+    assert [w and w["id"] for w in works] == ["W-10.1/a", "W-10.1/b", "W-10.1/c", None]
+
+
+def test_full_batches_are_sent_without_waiting():
+    fetch = RecordingFetch()
+    batcher = IdentifierBatcher(fetch, max_wait=30.0, max_batch=2)
+
+    works = lookup_all(batcher, "pmid", ["1", "2", "3", "4"])
+
+    assert [w["id"] for w in works] == ["W1", "W2", "W3", "W4"]
+    assert sorted(len(ids) for _, ids in fetch.calls) == [2, 2]
+
+
+def test_duplicate_identifiers_are_fetched_once():
+    fetch = RecordingFetch()
+    batcher = IdentifierBatcher(fetch, max_wait=0.2, max_batch=3)
+
+    works = lookup_all(batcher, "doi", ["10.1/a", "10.1/A", "https://doi.org/10.1/a"])
+
+    assert len(fetch.calls) == 1 and len(fetch.calls[0][1]) == 1
+    assert {w["id"] for w in works} == {"W-10.1/a"}
+
+
+def test_lone_lookup_waits_at_most_max_wait():
+    fetch = RecordingFetch()
+    batcher = IdentifierBatcher(fetch, max_wait=0.0)
+    assert batcher.lookup("doi", "10.1/a")["id"] == "W-10.1/a"
+    assert fetch.calls == [("doi", ["10.1/a"])]
+
+
+def test_lone_lookup_keeps_first_work_whatever_its_doi():
+    batcher = IdentifierBatcher(lambda kind, ids: [{"id": "W1", "doi": "https://doi.org/10.1/other"}], max_wait=0.0)
+    assert batcher.lookup("doi", "10.1/a") == {"id": "W1", "doi": "https://doi.org/10.1/other"}
+
+
+def test_transient_errors_reach_every_caller():
+    fetch = RecordingFetch(error=TransientRepositoryError("HTTP 503", 503))
+    batcher = IdentifierBatcher(fetch, max_wait=0.5, max_batch=2)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(batcher.lookup, "doi", doi) for doi in ("10.1/a", "10.1/b")]
+        for future in futures:
+            with pytest.raises(TransientRepositoryError, match="HTTP 503"):
+                future.result()
+    assert len(fetch.calls) == 1
+
+
+@pytest.mark.parametrize("error", [PermanentRepositoryError("HTTP 400", 400), ValueError("bad page")])
+def test_other_errors_fall_back_to_lone_lookups(error):
+    def fetch(kind, identifiers):
+        if len(identifiers) > 1 or identifiers == ["10.1/bad"]:
+            raise error
+        return [doi_work(i) for i in identifiers]
+
+    batcher = IdentifierBatcher(fetch, max_wait=0.5, max_batch=2)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        good = pool.submit(batcher.lookup, "doi", "10.1/good")
+        bad = pool.submit(batcher.lookup, "doi", "10.1/bad")
+        assert good.result()["id"] == "W-10.1/good"
+        with pytest.raises(type(error)):
+            bad.result()
+
+
+def lookup_within(batcher, kind, identifier, seconds):
+    with deadline_scope(Deadline.after(seconds)):
+        return batcher.lookup(kind, identifier)
+
+
+def test_batch_is_fetched_under_the_latest_deadline():
+    seen = []
+
+    def fetch(kind, identifiers):
+        seen.append(current_deadline())
+        return [doi_work(i) for i in identifiers]
+
+    batcher = IdentifierBatcher(fetch, max_wait=0.5, max_batch=3)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        short = pool.submit(lookup_within, batcher, "doi", "10.1/a", 5.0)
+        time.sleep(0.05)
+        long = pool.submit(lookup_within, batcher, "doi", "10.1/b", 60.0)
+        unlimited = pool.submit(batcher.lookup, "doi", "10.1/c")
+        assert [f.result()["id"] for f in (short, long, unlimited)] == ["W-10.1/a", "W-10.1/b", "W-10.1/c"]
+    assert seen == [None]
+
+    batcher = IdentifierBatcher(fetch, max_wait=0.5, max_batch=2)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(lambda args: lookup_within(batcher, "doi", *args), [("10.1/a", 5.0), ("10.1/b", 60.0)]))
+    assert 55.0 < seen[1].remaining() <= 60.0
+
+
+def test_callers_wait_only_their_own_time():
+    def slow_fetch(kind, identifiers):
+        time.sleep(0.5)
+        return [doi_work(i) for i in identifiers]
+
+    batcher = IdentifierBatcher(slow_fetch, max_wait=0.1, max_batch=2)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        hurried = pool.submit(lookup_within, batcher, "doi", "10.1/a", 0.2)
+        patient = pool.submit(batcher.lookup, "doi", "10.1/b")
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            hurried.result()
+        assert time.monotonic() - start < 0.4
+        assert patient.result()["id"] == "W-10.1/b"
+
+
+def test_deadline_of_the_shared_request_is_not_an_error_for_callers_with_time_left():
+    calls = []
+
+    def fetch(kind, identifiers):
+        calls.append(list(identifiers))
+        if len(calls) == 1:
+            raise DeadlineExceededError("Deadline exceeded during OpenAlex request")
+        return [doi_work(i) for i in identifiers]
+
+    batcher = IdentifierBatcher(fetch, max_wait=0.0)
+    assert batcher.lookup("doi", "10.1/a")["id"] == "W-10.1/a"
+    assert calls == [["10.1/a"], ["10.1/a"]]
+
+
+def test_max_batch_is_capped():
+    assert IdentifierBatcher(RecordingFetch(), max_batch=500).max_batch == 100
@@ -1,9 +1,23 @@
 """Tests for the OpenAlex repository implementation."""
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote_plus
+
+import pyalex
 import pytest
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import MagicMock
 
+from src.domain.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    TransientRepositoryError,
+)
 from src.domain.models.config import Config
 from src.infrastructure.repositories.openalex_repository import OpenAlexRepository
+from src.infrastructure.repositories.work_fields import WORK_FIELDS
+from src.utils.deadline import Deadline, deadline_scope
+from src.utils.metrics import RunMetrics
 
 
 @pytest.fixture
@@ -23,47 +37,67 @@ def config():
 @pytest.fixture
 def repository(config):
     """Create a repository with config."""
-    # Setup pyalex.config mock as a dictionary-like object
-    config_mock = {}
-    
-    with patch("pyalex.config", config_mock):
-        # Create the repository
-        repo = OpenAlexRepository(config)
-        return repo
+    return OpenAlexRepository(config)
 
 
 class TestOpenAlexRepositoryConfiguration:
     """Tests for repository configuration."""
 
     def test_init_with_email(self):
-        """Test that email is set in pyalex.config."""
-        config_mock = {}
-        with patch("pyalex.config", config_mock):
-            config = Config(openalex_email="test@example.com")
-            OpenAlexRepository(config)
-            assert config_mock["email"] == "test@example.com"
+        """Test that the email is sent in the polite-pool header."""
+        repo = OpenAlexRepository(Config(openalex_email="test@example.com"))
+        assert repo._auth_headers()["From"] == "test@example.com"
 
     def test_init_without_email(self):
         """Test initialization without email."""
-        config_mock = {}
-        with patch("pyalex.config", config_mock):
-            config = Config(openalex_email=None)
-            OpenAlexRepository(config)
-            assert config_mock["email"] is None
+        repo = OpenAlexRepository(Config(openalex_email=None))
+        assert "From" not in repo._auth_headers()
 
     def test_init_sets_retry_parameters(self):
         """Test that retry parameters are set correctly."""
-        config_mock = {}
-        with patch("pyalex.config", config_mock):
-            config = Config(
-                max_retries=5,
-                retry_backoff_factor=0.7,
-                retry_http_codes=[429, 500, 503],
-            )
-            OpenAlexRepository(config)
-            assert config_mock["max_retries"] == 5
-            assert config_mock["retry_backoff_factor"] == 0.7
-            assert config_mock["retry_http_codes"] == [429, 500, 503]
+        config = Config(
+            max_retries=5,
+            retry_backoff_factor=0.7,
+            retry_http_codes=[429, 500, 503],
+        )
+        repo = OpenAlexRepository(config)
+        retries = repo._transport._session.get_adapter("https://api.openalex.org").max_retries
+        assert retries.total == 5
+        assert retries.backoff_factor == 0.7
+        assert retries.status_forcelist == [429, 500, 503]
+
+    def test_init_leaves_pyalex_config_alone(self):
+        """Test that the process-global pyalex.config is never written."""
+        before = dict(pyalex.config)
+        OpenAlexRepository(Config(openalex_email="test@example.com", max_retries=9))
+        assert dict(pyalex.config) == before
+
+    def test_instances_are_configured_independently(self):
+        """Test that two repositories with different settings coexist."""
+        fast = OpenAlexRepository(Config(openalex_email="warm@example.com", max_retries=0, concurrency=32, max_concurrency=32))
+        polite = OpenAlexRepository(Config(openalex_email="slow@example.com", max_retries=6, concurrency=2, max_concurrency=2))
+
+        assert fast._auth_headers()["From"] == "warm@example.com"
+        assert polite._auth_headers()["From"] == "slow@example.com"
+        fast_adapter = fast._transport._session.get_adapter("https://api.openalex.org")
+        polite_adapter = polite._transport._session.get_adapter("https://api.openalex.org")
+        assert (fast_adapter.max_retries.total, fast_adapter._pool_maxsize) == (0, 32)
+        assert (polite_adapter.max_retries.total, polite_adapter._pool_maxsize) == (6, 2)
+
+
+def stub_transport(repository, results=None, error=None):
+    """Answer the repository's HTTP calls without touching the network."""
+    repository._transport = MagicMock()
+    if error is not None:
+        repository._transport.get_json.side_effect = error
+    else:
+        repository._transport.get_json.return_value = {"results": results or []}
+    return repository._transport.get_json
+
+
+def requested_url(get_json):
+    """The (decoded) URL of the last request."""
+    return unquote_plus(get_json.call_args[0][0])
 
 
 class TestGetByDoi:
@@ -71,100 +105,48 @@ class TestGetByDoi:
 
     def test_get_by_doi_success(self, repository):
         """Test successful DOI lookup."""
-        # Setup mock chain
-        mock_filter = MagicMock()
-        mock_filter.get.return_value = [{"id": "W123", "title": "Example"}]
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.filter.return_value = mock_filter
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_doi("10.1234/test")
-            
-            # Assertions
-            mock_works_instance.filter.assert_called_once_with(doi="10.1234/test")
-            mock_filter.get.assert_called_once()
-            assert result == {"id": "W123", "title": "Example"}
+        get_json = stub_transport(repository, [{"id": "W123", "title": "Example"}])
+
+        result = repository.get_by_doi("10.1234/test")
+
+        get_json.assert_called_once()
+        assert "filter=doi:10.1234/test" in requested_url(get_json)
+        assert result == {"id": "W123", "title": "Example"}
 
     def test_get_by_doi_not_found(self, repository):
         """Test DOI not found."""
-        # Setup mock chain
-        mock_filter = MagicMock()
-        mock_filter.get.return_value = []
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.filter.return_value = mock_filter
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_doi("10.1234/nonexistent")
-            
-            # Assertions
-            assert result is None
+        stub_transport(repository, [])
+
+        assert repository.get_by_doi("10.1234/nonexistent") is None
 
     def test_get_by_doi_empty(self, repository):
         """Test empty DOI."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_doi("")
-            
-            # Assertions
-            mock_works.assert_not_called()
-            assert result is None
+        get_json = stub_transport(repository)
+
+        assert repository.get_by_doi("") is None
+        get_json.assert_not_called()
 
     def test_get_by_doi_normalizes_whitespace(self, repository):
         """Test DOI normalization."""
-        # Setup mock chain
-        mock_filter = MagicMock()
-        mock_filter.get.return_value = [{"id": "W123"}]
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.filter.return_value = mock_filter
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_doi(" 10.1234/test ")
-            
-            # Assertions
-            mock_works_instance.filter.assert_called_once_with(doi="10.1234/test")
-            assert result == {"id": "W123"}
+        get_json = stub_transport(repository, [{"id": "W123"}])
+
+        result = repository.get_by_doi(" 10.1234/test ")
+
+        assert "filter=doi:10.1234/test&" in requested_url(get_json)
+        assert result == {"id": "W123"}
 
     def test_get_by_doi_api_error(self, repository):
-        """Test API error handling."""
-        # Setup mock chain
-        mock_filter = MagicMock()
-        mock_filter.get.side_effect = Exception("API error")
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.filter.return_value = mock_filter
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_doi("10.1234/test")
-            
-            # Assertions
-            assert result is None
+        """Test unexpected error handling."""
+        stub_transport(repository, error=Exception("API error"))
+
+        assert repository.get_by_doi("10.1234/test") is None
+
+    def test_get_by_doi_repository_error_propagates(self, repository):
+        """Test that failed calls are not reported as 'not found'."""
+        stub_transport(repository, error=TransientRepositoryError("HTTP 503", 503))
+
+        with pytest.raises(TransientRepositoryError):
+            repository.get_by_doi("10.1234/test")
 
 
 class TestGetByPmid:
@@ -172,100 +154,49 @@ class TestGetByPmid:
 
     def test_get_by_pmid_success(self, repository):
         """Test successful PMID lookup."""
-        # Setup mock chain
-        mock_filter = MagicMock()
-        mock_filter.get.return_value = [{"id": "W123", "pmid": "12345678"}]
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.filter.return_value = mock_filter
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_pmid("12345678")
-            
-            # Assertions
-            mock_works_instance.filter.assert_called_once_with(pmid="12345678")
-            mock_filter.get.assert_called_once()
-            assert result == {"id": "W123", "pmid": "12345678"}
+        work = {"id": "W123", "ids": {"pmid": "https://pubmed.ncbi.nlm.nih.gov/12345678"}}
+        get_json = stub_transport(repository, [work])
+
+        result = repository.get_by_pmid("12345678")
+
+        get_json.assert_called_once()
+        assert "filter=pmid:12345678" in requested_url(get_json)
+        assert result["id"] == "W123"
 
     def test_get_by_pmid_not_found(self, repository):
         """Test PMID not found."""
-        # Setup mock chain
-        mock_filter = MagicMock()
-        mock_filter.get.return_value = []
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.filter.return_value = mock_filter
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_pmid("99999999")
-            
-            # Assertions
-            assert result is None
+        stub_transport(repository, [])
+
+        assert repository.get_by_pmid("99999999") is None
 
     def test_get_by_pmid_empty(self, repository):
         """Test empty PMID."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_pmid("")
-            
-            # Assertions
-            mock_works.assert_not_called()
-            assert result is None
+        get_json = stub_transport(repository)
+
+        assert repository.get_by_pmid("") is None
+        get_json.assert_not_called()
 
     def test_get_by_pmid_normalizes_whitespace(self, repository):
         """Test PMID normalization."""
-        # Setup mock chain
-        mock_filter = MagicMock()
-        mock_filter.get.return_value = [{"id": "W123"}]
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.filter.return_value = mock_filter
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_pmid(" 12345678 ")
-            
-            # Assertions
-            mock_works_instance.filter.assert_called_once_with(pmid="12345678")
-            assert result == {"id": "W123"}
+        get_json = stub_transport(repository, [{"id": "W123"}])
+
+        result = repository.get_by_pmid(" 12345678 ")
+
+        assert "filter=pmid:12345678&" in requested_url(get_json)
+        assert result == {"id": "W123"}
+
+    def test_get_by_pmid_invalid_format(self, repository):
+        """Test that non-numeric PMIDs are not sent."""
+        get_json = stub_transport(repository)
+
+        assert repository.get_by_pmid("PMC123") is None
+        get_json.assert_not_called()
 
     def test_get_by_pmid_api_error(self, repository):
-        """Test API error handling."""
-        # Setup mock chain
-        mock_filter = MagicMock()
-        mock_filter.get.side_effect = Exception("API error")
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.filter.return_value = mock_filter
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.get_by_pmid("12345678")
-            
-            # Assertions
-            assert result is None
+        """Test unexpected error handling."""
+        stub_transport(repository, error=Exception("API error"))
+
+        assert repository.get_by_pmid("12345678") is None
 
 
 class TestSearchByTitleAuthorsYear:
@@ -273,202 +204,75 @@ class TestSearchByTitleAuthorsYear:
 
     def test_search_by_title_authors_year_success(self, repository):
         """Test successful title-authors-year search."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.return_value = [
-            {"id": "W123", "title": "Example Study", "publication_year": 2023}
-        ]
-        
-        mock_filter2 = MagicMock()
-        mock_filter2.sort.return_value = mock_sort
-        
-        mock_filter = MagicMock()
-        mock_filter.filter.return_value = mock_filter2
-        
-        mock_search = MagicMock()
-        mock_search.filter.return_value = mock_filter
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_authors_year(
-                "Example Study", ["Adam Unikon"], 2023
-            )
-            
-            # Assertions
-            assert len(result) == 1
-            assert result[0]["id"] == "W123"
-            assert result[0]["title"] == "Example Study"
-            assert result[0]["publication_year"] == 2023
+        get_json = stub_transport(
+            repository, [{"id": "W123", "title": "Example Study", "publication_year": 2023}]
+        )
+
+        result = repository.search_by_title_authors_year("Example Study", ["Adam Unikon"], 2023)
+
+        url = requested_url(get_json)
+        assert "title.search:example study" in url
+        assert "publication_year:2023" in url
+        assert "sort=relevance_score:desc" in url
+        assert len(result) == 1
+        assert result[0]["id"] == "W123"
+        assert result[0]["title"] == "Example Study"
+        assert result[0]["publication_year"] == 2023
 
     def test_search_by_title_authors_year_with_initials(self, repository):
         """Test author name matching with initials."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.return_value = [
-            {"id": "W123", "title": "Example Study", "publication_year": 2023}
-        ]
-        
-        mock_filter2 = MagicMock()
-        mock_filter2.sort.return_value = mock_sort
-        
-        mock_filter = MagicMock()
-        mock_filter.filter.return_value = mock_filter2
-        
-        mock_search = MagicMock()
-        mock_search.filter.return_value = mock_filter
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method with initials
-            result = repository.search_by_title_authors_year(
-                "Example Study", ["A Unikon"], 2023
-            )
-            
-            # Verify filter contains name variations
-            call_args = mock_search.filter.call_args[1]
-            author_query = call_args["raw_author_name"]
-            name_variations = author_query["search"]
-            
-            # Check if name variations include expected patterns
-            assert "a unikon" in name_variations
-            assert "unikon a" in name_variations
-            
-            # Assertions on result
-            assert len(result) == 1
-            assert result[0]["id"] == "W123"
+        get_json = stub_transport(
+            repository, [{"id": "W123", "title": "Example Study", "publication_year": 2023}]
+        )
+
+        result = repository.search_by_title_authors_year("Example Study", ["A Unikon"], 2023)
+
+        name_variations = requested_url(get_json).split("raw_author_name.search:")[1].split(",")[0]
+        assert "a unikon" in name_variations.split("|")
+        assert "unikon a" in name_variations.split("|")
+        assert len(result) == 1
+        assert result[0]["id"] == "W123"
 
     def test_search_by_title_authors_year_with_reversed_name(self, repository):
         """Test author name matching with reversed order."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.return_value = [
-            {"id": "W123", "title": "Example Study", "publication_year": 2023}
-        ]
-        
-        mock_filter2 = MagicMock()
-        mock_filter2.sort.return_value = mock_sort
-        
-        mock_filter = MagicMock()
-        mock_filter.filter.return_value = mock_filter2
-        
-        mock_search = MagicMock()
-        mock_search.filter.return_value = mock_filter
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method with reversed name
-            result = repository.search_by_title_authors_year(
-                "Example Study", ["Unikon Adam"], 2023
-            )
-            
-            # Verify filter contains name variations
-            call_args = mock_search.filter.call_args[1]
-            author_query = call_args["raw_author_name"]
-            name_variations = author_query["search"]
-            
-            # Check if name variations include expected patterns
-            assert "unikon adam" in name_variations
-            assert "adam unikon" in name_variations
-            
-            # Assertions on result
-            assert len(result) == 1
-            assert result[0]["id"] == "W123"
+        get_json = stub_transport(
+            repository, [{"id": "W123", "title": "Example Study", "publication_year": 2023}]
+        )
+
+        result = repository.search_by_title_authors_year("Example Study", ["Unikon Adam"], 2023)
+
+        name_variations = requested_url(get_json).split("raw_author_name.search:")[1].split(",")[0]
+        assert "unikon adam" in name_variations.split("|")
+        assert "adam unikon" in name_variations.split("|")
+        assert len(result) == 1
+        assert result[0]["id"] == "W123"
 
     def test_search_by_title_authors_year_empty_title(self, repository):
         """Test empty title."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_authors_year(
-                "", ["Adam Unikon"], 2023
-            )
-            
-            # Assertions
-            mock_works.assert_not_called()
-            assert result == []
+        get_json = stub_transport(repository)
+
+        assert repository.search_by_title_authors_year("", ["Adam Unikon"], 2023) == []
+        get_json.assert_not_called()
 
     def test_search_by_title_authors_year_empty_authors(self, repository):
         """Test empty authors list."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_authors_year(
-                "Example Study", [], 2023
-            )
-            
-            # Check correct behavior
-            assert result == []
+        get_json = stub_transport(repository)
+
+        assert repository.search_by_title_authors_year("Example Study", [], 2023) == []
+        get_json.assert_not_called()
 
     def test_search_by_title_authors_year_empty_author_name(self, repository):
         """Test empty author name."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_authors_year(
-                "Example Study", [""], 2023
-            )
-            
-            # Check correct behavior
-            assert result == []
+        get_json = stub_transport(repository)
+
+        assert repository.search_by_title_authors_year("Example Study", [""], 2023) == []
+        get_json.assert_not_called()
 
     def test_search_by_title_authors_year_api_error(self, repository):
-        """Test API error handling."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.side_effect = Exception("API error")
-        
-        mock_filter2 = MagicMock()
-        mock_filter2.sort.return_value = mock_sort
-        
-        mock_filter = MagicMock()
-        mock_filter.filter.return_value = mock_filter2
-        
-        mock_search = MagicMock()
-        mock_search.filter.return_value = mock_filter
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_authors_year(
-                "Example Study", ["Adam Unikon"], 2023
-            )
-            
-            # Assertions
-            assert result == []
+        """Test unexpected error handling."""
+        stub_transport(repository, error=Exception("API error"))
+
+        assert repository.search_by_title_authors_year("Example Study", ["Adam Unikon"], 2023) == []
 
 
 class TestSearchByTitleAuthors:
@@ -476,49 +280,23 @@ class TestSearchByTitleAuthors:
 
     def test_search_by_title_authors_success(self, repository):
         """Test successful title-authors search."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.return_value = [
-            {"id": "W123", "title": "Example Study"}
-        ]
-        
-        mock_filter = MagicMock()
-        mock_filter.sort.return_value = mock_sort
-        
-        mock_search = MagicMock()
-        mock_search.filter.return_value = mock_filter
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_authors(
-                "Example Study", ["Adam Unikon"]
-            )
-            
-            # Assertions
-            assert len(result) == 1
-            assert result[0]["id"] == "W123"
-            assert result[0]["title"] == "Example Study"
+        get_json = stub_transport(repository, [{"id": "W123", "title": "Example Study"}])
+
+        result = repository.search_by_title_authors("Example Study", ["Adam Unikon"])
+
+        url = requested_url(get_json)
+        assert "raw_author_name.search:" in url
+        assert "publication_year:" not in url
+        assert len(result) == 1
+        assert result[0]["id"] == "W123"
+        assert result[0]["title"] == "Example Study"
 
     def test_search_by_title_authors_empty_title(self, repository):
         """Test empty title."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_authors("", ["Adam Unikon"])
-            
-            # Assertions
-            mock_works.assert_not_called()
-            assert result == []
+        get_json = stub_transport(repository)
+
+        assert repository.search_by_title_authors("", ["Adam Unikon"]) == []
+        get_json.assert_not_called()
 
 
 class TestSearchByTitleYear:
@@ -526,112 +304,25 @@ class TestSearchByTitleYear:
 
     def test_search_by_title_year_success(self, repository):
         """Test successful title-year search."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.return_value = [
-            {"id": "W123", "title": "Example Study", "publication_year": 2023}
-        ]
-        
-        mock_filter = MagicMock()
-        mock_filter.sort.return_value = mock_sort
-        
-        mock_search = MagicMock()
-        mock_search.filter.return_value = mock_filter
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_year("Example Study", 2023)
-            
-            # Assertions
-            assert len(result) == 1
-            assert result[0]["id"] == "W123"
-            assert result[0]["title"] == "Example Study"
-            assert result[0]["publication_year"] == 2023
+        get_json = stub_transport(
+            repository, [{"id": "W123", "title": "Example Study", "publication_year": 2023}]
+        )
+
+        result = repository.search_by_title_year("Example Study", 2023)
+
+        url = requested_url(get_json)
+        assert "title.search:example study,publication_year:2023" in url
+        assert len(result) == 1
+        assert result[0]["id"] == "W123"
+        assert result[0]["title"] == "Example Study"
+        assert result[0]["publication_year"] == 2023
 
     def test_search_by_title_year_empty_title(self, repository):
         """Test empty title."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_year("", 2023)
-            
-            # Assertions
-            mock_works.assert_not_called()
-            assert result == []
-
-
-class TestSearchByTitleJournal:
-    """Tests for search_by_title_journal method."""
-
-    def test_search_by_title_journal_success(self, repository):
-        """Test successful title-journal search."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.return_value = [
-            {"id": "W123", "title": "Example Study"}
-        ]
-        
-        mock_filter = MagicMock()
-        mock_filter.sort.return_value = mock_sort
-        
-        mock_search = MagicMock()
-        mock_search.filter.return_value = mock_filter
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_journal(
-                "Example Study", "Journal of Examples"
-            )
-            
-            # Assertions
-            assert len(result) == 1
-            assert result[0]["id"] == "W123"
-            assert result[0]["title"] == "Example Study"
-
-    def test_search_by_title_journal_empty_title(self, repository):
-        """Test empty title."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_journal("", "Journal of Examples")
-            
-            # Assertions
-            mock_works.assert_not_called()
-            assert result == []
-
-    def test_search_by_title_journal_empty_journal(self, repository):
-        """Test empty journal."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title_journal("Example Study", "")
-            
-            # Assertions
-            mock_works.assert_not_called()
-            assert result == []
+        get_json = stub_transport(repository)
+
+        assert repository.search_by_title_year("", 2023) == []
+        get_json.assert_not_called()
 
 
 class TestSearchByTitle:
@@ -639,70 +330,231 @@ class TestSearchByTitle:
 
     def test_search_by_title_success(self, repository):
         """Test successful title-only search."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.return_value = [
-            {"id": "W123", "title": "Example Study"}
-        ]
-        
-        mock_search = MagicMock()
-        mock_search.sort.return_value = mock_sort
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title("Example Study")
-            
-            # Assertions
-            assert len(result) == 1
-            assert result[0]["id"] == "W123"
-            assert result[0]["title"] == "Example Study"
+        get_json = stub_transport(repository, [{"id": "W123", "title": "Example Study"}])
+
+        result = repository.search_by_title("Example Study")
+
+        get_json.assert_called_once()
+        assert len(result) == 1
+        assert result[0]["id"] == "W123"
+        assert result[0]["title"] == "Example Study"
 
     def test_search_by_title_empty_title(self, repository):
         """Test empty title."""
-        # Setup mock
-        mock_works = MagicMock()
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method
-            result = repository.search_by_title("")
-            
-            # Assertions
-            mock_works.assert_not_called()
-            assert result == []
+        get_json = stub_transport(repository)
+
+        assert repository.search_by_title("") == []
+        get_json.assert_not_called()
 
     def test_search_by_title_special_characters(self, repository):
         """Test title with special characters."""
-        # Setup mock chain
-        mock_sort = MagicMock()
-        mock_sort.get.return_value = [
-            {"id": "W123", "title": "Example Study"}
+        get_json = stub_transport(repository, [{"id": "W123", "title": "Example Study"}])
+
+        result = repository.search_by_title("Example Study!")
+
+        # The normalized title is what gets searched
+        assert "filter=title.search:example study&" in requested_url(get_json)
+        assert len(result) == 1
+        assert result[0]["id"] == "W123"
+
+
+class TestRequestRouting:
+    """Tests for how queries are turned into HTTP requests."""
+
+    @pytest.fixture
+    def local_repository(self):
+        return OpenAlexRepository(Config(openalex_url="http://127.0.0.1:8080/api"))
+
+    def test_rebase_url_uses_configured_base(self, local_repository):
+        url = local_repository._rebase_url("https://api.openalex.org/works?filter=doi:10.1%2Fx")
+        assert url == "http://127.0.0.1:8080/api/works?filter=doi:10.1%2Fx"
+
+    def test_get_works_adds_per_page_and_returns_results(self, local_repository):
+        local_repository._transport = MagicMock()
+        local_repository._transport.get_json.return_value = {
+            "meta": {"count": 1},
+            "results": [{"id": "W1"}],
+        }
+
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+        results = local_repository._get_works(query, per_page=5)
+
+        assert results == [{"id": "W1"}]
+        called_url = local_repository._transport.get_json.call_args[0][0]
+        assert called_url == (
+            "http://127.0.0.1:8080/api/works?filter=pmid:123&per-page=5&select=" + ",".join(WORK_FIELDS)
+        )
+
+    def test_get_works_served_from_response_cache(self, tmp_path):
+        repo = OpenAlexRepository(Config(response_cache=True, cache_dir=str(tmp_path)))
+        repo._transport = MagicMock()
+        repo._transport.get_json.return_value = {"results": [{"id": "W1", "title": "T"}]}
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+
+        first = repo._get_works(query, per_page=5)
+        repo.close()
+        second = OpenAlexRepository(Config(response_cache=True, cache_dir=str(tmp_path)))._get_works(
+            query, per_page=5
+        )
+
+        assert first == second == [{"id": "W1", "title": "T"}]
+        repo._transport.get_json.assert_called_once()
+
+    def test_concurrent_identifier_lookups_are_batched(self):
+        metrics = RunMetrics()
+        repo = OpenAlexRepository(Config(identifier_batch_wait=0.5, identifier_batch_size=3), metrics=metrics)
+        repo._transport = MagicMock()
+        repo._transport.get_json.return_value = {
+            "results": [
+                {"id": "W2", "doi": "https://doi.org/10.1/b"},
+                {"id": "W1", "doi": "https://doi.org/10.1/a"},
+            ]
+        }
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            works = list(pool.map(repo.get_by_doi, ["10.1/a", "10.1/B", "10.1/c"]))
+
+        assert [w and w["id"] for w in works] == ["W1", "W2", None]
+        repo._transport.get_json.assert_called_once()
+        url = repo._transport.get_json.call_args[0][0]
+        assert "per-page=3" in url and url.count("%7C") == 2
+        assert metrics.snapshot()["identifiers_batched"] == 3
+
+    def test_close_releases_transport_and_response_cache(self, tmp_path):
+        repo = OpenAlexRepository(Config(response_cache=True, cache_dir=str(tmp_path)))
+        repo._transport = MagicMock()
+        repo.close()
+
+        repo._transport.close.assert_called_once()
+        with pytest.raises(sqlite3.ProgrammingError):
+            repo._response_cache.size()
+
+    def test_get_works_returns_full_works_when_not_slim(self):
+        repo = OpenAlexRepository(Config(slim_works=False))
+        repo._transport = MagicMock()
+        work = {"id": "W1", "concepts": [{"display_name": "Medicine"}]}
+        repo._transport.get_json.return_value = {"results": [work]}
+
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+
+        assert repo._get_works(query, per_page=5) == [work]
+        assert "select=" not in repo._transport.get_json.call_args[0][0]
+
+    def test_circuit_breaker_fails_fast_after_outage(self):
+        repo = OpenAlexRepository(Config(circuit_failure_threshold=2))
+        repo._transport = MagicMock()
+        repo._transport.get_json.side_effect = TransientRepositoryError("HTTP 503", 503)
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+
+        for _ in range(2):
+            with pytest.raises(TransientRepositoryError):
+                repo._get_works(query, per_page=1)
+        with pytest.raises(CircuitOpenError):
+            repo._get_works(query, per_page=1)
+        assert repo._transport.get_json.call_count == 2
+
+    def test_deadline_caps_request_timeout(self, local_repository):
+        local_repository._transport = MagicMock()
+        local_repository._transport.get_json.return_value = {"results": []}
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+
+        with deadline_scope(Deadline(expires_at=2.0, clock=lambda: 0.5)):
+            local_repository._get_works(query, per_page=1)
+
+        assert local_repository._transport.get_json.call_args[0][2] == 1.5
+
+    def test_expired_deadline_skips_request_and_spares_breaker(self):
+        repo = OpenAlexRepository(Config(circuit_failure_threshold=1))
+        repo._transport = MagicMock()
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+
+        with deadline_scope(Deadline(expires_at=1.0, clock=lambda: 5.0)):
+            with pytest.raises(DeadlineExceededError):
+                repo._get_works(query, per_page=1)
+
+        repo._transport.get_json.assert_not_called()
+        assert repo._breaker.state == "closed"
+
+    def test_retries_under_deadline_stay_within_budget(self):
+        repo = OpenAlexRepository(Config(max_retries=5, retry_backoff_factor=0.3))
+
+        def slow_503(url, headers, timeout=None, retry=True):
+            time.sleep(0.3)
+            raise TransientRepositoryError("HTTP 503", 503)
+
+        repo._transport = MagicMock()
+        repo._transport.get_json.side_effect = slow_503
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+
+        start = time.monotonic()
+        with deadline_scope(Deadline.after(0.5)):
+            with pytest.raises(DeadlineExceededError):
+                repo._get_works(query, per_page=1)
+
+        assert time.monotonic() - start < 0.8
+        assert repo._transport.get_json.call_count == 1
+        assert repo._transport.get_json.call_args.kwargs["retry"] is False
+
+    def test_retries_under_deadline_until_success(self, local_repository):
+        local_repository._transport = MagicMock()
+        local_repository._transport.get_json.side_effect = [
+            TransientRepositoryError("HTTP 503", 503, retry_after=0.0),
+            {"results": [{"id": "W1"}]},
         ]
-        
-        mock_search = MagicMock()
-        mock_search.sort.return_value = mock_sort
-        
-        mock_works_instance = MagicMock()
-        mock_works_instance.search_filter.return_value = mock_search
-        
-        mock_works = MagicMock()
-        mock_works.return_value = mock_works_instance
-        
-        # Apply the mock
-        with patch("pyalex.Works", mock_works):
-            # Call method with special characters
-            result = repository.search_by_title("Example Study!")
-            
-            # Check normalized title is used in search
-            mock_works_instance.search_filter.assert_called_once_with(title="example study")
-            
-            # Assertions on result
-            assert len(result) == 1
-            assert result[0]["id"] == "W123"
\ No newline at end of file
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+
+        with deadline_scope(Deadline.after(5.0)):
+            assert local_repository._get_works(query, per_page=1) == [{"id": "W1"}]
+
+        assert local_repository._transport.get_json.call_count == 2
+
+    def test_retry_after_beyond_deadline_fails_fast(self, local_repository):
+        local_repository._transport = MagicMock()
+        local_repository._transport.get_json.side_effect = TransientRepositoryError(
+            "HTTP 429", 429, retry_after=30.0
+        )
+        query = MagicMock()
+        query.url = "https://api.openalex.org/works?filter=pmid:123"
+
+        start = time.monotonic()
+        with deadline_scope(Deadline.after(2.0)):
+            with pytest.raises(DeadlineExceededError):
+                local_repository._get_works(query, per_page=1)
+
+        assert time.monotonic() - start < 1.0
+        assert local_repository._transport.get_json.call_count == 1
+
+    def test_more_pages_requests_numbered_pages_until_short(self, local_repository):
+        full_page = [{"id": f"W{i}"} for i in range(25)]
+        local_repository._get_works = MagicMock(side_effect=[full_page, [{"id": "W99"}]])
+
+        pages = list(local_repository.more_pages("search_by_title", "A long enough title", seen=25, max_pages=5))
+
+        assert pages == [full_page, [{"id": "W99"}]]
+        assert [c.kwargs["page"] for c in local_repository._get_works.call_args_list] == [2, 3]
+
+    def test_more_pages_skipped_after_short_first_page(self, local_repository):
+        local_repository._get_works = MagicMock()
+        assert list(local_repository.more_pages("search_by_title", "A long enough title", seen=7, max_pages=5)) == []
+        local_repository._get_works.assert_not_called()
+
+    def test_auth_headers_follow_config(self):
+        repo = OpenAlexRepository(
+            Config(openalex_email="me@example.com", openalex_api_key="secret", user_agent="mitas/1.0")
+        )
+        headers = repo._auth_headers()
+        assert headers["From"] == "me@example.com"
+        assert headers["Authorization"] == "Bearer secret"
+        assert headers["User-Agent"] == "mitas/1.0"
+
+    def test_default_base_url_is_openalex(self):
+        repo = OpenAlexRepository(Config())
+        assert repo._rebase_url("https://api.openalex.org/works") == "https://api.openalex.org/works"
@@ -0,0 +1,86 @@
+"""Tests for learned per-search page sizes."""
+from unittest.mock import MagicMock
+
+from src.domain.models.config import Config
+from src.infrastructure.repositories.openalex_repository import OpenAlexRepository
+from src.infrastructure.repositories.page_size_tuner import PageSizeTuner
+
+
+def feed(tuner, search, ranks):
+    for rank in ranks:
+        tuner.record(search, rank)
+
+
+def test_default_until_enough_samples():
+    tuner = PageSizeTuner(default=25, min_samples=10)
+    feed(tuner, "search_by_title_authors_year", [0] * 9)
+    assert tuner.per_page("search_by_title_authors_year") == 25
+    tuner.record("search_by_title_authors_year", 0)
+    assert tuner.per_page("search_by_title_authors_year") == 5
+
+
+def test_deep_ranks_get_bigger_pages():
+    tuner = PageSizeTuner(default=25, min_samples=10)
+    feed(tuner, "search_by_title", [3, 8, 12, 20, 24] * 4)
+    assert tuner.per_page("search_by_title") == 50
+    assert tuner.per_page("search_by_title_year") == 25
+
+
+def test_full_page_misses_grow_a_shrunken_page():
+    tuner = PageSizeTuner(default=25, min_samples=10)
+    feed(tuner, "search_by_title", [0] * 10)
+    assert tuner.per_page("search_by_title") == 5
+    # Matches now fall past the 5-result page and show up as misses only
+    for _ in range(2):
+        tuner.record_miss("search_by_title", 5)
+    assert tuner.per_page("search_by_title") == 25
+
+
+def test_short_page_misses_are_ignored():
+    tuner = PageSizeTuner(default=25, min_samples=3)
+    for _ in range(3):
+        tuner.record_miss("search_by_title", 4)
+    tuner.record_miss("search_by_title", 0)
+    assert tuner.per_page("search_by_title") == 25
+    assert "search_by_title" not in tuner._ranks
+
+
+def test_ranks_persist_between_runs(tmp_path):
+    path = tmp_path / "page_sizes.json"
+    tuner = PageSizeTuner(min_samples=5, path=path)
+    feed(tuner, "search_by_title_authors", [0, 1, 0, 2, 1])
+    assert path.exists()
+
+    reloaded = PageSizeTuner(min_samples=5, path=path)
+    assert reloaded.per_page("search_by_title_authors") == 10
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    path = tmp_path / "page_sizes.json"
+    path.write_text("not json")
+    assert PageSizeTuner(path=path).per_page("search_by_title") == 25
+
+
+def test_repository_uses_learned_page_size():
+    repository = OpenAlexRepository(Config(query_cache_size=0))
+    repository._page_sizes = PageSizeTuner(min_samples=3)
+    repository._get_works = MagicMock(return_value=[])
+    for _ in range(3):
+        repository.record_match_rank("search_by_title_year", 0)
+
+    repository.search_by_title_year("A long enough title", 2001)
+    repository.search_by_title("A long enough title")
+
+    per_pages = [c.kwargs["per_page"] for c in repository._get_works.call_args_list]
+    assert per_pages == [5, 25]
+
+
+def test_off_by_default():
+    assert OpenAlexRepository(Config())._page_sizes is None
+
+
+def test_repository_records_misses():
+    repository = OpenAlexRepository(Config(adaptive_page_size=True, query_cache_size=0))
+    repository._page_sizes = PageSizeTuner(default=25, min_samples=1)
+    repository.record_match_miss("search_by_title", 25)
+    assert repository.page_size("search_by_title") == 50
@@ -0,0 +1,101 @@
+"""Tests for the subsumption-aware query cache."""
+from unittest.mock import MagicMock
+
+from src.domain.models.config import Config
+from src.infrastructure.repositories.openalex_repository import OpenAlexRepository
+from src.infrastructure.repositories.query_cache import QueryCache
+
+TITLE = "penicillin therapy in acute tonsillitis"
+
+
+def work(work_id, year, *authors):
+    return {
+        "id": f"https://openalex.org/{work_id}",
+        "publication_year": year,
+        "authorships": [{"raw_author_name": a, "author": {"display_name": a}} for a in authors],
+    }
+
+
+BROAD = [
+    work("W1", 1951, "Bennike T"),
+    work("W2", 1951, "Smith John"),
+    work("W3", 1962, "Bennike T"),
+]
+
+
+class TestQueryCache:
+    def test_exact_hit_returns_copies(self):
+        cache = QueryCache()
+        cache.put(TITLE, 1951, None, BROAD[:2], complete=False)
+        results = cache.get(TITLE, 1951)
+        results[0]["_debug"] = {}
+        assert "_debug" not in cache.get(TITLE, 1951)[0]
+        assert cache.hits == 2
+
+    def test_complete_title_search_answers_year_query(self):
+        cache = QueryCache()
+        cache.put(TITLE, None, None, BROAD, complete=True)
+        results = cache.get(TITLE, 1951)
+        assert [w["id"][-2:] for w in results] == ["W1", "W2"]
+        assert cache.subsumed_hits == 1
+
+    def test_complete_title_search_answers_author_year_query(self):
+        cache = QueryCache()
+        cache.put(TITLE, None, None, BROAD, complete=True)
+        results = cache.get(TITLE, 1951, "bennike t|t bennike")
+        assert [w["id"][-2:] for w in results] == ["W1"]
+
+    def test_initials_match_full_names(self):
+        cache = QueryCache()
+        cache.put(TITLE, 1951, None, BROAD, complete=True)
+        assert [w["id"][-2:] for w in cache.get(TITLE, 1951, "j smith")] == ["W2"]
+
+    def test_truncated_result_set_is_not_used(self):
+        cache = QueryCache()
+        cache.put(TITLE, None, None, BROAD, complete=False)
+        assert cache.get(TITLE, 1951) is None
+
+    def test_truncated_page_misses_for_a_bigger_page_size(self):
+        cache = QueryCache()
+        cache.put(TITLE, 1951, None, BROAD[:2], complete=False)
+        assert cache.get(TITLE, 1951, per_page=5) is None
+        assert len(cache.get(TITLE, 1951, per_page=2)) == 2
+        assert len(cache.get(TITLE, 1951, per_page=1)) == 1
+
+    def test_complete_page_serves_any_page_size(self):
+        cache = QueryCache()
+        cache.put(TITLE, None, None, BROAD, complete=True)
+        assert len(cache.get(TITLE, per_page=50)) == 3
+
+    def test_missing_authorships_fall_through(self):
+        cache = QueryCache()
+        cache.put(TITLE, None, None, [{"id": "W9", "publication_year": 1951}], complete=True)
+        assert cache.get(TITLE, None, "smith j") is None
+        assert cache.get(TITLE, 1951) == [{"id": "W9", "publication_year": 1951}]
+
+    def test_other_titles_do_not_match(self):
+        cache = QueryCache()
+        cache.put(TITLE, None, None, BROAD, complete=True)
+        assert cache.get("another title entirely", 1951) is None
+
+
+def test_repository_answers_narrower_query_from_cache():
+    repository = OpenAlexRepository(Config())
+    repository._get_works = MagicMock(return_value=BROAD)
+
+    repository.search_by_title("Penicillin therapy in acute tonsillitis")
+    results = repository.search_by_title_year("Penicillin therapy in acute tonsillitis", 1962)
+
+    assert [w["id"][-2:] for w in results] == ["W3"]
+    assert repository._get_works.call_count == 1
+
+
+def test_repository_refetches_after_page_size_grows():
+    repository = OpenAlexRepository(Config())
+    repository._get_works = MagicMock(side_effect=[BROAD[:2], BROAD])
+
+    repository.search_by_title("Penicillin therapy in acute tonsillitis", per_page=2)
+    results = repository.search_by_title("Penicillin therapy in acute tonsillitis", per_page=5)
+
+    assert len(results) == 3
+    assert repository._get_works.call_count == 2
@@ -0,0 +1,105 @@
+"""Tests for the compressed on-disk response cache."""
+import sqlite3
+
+import pytest
+
+from src.infrastructure.repositories import response_cache
+from src.infrastructure.repositories.response_cache import ResponseCache
+
+WORKS = [{"id": "https://openalex.org/W1", "title": "A randomised trial of penicillin", "publication_year": 2001}]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "cache" / "responses.sqlite"
+
+
+def test_round_trip(path):
+    cache = ResponseCache(path)
+    assert cache.get("https://api.openalex.org/works?filter=doi:10.1/x") is None
+    cache.put("https://api.openalex.org/works?filter=doi:10.1/x", WORKS)
+    assert cache.get("https://api.openalex.org/works?filter=doi:10.1/x") == WORKS
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_are_compressed_and_persist(path):
+    cache = ResponseCache(path)
+    cache.put("u", WORKS * 50)
+    entries, stored = cache.size()
+    cache.close()
+
+    assert entries == 1
+    assert stored < len(repr(WORKS * 50)) / 10
+    assert ResponseCache(path).get("u") == WORKS * 50
+
+
+def test_expired_entries_are_misses(path):
+    now = [1000.0]
+    cache = ResponseCache(path, ttl=60, clock=lambda: now[0])
+    cache.put("u", WORKS)
+    now[0] += 61
+    assert cache.get("u") is None
+
+
+def test_empty_results_expire_after_empty_ttl(path):
+    now = [1000.0]
+    cache = ResponseCache(path, empty_ttl=60, clock=lambda: now[0])
+    cache.put("empty", [])
+    cache.put("u", WORKS)
+    assert cache.get("empty") == []
+    now[0] += 61
+    assert cache.get("empty") is None
+    assert cache.get("u") == WORKS
+
+
+def test_puts_are_committed_in_batches(path):
+    now = [1000.0]
+    cache = ResponseCache(path, commit_every=3, commit_interval=60, clock=lambda: now[0])
+
+    def committed():
+        with sqlite3.connect(path) as db:
+            return db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    cache.put("u1", WORKS)
+    cache.put("u2", WORKS)
+    assert cache.get("u2") == WORKS
+    assert committed() == 0
+    cache.put("u3", WORKS)
+    assert committed() == 3
+    cache.put("u4", WORKS)
+    now[0] += 61
+    cache.put("u5", WORKS)
+    assert committed() == 5
+    cache.put("u6", WORKS)
+    cache.close()
+    assert committed() == 6
+
+
+def test_unreadable_codec_is_a_miss(path):
+    cache = ResponseCache(path)
+    cache.close()
+    with sqlite3.connect(path) as db:
+        db.execute("INSERT INTO responses VALUES ('u', 'zstd-dict:99', x'00', 0)")
+    assert ResponseCache(path).get("u") is None
+
+
+def test_zlib_without_zstandard(path, monkeypatch):
+    monkeypatch.setattr(response_cache, "zstandard", None)
+    cache = ResponseCache(path)
+    cache.put("u", WORKS)
+    assert cache.codec == "zlib"
+    assert cache.get("u") == WORKS
+
+
+def test_trains_zstd_dictionary(path):
+    pytest.importorskip("zstandard")
+    cache = ResponseCache(path, train_after=200)
+    for i in range(200):
+        cache.put(f"u{i}", [dict(WORKS[0], id=f"https://openalex.org/W{i}", cited_by_count=i)])
+    assert cache.codec.startswith("zstd-dict:")
+    cache.put("after", WORKS)
+    cache.close()
+
+    reopened = ResponseCache(path)
+    assert reopened.get("after") == WORKS
+    assert reopened.get("u7")[0]["cited_by_count"] == 7
@@ -0,0 +1,81 @@
+"""Tests for the SQLite result store."""
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.enums.search_status import SearchStatus
+from src.domain.enums.study_type import StudyType
+from src.domain.models.search_result import SearchResult
+from src.infrastructure.repositories.result_store import ResultStore
+
+
+def make_result(study_id, status=SearchStatus.FOUND, **fields):
+    return SearchResult(
+        study_id=study_id,
+        study_type=StudyType.INCLUDED,
+        status=status,
+        search_attempts=[{"strategy": "title_only", "query_type": "title", "search_term": "t"}],
+        original_reference={"title": "A randomised trial of penicillin", "year": 2001},
+        reference_hash="abc",
+        matched_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        **fields,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(tmp_path / "results.sqlite", batch_size=2) as store:
+        yield store
+
+
+def test_round_trip(store):
+    found = make_result(
+        "STD-1", strategy="title_only", openalex_id="W1", title="T", year=2001, open_access=True,
+        search_details={"title_similarity": 0.97},
+    )
+    store.write("review-1", found)
+    assert store.results(review_id="review-1") == [found]
+
+
+def test_writes_are_batched(store, tmp_path):
+    store.write("review-1", make_result("STD-1"))
+    with sqlite3.connect(tmp_path / "results.sqlite") as db:
+        assert db.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 0
+    store.write("review-1", make_result("STD-2"))
+    with sqlite3.connect(tmp_path / "results.sqlite") as db:
+        assert db.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 2
+
+
+def test_queries_by_status_and_strategy_across_reviews(store):
+    store.write("review-1", make_result("STD-1", SearchStatus.REJECTED))
+    store.write("review-2", make_result("STD-1", SearchStatus.REJECTED))
+    store.write("review-2", make_result("STD-2", strategy="doi", openalex_id="W2"))
+
+    rejected = store.results(status=SearchStatus.REJECTED)
+    assert [r.study_id for r in rejected] == ["STD-1", "STD-1"]
+    assert [r.openalex_id for r in store.results(strategy="doi")] == ["W2"]
+    assert store.counts() == {"found": 1, "rejected": 2}
+    assert store.counts("review-1") == {"rejected": 1}
+
+
+def test_rewrite_replaces_result_and_attempts(store):
+    store.write("review-1", make_result("STD-1", SearchStatus.NOT_FOUND))
+    store.flush()
+    rewritten = make_result("STD-1", strategy="title_only", openalex_id="W9")
+    rewritten.search_attempts.append({"strategy": "title_year", "error": "No results found"})
+    store.write("review-1", rewritten)
+
+    assert store.results(review_id="review-1") == [rewritten]
+
+
+def test_unknown_filter(store):
+    with pytest.raises(ValueError):
+        store.results(title="T")
+
+
+def test_status_query_uses_index(store):
+    plan = store._db.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM results r WHERE r.status = ?", ("rejected",)
+    ).fetchall()
+    assert "idx_results_status" in " ".join(str(row) for row in plan)
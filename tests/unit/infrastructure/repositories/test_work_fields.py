@@ -0,0 +1,61 @@
+"""Tests for pruning OpenAlex works to the fields the matcher reads."""
+from src.infrastructure.repositories.work_fields import slim_work
+
+FULL_WORK = {
+    "id": "https://openalex.org/W1",
+    "doi": "https://doi.org/10.1/x",
+    "title": "A randomised trial of penicillin",
+    "publication_year": 2001,
+    "publication_date": "2001-05-01",
+    "type": "article",
+    "cited_by_count": 12,
+    "abstract_inverted_index": {"penicillin": [0]},
+    "concepts": [{"display_name": "Medicine", "score": 0.9}],
+    "authorships": [
+        {
+            "raw_author_name": "J. Smith",
+            "author": {"id": "A1", "display_name": "John Smith", "orcid": None},
+            "institutions": [{"display_name": "Somewhere"}],
+        }
+    ],
+    "primary_location": {
+        "landing_page_url": "https://example.org/a.pdf",
+        "is_oa": True,
+        "source": {"id": "S1", "display_name": "The Lancet", "issn_l": "0140-6736"},
+    },
+    "open_access": {"is_oa": True, "oa_status": "gold", "oa_url": "https://example.org/a"},
+}
+
+
+def test_keeps_only_matcher_fields():
+    assert slim_work(FULL_WORK) == {
+        "id": "https://openalex.org/W1",
+        "doi": "https://doi.org/10.1/x",
+        "title": "A randomised trial of penicillin",
+        "publication_year": 2001,
+        "publication_date": "2001-05-01",
+        "type": "article",
+        "cited_by_count": 12,
+        "authorships": [{"raw_author_name": "J. Smith", "author": {"display_name": "John Smith"}}],
+        "primary_location": {
+            "landing_page_url": "https://example.org/a.pdf",
+            "source": {"display_name": "The Lancet"},
+        },
+        "open_access": {"is_oa": True, "oa_url": "https://example.org/a"},
+    }
+
+
+def test_missing_and_null_fields_stay_as_they_were():
+    work = {"id": "W2", "title": None, "primary_location": {"source": None}, "open_access": None}
+    assert slim_work(work) == {"id": "W2", "title": None, "primary_location": {"source": None}, "open_access": None}
+
+
+def test_does_not_modify_the_input():
+    work = {"id": "W3", "authorships": [{"author": {"display_name": "Ann Lee", "id": "A3"}}]}
+    slim_work(work)
+    assert work["authorships"][0]["author"]["id"] == "A3"
+
+
+def test_keeps_only_the_pmid_of_ids():
+    work = {"id": "W4", "ids": {"openalex": "W4", "pmid": "https://pubmed.ncbi.nlm.nih.gov/123", "mag": 9}}
+    assert slim_work(work) == {"id": "W4", "ids": {"pmid": "https://pubmed.ncbi.nlm.nih.gov/123"}}
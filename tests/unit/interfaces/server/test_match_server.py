@@ -0,0 +1,167 @@
+"""Tests for the HTTP matching server."""
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.application.services.matching_service import MatchingService
+from src.domain.enums.search_status import SearchStatus
+from src.domain.enums.study_type import StudyType
+from src.domain.models.config import Config
+from src.interfaces.server.match_server import create_app, parse_batch
+
+TITLE = "A randomised trial of penicillin"
+
+
+def title_only(reference):
+    if reference.title == TITLE:
+        return [{"id": "https://openalex.org/W1", "title": TITLE}], {"query_type": "title"}
+    return [], {"error": "No results found"}
+
+
+@pytest.fixture
+def service():
+    service = MatchingService(Config())
+    strategy = MagicMock()
+    strategy.name = "title_only"
+    strategy.supported.return_value = True
+    strategy.execute.side_effect = title_only
+    service.strategies = [strategy]
+    return service
+
+
+@pytest.fixture
+async def client(service):
+    async with TestClient(TestServer(create_app(service=service))) as client:
+        yield client
+
+
+async def post_lines(client, body):
+    response = await client.post("/match", data=orjson.dumps(body))
+    assert response.status == 200
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    return [orjson.loads(line) for line in (await response.read()).splitlines()]
+
+
+class TestParseBatch:
+    def test_list_of_references(self):
+        studies, review_id = parse_batch([{"title": TITLE, "year": 2001}, {"study_id": "S-9", "doi": "10.1/x"}])
+        assert [s.id for s in studies] == ["0", "S-9"]
+        assert studies[0].reference.year == 2001
+        assert studies[1].reference.doi == "10.1/x"
+        assert review_id is None
+
+    def test_object_body(self):
+        studies, review_id = parse_batch(
+            {"review_id": "CD001", "study_type": "excluded", "references": [{"title": TITLE}]}
+        )
+        assert review_id == "CD001"
+        assert studies[0].type == StudyType.EXCLUDED
+
+    @pytest.mark.parametrize("body", [{"title": TITLE}, [1], {"references": [], "study_type": "other"}])
+    def test_rejects_other_shapes(self, body):
+        with pytest.raises(ValueError):
+            parse_batch(body)
+
+
+async def test_match_streams_ndjson_results(client):
+    lines = await post_lines(
+        client,
+        [{"study_id": "STD-1", "title": TITLE, "year": 2001}, {"study_id": "STD-2", "title": "Unknown study", "year": 2001}],
+    )
+
+    by_id = {line["study_id"]: line for line in lines}
+    assert by_id["STD-1"]["status"] == SearchStatus.FOUND.value
+    assert by_id["STD-1"]["openalex_id"] == "W1"
+    assert by_id["STD-2"]["status"] == SearchStatus.NOT_FOUND.value
+
+
+async def test_service_is_shared_across_requests(client, service):
+    await post_lines(client, [{"title": TITLE, "year": 2001}])
+    await post_lines(client, [{"title": TITLE, "year": 2001}])
+    assert service.strategies[0].execute.call_count == 2
+
+    response = await client.get("/health")
+    assert await response.json() == {"status": "ok", "pending_batches": 0}
+
+
+async def test_batches_run_concurrently(client, service):
+    # Each batch blocks until the other one is running too
+    both_running = threading.Barrier(2, timeout=5)
+
+    def meet(reference):
+        both_running.wait()
+        return title_only(reference)
+
+    service.strategies[0].execute.side_effect = meet
+    first, second = await asyncio.gather(
+        post_lines(client, [{"study_id": "A", "title": TITLE, "year": 2001}]),
+        post_lines(client, [{"study_id": "B", "title": TITLE, "year": 2001}]),
+    )
+
+    assert first[0]["status"] == second[0]["status"] == SearchStatus.FOUND.value
+
+
+async def pending_batches(client):
+    return (await (await client.get("/health")).json())["pending_batches"]
+
+
+async def test_disconnected_batch_keeps_its_slot_until_done(service):
+    release = threading.Event()
+
+    def execute(reference):
+        if reference.year == 2002:
+            release.wait(5)
+        return title_only(reference)
+
+    service.strategies[0].execute.side_effect = execute
+    server = TestServer(create_app(service=service), handler_cancellation=True)
+    async with TestClient(server) as client:
+        body = [{"study_id": "A", "title": TITLE, "year": 2001}, {"study_id": "B", "title": TITLE, "year": 2002}]
+        response = await client.post("/match", data=orjson.dumps(body))
+        assert orjson.loads(await response.content.readline())["study_id"] == "A"
+        response.close()
+        await asyncio.sleep(0.2)
+
+        # The executor is still running the batch, so it still holds its slot
+        assert await pending_batches(client) == 1
+        release.set()
+        for _ in range(50):
+            if await pending_batches(client) == 0:
+                break
+            await asyncio.sleep(0.05)
+        assert await pending_batches(client) == 0
+    assert service.strategies[0].execute.call_count == 2
+
+
+async def test_invalid_body_is_a_bad_request(client):
+    response = await client.post("/match", data=b"not json")
+    assert response.status == 400
+    response = await client.post("/match", data=orjson.dumps({"title": TITLE}))
+    assert response.status == 400
+    assert "references" in (await response.json())["error"]
+
+
+async def test_run_failure_is_reported_in_band(client, service, monkeypatch):
+    monkeypatch.setattr(service, "match_studies", MagicMock(side_effect=RuntimeError("boom")))
+    assert await post_lines(client, [{"title": TITLE}]) == [{"error": "boom"}]
+
+
+async def test_stored_results_are_reused(tmp_path):
+    service = MatchingService(Config(results_db=str(tmp_path / "results.sqlite")))
+    strategy = MagicMock()
+    strategy.name = "title_only"
+    strategy.supported.return_value = True
+    strategy.execute.side_effect = title_only
+    service.strategies = [strategy]
+    body = {"review_id": "CD001", "references": [{"study_id": "STD-1", "title": TITLE, "year": 2001}]}
+
+    async with TestClient(TestServer(create_app(service=service))) as client:
+        first = await post_lines(client, body)
+        second = await post_lines(client, body)
+
+    assert first == second
+    assert strategy.execute.call_count == 1
@@ -0,0 +1,50 @@
+"""Tests for study and run deadlines."""
+import pytest
+
+from src.domain.exceptions import DeadlineExceededError
+from src.utils.deadline import Deadline, current_deadline, deadline_scope
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_zero_budget_means_no_deadline():
+    assert Deadline.after(0) is None
+    assert Deadline.after(None) is None
+
+
+def test_remaining_and_expiry(clock):
+    deadline = Deadline.after(10, clock)
+    clock.now = 4.0
+    assert deadline.remaining() == 6.0
+    assert not deadline.expired
+    clock.now = 12.0
+    assert deadline.remaining() == 0.0
+    assert deadline.expired
+    with pytest.raises(DeadlineExceededError):
+        deadline.check("search")
+
+
+def test_scope_uses_earliest_deadline(clock):
+    run = Deadline.after(100, clock)
+    study = Deadline.after(5, clock)
+    assert current_deadline() is None
+    with deadline_scope(run):
+        with deadline_scope(study, None) as active:
+            assert active is study
+            assert current_deadline() is study
+        # An inner scope cannot extend the enclosing budget
+        with deadline_scope(Deadline.after(500, clock)) as active:
+            assert active is run
+        assert current_deadline() is run
+    assert current_deadline() is None
@@ -0,0 +1,112 @@
+"""Tests for run metrics."""
+import threading
+
+from src.utils.metrics import RunMetrics, percentile
+
+
+def test_percentile():
+    assert percentile([], 0.95) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert percentile([float(i) for i in range(100)], 0.95) == 95.0
+
+
+def test_snapshot_counts_statuses():
+    metrics = RunMetrics()
+    metrics.record_request(429, None)
+    metrics.record_request(503, None)
+    metrics.record_request(0, 1.0)
+    metrics.record_request(200, 0.2)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"] == 4
+    assert snapshot["throttled"] == 1
+    assert snapshot["server_errors"] == 1
+    assert snapshot["connection_errors"] == 1
+    # Retried attempts carry no latency
+    assert snapshot["latency_p50"] == 1.0
+
+
+def test_listeners_receive_requests():
+    metrics = RunMetrics()
+    seen = []
+    metrics.subscribe(lambda status, latency: seen.append((status, latency)))
+    metrics.record_request(200, 0.1)
+    assert seen == [(200, 0.1)]
+
+
+def test_unsubscribe():
+    metrics = RunMetrics()
+    seen = []
+    listener = lambda status, latency: seen.append(status)
+    metrics.subscribe(listener)
+    metrics.unsubscribe(listener)
+    metrics.record_request(200, 0.1)
+    assert seen == []
+
+
+def test_scoped_listeners_only_see_their_own_runs():
+    metrics = RunMetrics()
+    seen = {"a": [], "b": []}
+    both_listening = threading.Barrier(2)
+
+    def run(name, status):
+        with metrics.listening(lambda s, latency: seen[name].append(s)):
+            both_listening.wait()
+            metrics.record_request(status, 0.1)
+
+    threads = [threading.Thread(target=run, args=("a", 200)), threading.Thread(target=run, args=("b", 429))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics.record_request(503, None)
+
+    assert seen == {"a": [200], "b": [429]}
+    assert metrics.snapshot()["requests"] == 3
+
+
+def test_time_to_first_result():
+    metrics = RunMetrics()
+    assert metrics.snapshot()["time_to_first_result"] is None
+    metrics.record_study("found")
+    assert metrics.snapshot()["time_to_first_result"] >= 0.0
+
+
+def test_timing_restarts_with_each_run():
+    metrics = RunMetrics()
+    metrics.begin_run()
+    metrics.record_study("found")
+    metrics.end_run()
+    first_run_started = metrics.started_at
+
+    metrics.begin_run()
+    assert metrics.started_at > first_run_started
+    assert metrics.snapshot()["time_to_first_result"] is None
+    assert metrics.snapshot()["studies_per_sec"] == 0.0
+    metrics.record_study("found")
+    metrics.end_run()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["studies_completed"] == 2
+    assert snapshot["studies_per_sec"] > 0.0
+    assert snapshot["studies_per_sec"] == metrics.snapshot()["studies_per_sec"]
+
+
+def test_overlapping_runs_share_one_window():
+    metrics = RunMetrics()
+    metrics.begin_run()
+    started_at = metrics.started_at
+    metrics.begin_run()
+    metrics.end_run()
+    assert metrics.started_at == started_at
+    metrics.record_study("found")
+    metrics.end_run()
+    assert metrics.snapshot()["time_to_first_result"] is not None
+
+
+def test_identifier_batches():
+    metrics = RunMetrics()
+    metrics.record_identifier_batch(3)
+    metrics.record_identifier_batch(1)
+    snapshot = metrics.snapshot()
+    assert (snapshot["identifier_batches"], snapshot["identifiers_batched"]) == (2, 4)
@@ -0,0 +1,108 @@
+"""Tests for the run profiler."""
+import json
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.models.config import Config
+from src.utils.profiler import RunProfiler, categorize_path
+from src.utils.text_normalizer import TextNormalizer
+
+
+class TestCategorizePath:
+    """Tests for mapping source files to matcher components."""
+
+    def test_known_components(self):
+        assert categorize_path("/app/src/domain/strategies/title_only_strategy.py") == "strategy"
+        assert categorize_path("/app/src/infrastructure/repositories/openalex_repository.py") == "repository"
+        assert categorize_path("/app/src/utils/text_normalizer.py") == "normalization"
+        assert categorize_path("/site-packages/loguru/_logger.py") == "logging"
+        assert categorize_path("/site-packages/urllib3/connectionpool.py") == "repository"
+
+    def test_unknown_component(self):
+        assert categorize_path("/app/src/domain/models/reference.py") is None
+        assert categorize_path(None) is None
+
+
+class TestRunProfiler:
+    """Tests for the RunProfiler context manager."""
+
+    def test_disabled_by_default(self, tmp_path):
+        config = Config(profile_output_dir=str(tmp_path))
+        profiler = RunProfiler(config)
+
+        with profiler.profile("run", scope="run"):
+            pass
+
+        assert not profiler.enabled
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cprofile_writes_artifacts(self, tmp_path):
+        config = Config(profile_mode="cprofile", profile_output_dir=str(tmp_path))
+        profiler = RunProfiler(config)
+
+        with profiler.profile("run", scope="run"):
+            for _ in range(50):
+                TextNormalizer.normalize_text("Penicillin therapy in Acute Tonsillitis!")
+
+        assert (profiler.run_dir / "run.pstats").exists()
+        summary = json.loads((profiler.run_dir / "run.summary.json").read_text())
+        assert summary["mode"] == "cprofile"
+        assert summary["wall_time"] >= 0
+        assert summary["attribution"]["normalization"] > 0
+
+    def test_scope_mismatch_is_not_profiled(self, tmp_path):
+        config = Config(
+            profile_mode="cprofile", profile_scope="study", profile_output_dir=str(tmp_path)
+        )
+        profiler = RunProfiler(config)
+
+        with profiler.profile("run", scope="run"):
+            pass
+
+        assert not profiler.run_dir.exists()
+
+    def test_study_label_is_sanitized(self, tmp_path):
+        config = Config(
+            profile_mode="cprofile", profile_scope="study", profile_output_dir=str(tmp_path)
+        )
+        profiler = RunProfiler(config)
+
+        with profiler.profile("study-STD-Bennike 1951/a", scope="study"):
+            pass
+
+        assert (profiler.run_dir / "study-STD-Bennike_1951_a.pstats").exists()
+
+    def test_concurrent_studies_are_profiled_one_at_a_time(self, tmp_path):
+        config = Config(
+            profile_mode="cprofile", profile_scope="study", profile_output_dir=str(tmp_path),
+            concurrency_mode="threads",
+        )
+        profiler = RunProfiler(config)
+        inside = threading.Barrier(2, timeout=5)
+
+        def study(label):
+            with profiler.profile(label, scope="study"):
+                inside.wait()
+
+        threads = [threading.Thread(target=study, args=(f"study-{i}",)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(list(profiler.run_dir.glob("*.pstats"))) == 1
+
+    def test_profile_mode_from_env(self):
+        env_vars = {"PROFILE_MODE": "CProfile", "PROFILE_SCOPE": "study"}
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = Config.from_env()
+
+        assert config.profile_mode == "cprofile"
+        assert config.profile_scope == "study"
+
+    def test_invalid_profile_mode(self):
+        with pytest.raises(ValueError):
+            Config(profile_mode="perf")
@@ -338,4 +338,25 @@ class TestReportFormatter:
             formatter.render()
             
             # Assert
-            mock_generate.assert_called_once()
\ No newline at end of file
+            mock_generate.assert_called_once()
+    
+    def test_generate_metrics_panel(self, config):
+        """Test generation of the run metrics panel."""
+        formatter = ReportFormatter(config)
+        formatter.add_metrics({
+            "requests": 120, "throttled": 4, "server_errors": 1, "connection_errors": 0,
+            "latency_p50": 0.08, "latency_p95": 0.35, "studies_per_sec": 12.5,
+            "concurrency": 12, "peak_concurrency": 18,
+            "circuit_state": "open", "circuit_opens": 2,
+        })
+
+        with patch.object(formatter, 'console') as mock_console:
+            formatter.generate_metrics_panel()
+
+            args, _ = mock_console.print.call_args
+            panel_text = args[0].renderable
+            assert "API Requests: 120" in panel_text
+            assert "Throttled (429): 4" in panel_text
+            assert "Latency p50 / p95: 80ms / 350ms" in panel_text
+            assert "Effective Concurrency: 12 (peak 18)" in panel_text
+            assert "Circuit Breaker: open (opened 2x)" in panel_text